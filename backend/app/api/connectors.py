@@ -0,0 +1,47 @@
+"""
+Connector API Endpoints
+REST API for data connector monitoring
+"""
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from app.db.postgres_client import get_db
+from app.models.ontology import DataConnector
+from app.schemas.connector import ConnectorStatsResponse
+
+
+router = APIRouter(prefix="/connectors", tags=["Connectors"])
+
+
+def get_connector(connector_id: int, db: Session = Depends(get_db)) -> DataConnector:
+    """Dependency to load a DataConnector or fail with 404"""
+    connector = db.query(DataConnector).filter(DataConnector.id == connector_id).first()
+    if not connector:
+        raise HTTPException(status_code=404, detail=f"Connector {connector_id} not found")
+    return connector
+
+
+# ========== Sync Statistics ==========
+
+@router.get("/{connector_id}/stats", response_model=ConnectorStatsResponse)
+async def get_connector_stats(
+    runs: int = Query(50, ge=0, le=1000, description="Number of recent runs to return"),
+    connector: DataConnector = Depends(get_connector)
+):
+    """
+    Sync statistics of a connector
+    
+    - **last**: Per-stage latency histograms, rows/s and bytes/s, queue depths,
+      retry counts, peak memory and batch sizes of the latest sync
+    - **runs**: Summaries of recent runs for tracking throughput across syncs
+    """
+    stats = connector.sync_stats or {}
+    history = stats.get("runs") or []
+    return ConnectorStatsResponse(
+        connector_id=connector.id,
+        name=connector.name,
+        sync_status=connector.sync_status,
+        last_sync_at=connector.last_sync_at,
+        last=stats.get("last"),
+        runs=history[-runs:] if runs else []
+    )
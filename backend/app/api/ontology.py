@@ -2,8 +2,12 @@
 Ontology API Endpoints
 REST API for ontology management
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from contextlib import aclosing
+import json
+
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.db.postgres_client import get_db
@@ -11,23 +15,40 @@ from app.services.ontology.ontology_service import OntologyService
 from app.schemas.ontology import (
     EntityTypeCreate, EntityTypeUpdate, EntityTypeResponse,
     RelationshipTypeCreate, RelationshipTypeUpdate, RelationshipTypeResponse,
-    EntityCreate, EntityResponse,
+    EntityCreate, EntityResponse, EntityPage,
+    EntitySearchRequest, EntitySearchResponse,
     RelationshipCreate, RelationshipResponse
 )
 
 
 router = APIRouter(prefix="/ontology", tags=["Ontology"])
 
+# Type definition endpoints work on the synchronous PostgreSQL session and
+# are plain functions, which FastAPI runs in its threadpool. Instance
+# endpoints await the async Neo4j driver on the event loop.
+
 
 def get_ontology_service(db: Session = Depends(get_db)) -> OntologyService:
     """Dependency to get OntologyService instance"""
     return OntologyService(db)
 
 
+def parse_filter_param(
+    filter_: Optional[str] = Query(None, alias="filter", description="JSON filter expression")
+) -> Optional[Dict[str, Any]]:
+    """Dependency decoding the JSON filter query parameter"""
+    if not filter_:
+        return None
+    try:
+        return json.loads(filter_)
+    except json.JSONDecodeError as e:
+        raise HTTPException(status_code=400, detail=f"Filter is not valid JSON: {e}")
+
+
 # ========== Entity Type Endpoints ==========
 
 @router.post("/entity-types", response_model=EntityTypeResponse, status_code=201)
-async def create_entity_type(
+def create_entity_type(
     entity_type: EntityTypeCreate,
     service: OntologyService = Depends(get_ontology_service)
 ):
@@ -43,7 +64,7 @@ async def create_entity_type(
 
 
 @router.get("/entity-types", response_model=List[EntityTypeResponse])
-async def list_entity_types(
+def list_entity_types(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     service: OntologyService = Depends(get_ontology_service)
@@ -57,7 +78,7 @@ async def list_entity_types(
 
 
 @router.get("/entity-types/{entity_type_id}", response_model=EntityTypeResponse)
-async def get_entity_type(
+def get_entity_type(
     entity_type_id: int,
     service: OntologyService = Depends(get_ontology_service)
 ):
@@ -66,7 +87,7 @@ async def get_entity_type(
 
 
 @router.put("/entity-types/{entity_type_id}", response_model=EntityTypeResponse)
-async def update_entity_type(
+def update_entity_type(
     entity_type_id: int,
     entity_type: EntityTypeUpdate,
     service: OntologyService = Depends(get_ontology_service)
@@ -76,7 +97,7 @@ async def update_entity_type(
 
 
 @router.delete("/entity-types/{entity_type_id}", status_code=204)
-async def delete_entity_type(
+def delete_entity_type(
     entity_type_id: int,
     service: OntologyService = Depends(get_ontology_service)
 ):
@@ -88,7 +109,7 @@ async def delete_entity_type(
 # ========== Relationship Type Endpoints ==========
 
 @router.post("/relationship-types", response_model=RelationshipTypeResponse, status_code=201)
-async def create_relationship_type(
+def create_relationship_type(
     relationship_type: RelationshipTypeCreate,
     service: OntologyService = Depends(get_ontology_service)
 ):
@@ -101,7 +122,7 @@ async def create_relationship_type(
 
 
 @router.get("/relationship-types", response_model=List[RelationshipTypeResponse])
-async def list_relationship_types(
+def list_relationship_types(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     service: OntologyService = Depends(get_ontology_service)
@@ -123,7 +144,71 @@ async def create_entity(
     - **type**: Entity type name
     - **properties**: Entity property values
     """
-    return service.create_entity(entity)
+    return await service.create_entity(entity)
+
+
+@router.get("/entities/export")
+async def export_entities(
+    entity_type: str = Query(..., description="Entity type to export"),
+    chunk_size: int = Query(1000, ge=1, le=10000, description="Entities read per round trip"),
+    filters: Optional[Dict[str, Any]] = Depends(parse_filter_param),
+    service: OntologyService = Depends(get_ontology_service)
+):
+    """
+    Export all entities of a type matching an optional filter as newline-delimited JSON
+    
+    Entities are streamed from the graph while the response is written, so
+    exports of any size run in constant memory. The read transaction is
+    closed when the client disconnects.
+    """
+    # Awaited before the response starts, so an invalid filter is answered
+    # with an error status rather than a truncated body
+    stream = await service.stream_entities(entity_type, filters, chunk_size=chunk_size)
+    
+    async def lines():
+        async with aclosing(stream) as chunks:
+            async for chunk in chunks:
+                yield "".join(json.dumps(entity, default=str) + "\n" for entity in chunk)
+    
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@router.get("/entities/page", response_model=EntityPage)
+async def page_entities(
+    entity_type: str = Query(..., description="Entity type to page through"),
+    limit: int = Query(100, ge=1, le=5000),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    order_by: Optional[str] = Query(None, description="Indexed property to order by (default: id)"),
+    filters: Optional[Dict[str, Any]] = Depends(parse_filter_param),
+    service: OntologyService = Depends(get_ontology_service)
+):
+    """
+    Page through entities of a type with a continuation cursor
+    
+    Pass the returned next_cursor (with the same entity_type, order_by and
+    filter) to get the following page. Every page costs the same, however deep.
+    """
+    return await service.page_entities(entity_type, filters, limit=limit, cursor=cursor, order_by=order_by)
+
+
+@router.post("/entities/search", response_model=EntitySearchResponse)
+async def search_entities_by_filter(
+    search: EntitySearchRequest,
+    service: OntologyService = Depends(get_ontology_service)
+):
+    """
+    Search entities with a filter expression
+    
+    - **filter**: Conditions ({"field", "op", "value"} with op one of eq,
+      ne, lt, lte, gt, gte, between, in, prefix, exists) combined with
+      and/or/not; fields must be declared on the entity type
+    - **explain**: Return the query plan and the indexes it uses instead
+      of the results
+    """
+    if search.explain:
+        return {"explain": await service.explain_entities(search.entity_type, search.filter)}
+    items = await service.search_entities(search.entity_type, search.filter, skip=search.skip, limit=search.limit)
+    return {"items": items}
 
 
 @router.get("/entities/{entity_id}", response_model=EntityResponse)
@@ -132,23 +217,24 @@ async def get_entity(
     service: OntologyService = Depends(get_ontology_service)
 ):
     """Get an entity instance by ID"""
-    return service.get_entity(entity_id)
+    return await service.get_entity(entity_id)
 
 
-@router.get("/entities", response_model=List[EntityResponse])
+@router.get("/entities", response_model=List[EntityResponse], deprecated=True)
 async def search_entities(
     entity_type: str = Query(..., description="Entity type to search"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    filters: Optional[Dict[str, Any]] = Depends(parse_filter_param),
     service: OntologyService = Depends(get_ontology_service)
 ):
     """
-    Search entities by type and optional filters
+    Search entities by type and an optional JSON filter expression
     
-    Query parameters can be used as filters
+    Offset paging is kept for backwards compatibility; use /entities/page
+    for large result sets.
     """
-    # Note: Advanced filtering would be implemented here
-    return service.search_entities(entity_type, {}, skip=skip, limit=limit)
+    return await service.search_entities(entity_type, filters, skip=skip, limit=limit)
 
 
 # ========== Relationship Instance Endpoints ==========
@@ -163,4 +249,4 @@ async def create_relationship(
     
     Connects two existing entities
     """
-    return service.create_relationship(relationship)
+    return await service.create_relationship(relationship)
@@ -2,7 +2,7 @@
 Core Configuration Module
 Manages application settings and environment variables
 """
-from typing import List, Optional
+from typing import Dict, Any, List, Optional
 from pydantic_settings import BaseSettings
 from pydantic import AnyHttpUrl, validator
 
@@ -27,6 +27,7 @@ class Settings(BaseSettings):
     NEO4J_USER: str
     NEO4J_PASSWORD: str
     NEO4J_DATABASE: str = "neo4j"
+    NEO4J_FETCH_SIZE: int = 1000
     
     # PostgreSQL Metadata Database
     POSTGRES_HOST: str
@@ -78,6 +79,47 @@ class Settings(BaseSettings):
     MAX_CONNECTOR_THREADS: int = 10
     CONNECTOR_TIMEOUT: int = 300
     ENABLE_CDC: bool = True
+    CONNECTOR_BATCH_SIZE: int = 1000
+    CONNECTOR_QUEUE_SIZE: int = 4
+    CONNECTOR_TRANSFORM_WORKERS: int = 1
+    CONNECTOR_LOAD_WORKERS: int = 1
+    CONNECTOR_ADAPTIVE_BATCHING: bool = True
+    CONNECTOR_MIN_BATCH_SIZE: int = 100
+    CONNECTOR_MAX_BATCH_SIZE: int = 20000
+    CONNECTOR_TARGET_COMMIT_MS: int = 250  # below SYNC_WRITE_LATENCY_THRESHOLD_MS
+    CONNECTOR_MEMORY_LIMIT_MB: int = 2048
+    GRAPH_LOAD_TRANSACTION_SIZE: int = 1000
+    GRAPH_NODE_CACHE_SIZE: int = 100000
+    GRAPH_LOAD_MAX_RETRIES: int = 3
+    GRAPH_LOAD_RETRY_BACKOFF_SECONDS: float = 0.5
+    GRAPH_MIGRATIONS_ENABLED: bool = True
+    GRAPH_MIGRATION_BATCH_SIZE: int = 10000
+    SYNC_SCHEDULER_ENABLED: bool = True
+    SYNC_SCHEDULER_INTERVAL_SECONDS: int = 10
+    SYNC_MAX_CONCURRENT: int = 4
+    SYNC_MAX_CONCURRENT_PER_DATABASE: int = 2
+    SYNC_TIMEOUT_SECONDS: int = 0  # 0 = unlimited
+    SYNC_WRITE_LATENCY_THRESHOLD_MS: int = 500
+    SYNC_BACKPRESSURE_PAUSE_SECONDS: int = 30
+    SYNC_CHECKPOINT_INTERVAL_SECONDS: float = 0
+    SYNC_STATS_HISTORY: int = 50
+    REST_CONNECTOR_POOL_SIZE: int = 100
+    REST_CONNECTOR_KEEPALIVE_SECONDS: int = 30
+    ADMIN_IMPORT_SHARD_ROWS: int = 1000000
+    DEDUP_MAX_BLOCK_SIZE: int = 1000
+    DEDUP_MINHASH_PERMUTATIONS: int = 64
+    DEDUP_LSH_BANDS: int = 16
+    
+    @validator("SYNC_WRITE_LATENCY_THRESHOLD_MS")
+    def check_commit_target_below_threshold(cls, v: int, values: Dict[str, Any]) -> int:
+        # Adaptive batching grows transactions towards the commit target;
+        # at or above the threshold every sync would run into backpressure
+        target = values.get("CONNECTOR_TARGET_COMMIT_MS")
+        if v and target is not None and target >= v:
+            raise ValueError(
+                f"CONNECTOR_TARGET_COMMIT_MS ({target}) must be below SYNC_WRITE_LATENCY_THRESHOLD_MS ({v})"
+            )
+        return v
     
     class Config:
         env_file = ".env"
@@ -0,0 +1,131 @@
+"""
+Graph Migrations
+One-time data migrations of the Neo4j graph, run in the background at startup
+"""
+from typing import Callable, List, Tuple
+import threading
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.db.neo4j_client import neo4j_client
+from app.utils.cypher import ENTITY_LABEL
+
+
+# Marker nodes recording completed migrations; they are not entities
+MIGRATION_LABEL = "GraphMigration"
+
+_completed = set()
+
+
+def is_completed(name: str) -> bool:
+    """
+    Whether a migration is known to have completed
+
+    Only reflects this process: a migration counts as completed once the
+    runner has found or written its marker.
+
+    Args:
+        name: Migration name
+    """
+    return name in _completed
+
+
+def entity_label_ready() -> bool:
+    """Whether every node carries the common entity label, so id lookups may rely on it"""
+    return is_completed("entity_label")
+
+
+def backfill_entity_label(batch_size: int):
+    """
+    Add the common entity label, and an id where missing, to older nodes
+
+    Runs as a single pass over the nodes, committing every batch_size
+    nodes, so the backfill neither holds one huge transaction nor rescans
+    already migrated nodes. Interrupted runs are simply repeated.
+
+    Args:
+        batch_size: Nodes updated per transaction
+    """
+    neo4j_client.execute_query(f"""
+        MATCH (n)
+        WHERE NOT n:{ENTITY_LABEL} AND NOT n:{MIGRATION_LABEL}
+        CALL {{
+            WITH n
+            SET n:{ENTITY_LABEL}, n.id = coalesce(n.id, toString(id(n)))
+        }} IN TRANSACTIONS OF {int(batch_size)} ROWS
+    """)
+
+
+def add_entity_id_constraint(batch_size: int):
+    """
+    Replace the entity id index by a uniqueness constraint
+
+    IDs are generated outside the database and entities are created with
+    MERGE on their id, which is only race-free with a constraint. The
+    constraint brings its own index; if existing duplicate ids prevent it,
+    the plain index is restored and the migration retried on the next start.
+
+    Args:
+        batch_size: Unused
+    """
+    neo4j_client.execute_write("DROP INDEX entity_id_idx IF EXISTS")
+    try:
+        neo4j_client.execute_write(
+            f"CREATE CONSTRAINT entity_id_unique IF NOT EXISTS FOR (n:{ENTITY_LABEL}) REQUIRE n.id IS UNIQUE"
+        )
+    except Exception:
+        neo4j_client.execute_write(f"CREATE INDEX entity_id_idx IF NOT EXISTS FOR (n:{ENTITY_LABEL}) ON (n.id)")
+        raise
+
+
+MIGRATIONS: List[Tuple[str, Callable[[int], None]]] = [
+    ("entity_label", backfill_entity_label),
+    ("entity_id_unique", add_entity_id_constraint),
+]
+
+
+def run_pending_migrations():
+    """Run every migration without a completion marker, in order"""
+    try:
+        neo4j_client.execute_write(
+            f"CREATE CONSTRAINT graph_migration_name IF NOT EXISTS "
+            f"FOR (m:{MIGRATION_LABEL}) REQUIRE m.name IS UNIQUE"
+        )
+        rows = neo4j_client.execute_read(f"MATCH (m:{MIGRATION_LABEL}) RETURN m.name AS name")
+        _completed.update(row["name"] for row in rows)
+    except Exception as e:
+        logger.error(f"Failed to read graph migration state: {e}")
+        return
+
+    for name, migrate in MIGRATIONS:
+        if name in _completed:
+            continue
+        if not settings.GRAPH_MIGRATIONS_ENABLED:
+            logger.warning(f"Graph migration {name} is pending but migrations are disabled")
+            continue
+
+        logger.info(f"Running graph migration {name}")
+        try:
+            migrate(settings.GRAPH_MIGRATION_BATCH_SIZE)
+            neo4j_client.execute_write(
+                f"MERGE (m:{MIGRATION_LABEL} {{name: $name}}) SET m.completed_at = datetime()",
+                {"name": name}
+            )
+        except Exception as e:
+            logger.error(f"Graph migration {name} failed, it will be retried on the next start: {e}")
+            return
+
+        _completed.add(name)
+        logger.info(f"Graph migration {name} completed")
+
+
+def start_background_migrations() -> threading.Thread:
+    """
+    Run pending migrations in a daemon thread
+
+    Request handling continues meanwhile; code that depends on a migration
+    checks is_completed() and falls back to the old behaviour until then.
+    """
+    thread = threading.Thread(target=run_pending_migrations, name="graph-migrations", daemon=True)
+    thread.start()
+    return thread
@@ -2,14 +2,59 @@
 Neo4j Graph Database Client
 Manages connections to Neo4j graph database
 """
-from typing import Dict, List, Any, Optional
-from neo4j import GraphDatabase, Driver, Session
+from typing import Dict, List, Any, Optional, Iterator, AsyncIterator, Union
+from neo4j import GraphDatabase, Driver, Session, AsyncGraphDatabase, AsyncDriver, READ_ACCESS, WRITE_ACCESS
 from app.core.config import settings
 from app.core.logging import logger
 
 
+def _iter_records(result, chunk_size: Optional[int] = None) -> Iterator[Union[Dict[str, Any], List[Dict[str, Any]]]]:
+    """
+    Iterate over a result as dicts, pulling records from the server lazily
+    
+    Args:
+        result: Open driver result
+        chunk_size: Yield lists of this many records instead of single records
+    """
+    if not chunk_size:
+        for record in result:
+            yield dict(record)
+        return
+    
+    chunk = []
+    for record in result:
+        chunk.append(dict(record))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def _aiter_records(result, chunk_size: Optional[int] = None) -> AsyncIterator[Union[Dict[str, Any], List[Dict[str, Any]]]]:
+    """Async counterpart of _iter_records"""
+    if not chunk_size:
+        async for record in result:
+            yield dict(record)
+        return
+    
+    chunk = []
+    async for record in result:
+        chunk.append(dict(record))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
 class Neo4jClient:
-    """Neo4j Database Client"""
+    """
+    Neo4j Database Client
+    
+    Blocking client for connectors, scripts and other code running outside
+    the event loop. Request handlers use AsyncNeo4jClient.
+    """
     
     def __init__(self):
         self.driver: Optional[Driver] = None
@@ -41,7 +86,8 @@ class Neo4jClient:
     def execute_query(
         self, 
         query: str, 
-        parameters: Optional[Dict[str, Any]] = None
+        parameters: Optional[Dict[str, Any]] = None,
+        database: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         Execute Cypher query
@@ -49,18 +95,52 @@ class Neo4jClient:
         Args:
             query: Cypher query string
             parameters: Query parameters
+            database: Target database (defaults to NEO4J_DATABASE)
             
         Returns:
             List of result records as dictionaries
         """
-        with self.driver.session(database=self.database) as session:
-            result = session.run(query, parameters or {})
-            return [dict(record) for record in result]
+        with self._session(database) as session:
+            return list(_iter_records(session.run(query, parameters or {})))
+    
+    def stream(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        database: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        fetch_size: Optional[int] = None,
+        write: bool = False
+    ) -> Iterator[Union[Dict[str, Any], List[Dict[str, Any]]]]:
+        """
+        Stream the records of a query from an open transaction
+        
+        Records are pulled from the server fetch_size at a time while the
+        caller iterates, so memory stays bounded regardless of the result
+        size. Closing the generator early rolls the transaction back; the
+        transaction commits once the result is exhausted.
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            database: Target database (defaults to NEO4J_DATABASE)
+            chunk_size: Yield lists of this many records instead of single records
+            fetch_size: Records per server round trip (defaults to NEO4J_FETCH_SIZE)
+            write: Run in a write transaction
+            
+        Yields:
+            Result records as dictionaries, or chunks of them
+        """
+        access = WRITE_ACCESS if write else READ_ACCESS
+        with self._session(database, fetch_size, access) as session:
+            with session.begin_transaction() as tx:
+                yield from _iter_records(tx.run(query, parameters or {}), chunk_size)
     
     def execute_write(
         self, 
         query: str, 
-        parameters: Optional[Dict[str, Any]] = None
+        parameters: Optional[Dict[str, Any]] = None,
+        database: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         Execute write transaction
@@ -68,21 +148,22 @@ class Neo4jClient:
         Args:
             query: Cypher query string
             parameters: Query parameters
+            database: Target database (defaults to NEO4J_DATABASE)
             
         Returns:
             List of result records as dictionaries
         """
         def _execute(tx):
-            result = tx.run(query, parameters or {})
-            return [dict(record) for record in result]
+            return list(_iter_records(tx.run(query, parameters or {})))
         
-        with self.driver.session(database=self.database) as session:
+        with self._session(database) as session:
             return session.execute_write(_execute)
     
     def execute_read(
         self, 
         query: str, 
-        parameters: Optional[Dict[str, Any]] = None
+        parameters: Optional[Dict[str, Any]] = None,
+        database: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         Execute read transaction
@@ -90,17 +171,38 @@ class Neo4jClient:
         Args:
             query: Cypher query string
             parameters: Query parameters
+            database: Target database (defaults to NEO4J_DATABASE)
             
         Returns:
             List of result records as dictionaries
         """
         def _execute(tx):
-            result = tx.run(query, parameters or {})
-            return [dict(record) for record in result]
+            return list(_iter_records(tx.run(query, parameters or {})))
         
-        with self.driver.session(database=self.database) as session:
+        with self._session(database, access=READ_ACCESS) as session:
             return session.execute_read(_execute)
     
+    def explain(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        database: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Plan a query without running it
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            database: Target database (defaults to NEO4J_DATABASE)
+            
+        Returns:
+            Query plan as a tree of operator dictionaries
+        """
+        with self._session(database, access=READ_ACCESS) as session:
+            summary = session.run(f"EXPLAIN {query}", parameters or {}).consume()
+            return summary.plan or {}
+    
     def create_indexes(self):
         """Create necessary indexes for performance"""
         indexes = [
@@ -124,7 +226,194 @@ class Neo4jClient:
         except Exception as e:
             logger.error(f"Neo4j health check failed: {e}")
             return False
+    
+    def _session(self, database: Optional[str], fetch_size: Optional[int] = None, access: str = WRITE_ACCESS) -> Session:
+        """Open a session on the target database"""
+        return self.driver.session(
+            database=database or self.database,
+            fetch_size=fetch_size or settings.NEO4J_FETCH_SIZE,
+            default_access_mode=access
+        )
+
+
+class AsyncNeo4jClient:
+    """
+    Asynchronous Neo4j Database Client
+    
+    Used by request handlers: queries are awaited on the event loop
+    instead of blocking it, so a slow traversal only delays its own request.
+    """
+    
+    def __init__(self):
+        self.driver: Optional[AsyncDriver] = None
+        self.uri = settings.NEO4J_URI
+        self.user = settings.NEO4J_USER
+        self.password = settings.NEO4J_PASSWORD
+        self.database = settings.NEO4J_DATABASE
+    
+    async def connect(self):
+        """Establish connection to Neo4j"""
+        try:
+            self.driver = AsyncGraphDatabase.driver(
+                self.uri,
+                auth=(self.user, self.password)
+            )
+            await self.driver.verify_connectivity()
+            logger.info(f"Connected async driver to Neo4j at {self.uri}")
+        except Exception as e:
+            logger.error(f"Failed to connect async driver to Neo4j: {e}")
+            raise
+    
+    async def close(self):
+        """Close Neo4j connection"""
+        if self.driver:
+            await self.driver.close()
+            logger.info("Async Neo4j connection closed")
+    
+    async def execute_query(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        database: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute Cypher query
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            database: Target database (defaults to NEO4J_DATABASE)
+            
+        Returns:
+            List of result records as dictionaries
+        """
+        async with self._session(database) as session:
+            result = await session.run(query, parameters or {})
+            return [record async for record in _aiter_records(result)]
+    
+    async def stream(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        database: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        fetch_size: Optional[int] = None,
+        write: bool = False
+    ) -> AsyncIterator[Union[Dict[str, Any], List[Dict[str, Any]]]]:
+        """
+        Stream the records of a query from an open transaction
+        
+        Records are pulled from the server fetch_size at a time while the
+        caller iterates. Close the generator (contextlib.aclosing) when
+        stopping early, e.g. because the HTTP client disconnected: the
+        transaction is then rolled back and its connection released.
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            database: Target database (defaults to NEO4J_DATABASE)
+            chunk_size: Yield lists of this many records instead of single records
+            fetch_size: Records per server round trip (defaults to NEO4J_FETCH_SIZE)
+            write: Run in a write transaction
+            
+        Yields:
+            Result records as dictionaries, or chunks of them
+        """
+        access = WRITE_ACCESS if write else READ_ACCESS
+        async with self._session(database, fetch_size, access) as session:
+            async with await session.begin_transaction() as tx:
+                result = await tx.run(query, parameters or {})
+                async for item in _aiter_records(result, chunk_size):
+                    yield item
+    
+    async def execute_write(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        database: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute write transaction
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            database: Target database (defaults to NEO4J_DATABASE)
+            
+        Returns:
+            List of result records as dictionaries
+        """
+        async def _execute(tx):
+            result = await tx.run(query, parameters or {})
+            return [record async for record in _aiter_records(result)]
+        
+        async with self._session(database) as session:
+            return await session.execute_write(_execute)
+    
+    async def execute_read(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        database: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute read transaction
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            database: Target database (defaults to NEO4J_DATABASE)
+            
+        Returns:
+            List of result records as dictionaries
+        """
+        async def _execute(tx):
+            result = await tx.run(query, parameters or {})
+            return [record async for record in _aiter_records(result)]
+        
+        async with self._session(database, access=READ_ACCESS) as session:
+            return await session.execute_read(_execute)
+    
+    async def explain(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        database: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Plan a query without running it
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            database: Target database (defaults to NEO4J_DATABASE)
+            
+        Returns:
+            Query plan as a tree of operator dictionaries
+        """
+        async with self._session(database, access=READ_ACCESS) as session:
+            result = await session.run(f"EXPLAIN {query}", parameters or {})
+            summary = await result.consume()
+            return summary.plan or {}
+    
+    async def health_check(self) -> bool:
+        """Check Neo4j connection health"""
+        try:
+            result = await self.execute_read("RETURN 1 as health")
+            return len(result) > 0 and result[0].get("health") == 1
+        except Exception as e:
+            logger.error(f"Async Neo4j health check failed: {e}")
+            return False
+    
+    def _session(self, database: Optional[str], fetch_size: Optional[int] = None, access: str = WRITE_ACCESS):
+        """Open a session on the target database"""
+        return self.driver.session(
+            database=database or self.database,
+            fetch_size=fetch_size or settings.NEO4J_FETCH_SIZE,
+            default_access_mode=access
+        )
 
 
-# Global Neo4j client instance
+# Global Neo4j client instances
 neo4j_client = Neo4jClient()
+async_neo4j_client = AsyncNeo4jClient()
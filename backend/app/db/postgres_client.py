@@ -2,7 +2,7 @@
 PostgreSQL Database Client
 Manages connections to PostgreSQL for metadata storage
 """
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from app.core.config import settings
@@ -39,10 +39,42 @@ def get_db() -> Session:
         db.close()
 
 
+def _add_missing_columns():
+    """
+    Add model columns missing from existing tables
+    
+    create_all only creates missing tables, so columns added to a model
+    later (e.g. the sync state of DataConnector) are added here with
+    ALTER TABLE ... ADD COLUMN IF NOT EXISTS. Only nullable columns can be
+    added this way; anything else needs a manual migration.
+    """
+    inspector = inspect(engine)
+    statements = []
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            if not column.nullable:
+                logger.error(f"Column {table.name}.{column.name} is missing and NOT NULL, migrate it manually")
+                continue
+            column_type = column.type.compile(dialect=engine.dialect)
+            statements.append(f'ALTER TABLE "{table.name}" ADD COLUMN IF NOT EXISTS "{column.name}" {column_type}')
+    
+    if statements:
+        with engine.begin() as connection:
+            for statement in statements:
+                connection.exec_driver_sql(statement)
+                logger.info(f"Schema update: {statement}")
+
+
 def init_db():
-    """Initialize database tables"""
+    """Initialize database tables and add columns introduced since they were created"""
     try:
         Base.metadata.create_all(bind=engine)
+        _add_missing_columns()
         logger.info("PostgreSQL tables initialized")
     except Exception as e:
         logger.error(f"Failed to initialize PostgreSQL: {e}")
@@ -10,9 +10,12 @@ import time
 
 from app.core.config import settings
 from app.core.logging import logger
-from app.db.neo4j_client import neo4j_client
+from app.db.neo4j_client import neo4j_client, async_neo4j_client
 from app.db.redis_client import redis_client
 from app.db.postgres_client import init_db, health_check as postgres_health_check
+from app.db.graph_migrations import start_background_migrations
+from app.services.connectors.rest_connector import close_shared_sessions
+from app.services.connectors.scheduler import sync_scheduler
 
 
 @asynccontextmanager
@@ -28,11 +31,17 @@ async def lifespan(app: FastAPI):
         # Initialize database connections
         logger.info("Initializing database connections...")
         neo4j_client.connect()
+        await async_neo4j_client.connect()
         redis_client.connect()
         init_db()
         
-        # Create Neo4j indexes
+        # Create Neo4j indexes and backfill older graph data
         neo4j_client.create_indexes()
+        start_background_migrations()
+        
+        # Start scheduled connector syncs
+        if settings.SYNC_SCHEDULER_ENABLED:
+            await sync_scheduler.start()
         
         logger.info("All services initialized successfully")
     except Exception as e:
@@ -43,8 +52,11 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down services...")
+    await sync_scheduler.stop()
     neo4j_client.close()
+    await async_neo4j_client.close()
     redis_client.close()
+    await close_shared_sessions()
     logger.info("Shutdown complete")
 
 
@@ -104,7 +116,7 @@ async def health_check():
         "status": "healthy",
         "version": settings.APP_VERSION,
         "services": {
-            "neo4j": neo4j_client.health_check(),
+            "neo4j": await async_neo4j_client.health_check(),
             "postgres": postgres_health_check(),
             "redis": redis_client.health_check()
         }
@@ -2,7 +2,7 @@
 Ontology Models
 Defines the core ontology data structures
 """
-from sqlalchemy import Column, String, Integer, JSON, DateTime, ForeignKey, Boolean, Text
+from sqlalchemy import Column, String, Integer, JSON, DateTime, ForeignKey, Boolean, Text, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.postgres_client import Base
@@ -86,7 +86,45 @@ class DataConnector(Base):
     mapping = Column(JSON, nullable=False)  # Schema mapping to ontology
     is_active = Column(Boolean, default=True)
     last_sync_at = Column(DateTime(timezone=True), nullable=True)
-    sync_status = Column(String(50), default="pending")  # pending, running, success, error
+    sync_watermark = Column(JSON, nullable=True)  # High-watermark of the last committed incremental batch
+    sync_checkpoint = Column(JSON, nullable=True)  # Resume position and counters of an interrupted full sync
+    sync_stats = Column(JSON, nullable=True)  # Stage metrics of the last sync and per-run history
+    sync_status = Column(String(50), default="pending")  # pending, queued, running, success, error
     sync_error = Column(Text, nullable=True)
+    schedule = Column(String(100), nullable=True)  # Cron expression or "@every <interval>"
+    priority = Column(Integer, default=0)  # Higher runs first when sync slots are scarce
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+
+class DeadLetterRecord(Base):
+    """
+    Dead-Letter Record
+    Stores a record that failed to sync so it can be inspected and replayed
+    """
+    __tablename__ = "dead_letter_records"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    connector_id = Column(Integer, ForeignKey("data_connectors.id", ondelete="CASCADE"), nullable=False, index=True)
+    stage = Column(String(50), nullable=False)  # transform (raw record) or load (transformed record)
+    record = Column(JSON, nullable=False)
+    error = Column(Text, nullable=True)
+    attempts = Column(Integer, default=1)
+    status = Column(String(50), default="pending", index=True)  # pending, replayed, discarded
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+
+class DedupBlockEntry(Base):
+    """
+    Deduplication Block Index Entry
+    Assigns a canonical entity to a block of candidate duplicates
+    """
+    __tablename__ = "dedup_block_entries"
+    __table_args__ = (UniqueConstraint("entity_type", "block_key", "entity_key"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    entity_type = Column(String(255), nullable=False)
+    block_key = Column(String(512), nullable=False)  # blocking key name and normalized value, or LSH band hash
+    entity_key = Column(String(512), nullable=False)  # JSON-encoded natural key of the canonical entity
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
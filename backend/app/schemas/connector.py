@@ -0,0 +1,31 @@
+"""
+Connector Schemas
+Pydantic models for data connector API responses
+"""
+from typing import Dict, List, Optional, Any
+from pydantic import BaseModel, Field
+from datetime import datetime
+
+
+class SyncRunSummary(BaseModel):
+    """Compact statistics of one sync run"""
+    started_at: Optional[str] = None
+    success: bool
+    records_processed: int
+    elapsed_seconds: Optional[float] = None
+    rows_per_second: Optional[float] = None
+    bottleneck: Optional[str] = Field(None, description="Stage with the most busy time per worker")
+    stage_rows_per_second: Dict[str, Optional[float]] = Field(default_factory=dict)
+    peak_rss_mb: Optional[float] = None
+
+
+class ConnectorStatsResponse(BaseModel):
+    """Schema for connector sync statistics"""
+    connector_id: int
+    name: str
+    sync_status: Optional[str]
+    last_sync_at: Optional[datetime]
+    last: Optional[Dict[str, Any]] = Field(
+        None, description="Stage timings, throughput, queue depths, retries and memory of the latest sync"
+    )
+    runs: List[SyncRunSummary] = Field(default_factory=list, description="History of recent runs, oldest first")
@@ -86,15 +86,55 @@ class EntityCreate(BaseModel):
     """Schema for creating an entity instance"""
     type: str = Field(..., description="Entity type name")
     properties: Dict[str, Any] = Field(..., description="Entity properties")
+    id: Optional[str] = Field(
+        None, min_length=1, max_length=128,
+        description="Client-generated entity ID (ULID recommended); generated if omitted, retries with the same ID are idempotent"
+    )
 
 
 class EntityResponse(BaseModel):
     """Schema for entity instance response"""
-    id: str = Field(..., description="Neo4j node ID")
+    id: str = Field(..., description="Entity ID (ULID)")
     type: str
     properties: Dict[str, Any]
 
 
+class EntityPage(BaseModel):
+    """Schema for a keyset-paginated page of entities"""
+    items: List[EntityResponse]
+    next_cursor: Optional[str] = Field(None, description="Opaque token for the next page; null on the last page")
+    has_more: bool
+
+
+class EntitySearchRequest(BaseModel):
+    """Schema for an entity search with a filter expression"""
+    entity_type: str = Field(..., description="Entity type to search")
+    filter: Optional[Dict[str, Any]] = Field(
+        None,
+        description='Filter expression, e.g. {"and": [{"field": "age", "op": "gte", "value": 30}, '
+                    '{"field": "name", "op": "prefix", "value": "Jo"}]}'
+    )
+    skip: int = Field(0, ge=0)
+    limit: int = Field(100, ge=1, le=1000)
+    explain: bool = Field(False, description="Return the query plan instead of running the search")
+
+
+class SearchExplain(BaseModel):
+    """Schema for the plan of an entity search"""
+    query: str
+    parameters: Dict[str, Any]
+    indexes: List[Dict[str, Any]] = Field(..., description="Index operators used by the plan")
+    scans: List[Dict[str, Any]] = Field(..., description="Label or full node scans in the plan")
+    full_scan: bool = Field(..., description="True if no index is used")
+    available_indexes: List[Dict[str, Any]]
+
+
+class EntitySearchResponse(BaseModel):
+    """Schema for entity search results"""
+    items: List[EntityResponse] = Field(default_factory=list)
+    explain: Optional[SearchExplain] = None
+
+
 # Relationship Instance Schemas
 class RelationshipCreate(BaseModel):
     """Schema for creating a relationship instance"""
@@ -102,11 +142,15 @@ class RelationshipCreate(BaseModel):
     from_entity_id: str = Field(..., description="Source entity ID")
     to_entity_id: str = Field(..., description="Target entity ID")
     properties: Dict[str, Any] = Field(default_factory=dict, description="Relationship properties")
+    id: Optional[str] = Field(
+        None, min_length=1, max_length=128,
+        description="Client-generated relationship ID; generated if omitted, retries with the same ID are idempotent"
+    )
 
 
 class RelationshipResponse(BaseModel):
     """Schema for relationship instance response"""
-    id: str = Field(..., description="Neo4j relationship ID")
+    id: str = Field(..., description="Relationship ID (ULID)")
     type: str
     from_entity_id: str
     to_entity_id: str
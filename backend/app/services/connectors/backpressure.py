@@ -0,0 +1,100 @@
+"""
+Ingestion Backpressure
+Pauses connector graph writes while Neo4j write latency is elevated
+"""
+from typing import Dict, Any, Optional
+import threading
+import time
+
+from app.core.config import settings
+from app.core.logging import logger
+
+
+class WriteLatencyMonitor:
+    """
+    Tracks graph write latency and gates ingestion writes
+
+    Every bulk write reports its duration. When the smoothed latency rises
+    above the threshold, ingestion pauses for a cool-down period: loader
+    threads block before their next write and the scheduler starts no new
+    syncs. Afterwards writes resume and the latency is measured afresh, so
+    a still-overloaded database pauses ingestion again (like a circuit
+    breaker) while interactive traffic gets the capacity in between. A new
+    pause needs as many fresh samples as the moving average spans, so a
+    single slow commit after a pause does not trip it again.
+    """
+
+    def __init__(self, threshold_ms: float, pause_seconds: float, smoothing: float = 0.2):
+        """
+        Args:
+            threshold_ms: Smoothed write latency that triggers a pause (0 disables)
+            pause_seconds: Length of a pause
+            smoothing: Weight of the newest sample in the moving average
+        """
+        self.threshold_ms = threshold_ms
+        self.pause_seconds = pause_seconds
+        self.smoothing = smoothing
+        self.latency_ms: Optional[float] = None
+        self.min_samples = max(1, round(1 / smoothing))
+        self.pauses = 0
+        self._samples = 0
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def paused(self) -> bool:
+        return time.monotonic() < self._paused_until
+
+    def observe(self, seconds: float):
+        """Record the duration of a completed write"""
+        sample = seconds * 1000
+        with self._lock:
+            if self.latency_ms is None:
+                self.latency_ms = sample
+            else:
+                self.latency_ms += self.smoothing * (sample - self.latency_ms)
+            self._samples += 1
+
+            if (
+                self.threshold_ms
+                and self.latency_ms > self.threshold_ms
+                and self._samples >= self.min_samples
+                and not self.paused
+            ):
+                logger.warning(
+                    f"Graph write latency {self.latency_ms:.0f}ms above {self.threshold_ms:.0f}ms, "
+                    f"pausing ingestion for {self.pause_seconds}s"
+                )
+                self._paused_until = time.monotonic() + self.pause_seconds
+                self.latency_ms = None
+                self._samples = 0
+                self.pauses += 1
+
+    def wait_if_paused(self) -> float:
+        """
+        Block the calling (loader) thread while ingestion is paused
+
+        Returns:
+            Seconds spent waiting
+        """
+        started = time.monotonic()
+        while True:
+            remaining = self._paused_until - time.monotonic()
+            if remaining <= 0:
+                return time.monotonic() - started
+            time.sleep(min(remaining, 1.0))
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "paused": self.paused,
+            "write_latency_ms": self.latency_ms,
+            "threshold_ms": self.threshold_ms,
+            "pauses": self.pauses,
+        }
+
+
+# Global monitor shared by all connectors of the process
+write_latency_monitor = WriteLatencyMonitor(
+    threshold_ms=settings.SYNC_WRITE_LATENCY_THRESHOLD_MS,
+    pause_seconds=settings.SYNC_BACKPRESSURE_PAUSE_SECONDS
+)
@@ -3,12 +3,24 @@ Base Data Connector
 Abstract base class for all data connector implementations
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Iterator
-from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Iterator, Tuple, Union
+from dataclasses import dataclass, field
 from enum import Enum
+import asyncio
 import time
 
+import pyarrow as pa
+import pyarrow.compute as pc
+
 from app.core.logging import logger
+from app.services.connectors.graph_loader import GraphLoader, LoadResult, ColumnarBatch, RecordError
+from app.services.connectors.bulk_import import AdminImportWriter, ImportManifest
+from app.services.connectors.batch_control import BatchSizeController
+from app.services.connectors.dedup import Deduplicator
+from app.services.connectors.metrics import summarize_run
+from app.services.connectors.pipeline import SyncPipeline, PipelineOptions
+from app.services.connectors.sync_state import SyncStateStore, encode_state, decode_state
+from app.services.connectors.dead_letter import DeadLetterStore, STAGE_TRANSFORM, STAGE_LOAD
 
 
 class ConnectorStatus(Enum):
@@ -29,6 +41,11 @@ class SyncResult:
     records_failed: int
     duration_seconds: float
     error_message: Optional[str] = None
+    records_dead_lettered: int = 0
+    resumed_from: Optional[Dict[str, Any]] = None
+    records_resumed: int = 0
+    checkpoint: Optional[Dict[str, Any]] = None
+    stats: Dict[str, Any] = field(default_factory=dict)
 
 
 class BaseConnector(ABC):
@@ -39,6 +56,9 @@ class BaseConnector(ABC):
     and implement the required abstract methods.
     """
     
+    # Streaming connectors sync until stopped rather than until the source is exhausted
+    streaming = False
+    
     def __init__(self, connector_id: str, config: Dict[str, Any], mapping: Dict[str, Any]):
         """
         Initialize connector
@@ -53,6 +73,18 @@ class BaseConnector(ABC):
         self.mapping = mapping
         self.status = ConnectorStatus.IDLE
         self._connection = None
+        self._graph_loader = GraphLoader(
+            transaction_size=config.get("load_transaction_size"),
+            key_fields=self._key_fields(),
+            database=config.get("graph_database")
+        )
+        self._state = SyncStateStore(connector_id)
+        self._dead_letters = DeadLetterStore(connector_id)
+        self._watermark: Optional[Dict[str, Any]] = None
+        self._export_watermark: Optional[Dict[str, Any]] = None
+        self._resume_checkpoint: Optional[Dict[str, Any]] = None
+        self._batch_control: Optional[BatchSizeController] = None
+        self._deduplicator = Deduplicator.from_config(config, mapping, self._key_fields())
     
     @abstractmethod
     async def connect(self) -> bool:
@@ -122,79 +154,269 @@ class BaseConnector(ABC):
         Returns:
             Sync result with statistics
         """
+        if self.config.get("sync_mode") == "admin_import" and not isinstance(self._graph_loader, AdminImportWriter):
+            try:
+                return await self.export_import_files(full_sync=full_sync)
+            except ValueError as e:
+                logger.error(f"Import file export rejected: {e}")
+                self.status = ConnectorStatus.ERROR
+                return SyncResult(
+                    success=False,
+                    records_processed=0,
+                    records_failed=0,
+                    duration_seconds=0.0,
+                    error_message=str(e)
+                )
+        
         start_time = time.time()
-        records_processed = 0
-        records_failed = 0
+        pipeline = None
+        resume = None
         
         try:
             self.status = ConnectorStatus.SYNCING
             logger.info(f"Starting {'full' if full_sync else 'incremental'} sync for connector {self.connector_id}")
             
+            self._watermark = None if full_sync else await asyncio.to_thread(self._state.load_watermark)
+            
+            # A full sync continues from the checkpoint of an interrupted run
+            if full_sync and self._checkpoints_enabled():
+                resume = await asyncio.to_thread(self._state.load_checkpoint)
+            self._resume_checkpoint = resume.get("position") if resume else None
+            if self._resume_checkpoint is None:
+                resume = None
+            else:
+                logger.info(
+                    f"Resuming full sync of connector {self.connector_id} after "
+                    f"{resume.get('records_processed', 0)} records (checkpoint {resume.get('updated_at')})"
+                )
+            
             # Connect if not connected
             if self.status != ConnectorStatus.CONNECTED:
                 await self.connect()
             
-            # Fetch and process data in batches
-            async for batch in self.fetch_data(full_sync=full_sync):
-                try:
-                    # Transform data according to mapping
-                    transformed_batch = self._transform_batch(batch)
-                    
-                    # Load data into graph
-                    loaded = await self._load_to_graph(transformed_batch)
-                    
-                    records_processed += loaded
-                    logger.debug(f"Processed batch of {loaded} records")
-                    
-                except Exception as e:
-                    records_failed += len(batch)
-                    logger.error(f"Failed to process batch: {e}")
+            # Fetch, transform and load batches in concurrent stages. Incremental
+            # runs persist the watermark after every committed batch, full syncs
+            # (and sources without ordered positions) only once the whole
+            # source has been loaded.
+            defer_watermark = self._defer_watermark(full_sync)
+            options = PipelineOptions.from_config(self.config)
+            
+            # Adaptive batch sizes carry over between runs of the connector;
+            # file exports have no commit latency to steer by
+            if options.adaptive and isinstance(self._graph_loader, GraphLoader):
+                if self._batch_control is None:
+                    self._batch_control = BatchSizeController.from_config(
+                        self.config, options.batch_size, self._graph_loader.transaction_size
+                    )
+            else:
+                self._batch_control = None
+            if self._deduplicator is not None:
+                self._deduplicator.reset_stats()
+            
+            pipeline = SyncPipeline(self, options, full_sync, resume)
+            try:
+                await pipeline.run()
+            except BaseException:
+                # Keep the latest committed position even if checkpoints are
+                # only written periodically
+                if full_sync and self._checkpoints_enabled() and pipeline.checkpoint is not None:
+                    await asyncio.to_thread(self._save_checkpoint, pipeline.checkpoint)
+                raise
+            
+            records_processed = pipeline.records_processed
+            records_failed = pipeline.records_failed
+            checkpoint = pipeline.checkpoint
+            
+            if defer_watermark and pipeline.watermark is not None and pipeline.watermark_complete:
+                await asyncio.to_thread(self._store_watermark, pipeline.watermark)
+            if full_sync and self._checkpoints_enabled():
+                if pipeline.watermark_complete or checkpoint is None:
+                    await asyncio.to_thread(self._save_checkpoint, None)
+                else:
+                    # Batches after a failed one were not committed; the next
+                    # full sync picks up at the failed batch
+                    await asyncio.to_thread(self._save_checkpoint, checkpoint)
+            if not isinstance(self._graph_loader, AdminImportWriter):
+                await asyncio.to_thread(self._state.mark_synced)
             
             duration = time.time() - start_time
             self.status = ConnectorStatus.CONNECTED
+            stats = await self._record_stats(pipeline, True, records_processed)
             
-            logger.info(f"Sync completed: {records_processed} processed, {records_failed} failed in {duration:.2f}s")
+            logger.info(
+                f"Sync completed: {records_processed} processed, {records_failed} failed "
+                f"({pipeline.records_dead_lettered} dead-lettered) in {duration:.2f}s, "
+                f"bound by {stats.get('bottleneck')}"
+            )
             
             return SyncResult(
                 success=True,
                 records_processed=records_processed,
                 records_failed=records_failed,
-                duration_seconds=duration
+                duration_seconds=duration,
+                records_dead_lettered=pipeline.records_dead_lettered,
+                resumed_from=self._resume_checkpoint,
+                records_resumed=resume.get("records_processed", 0) if resume else 0,
+                checkpoint=checkpoint["position"] if checkpoint else None,
+                stats=stats
             )
             
         except Exception as e:
             duration = time.time() - start_time
             self.status = ConnectorStatus.ERROR
             logger.error(f"Sync failed: {e}")
+            stats = await self._record_stats(pipeline, False, pipeline.records_processed if pipeline else 0)
             
             return SyncResult(
                 success=False,
-                records_processed=records_processed,
-                records_failed=records_failed,
+                records_processed=pipeline.records_processed if pipeline else 0,
+                records_failed=pipeline.records_failed if pipeline else 0,
                 duration_seconds=duration,
-                error_message=str(e)
+                error_message=str(e),
+                records_dead_lettered=pipeline.records_dead_lettered if pipeline else 0,
+                resumed_from=self._resume_checkpoint,
+                records_resumed=resume.get("records_processed", 0) if resume else 0,
+                checkpoint=pipeline.checkpoint["position"] if pipeline and pipeline.checkpoint else None,
+                stats=stats
+            )
+    
+    async def export_import_files(self, output_dir: Optional[str] = None, full_sync: bool = True) -> SyncResult:
+        """
+        Write the mapped source data as neo4j-admin import files
+        
+        Runs the regular sync pipeline with an AdminImportWriter in place of
+        the graph loader, for first-time loads that are too large for
+        transactional writes. This is a one-off full export: each connector
+        exports into an import directory once. The watermark is recorded in
+        the manifest and only stored by confirm_import() once the files have
+        been imported, so incremental syncs continue after the exported data.
+        
+        Args:
+            output_dir: Import directory (default: config "import_dir")
+            full_sync: Must be True; incremental exports are rejected
+            
+        Returns:
+            Sync result with statistics
+            
+        Raises:
+            ValueError: For incremental runs, a missing import directory or
+                a directory this connector has already exported to
+        """
+        if not full_sync:
+            raise ValueError(
+                "Import file exports are one-off full exports; "
+                "run incremental syncs against the graph after the import"
             )
+        output_dir = output_dir or self.config.get("import_dir")
+        if not output_dir:
+            raise ValueError("import_dir not specified in connector config")
+        
+        writer = await asyncio.to_thread(
+            AdminImportWriter,
+            output_dir,
+            key_fields=self._key_fields(),
+            shard_rows=self.config.get("import_shard_rows"),
+            compress=self.config.get("import_compress", True)
+        )
+        if self.connector_id in writer.manifest.exports:
+            # Exporting again would duplicate every node, and neo4j-admin
+            # keeps the first copy of a duplicate
+            raise ValueError(f"Connector {self.connector_id} has already exported to {output_dir}")
+        
+        graph_loader, self._graph_loader = self._graph_loader, writer
+        self._export_watermark = None
+        result = None
+        try:
+            result = await self.sync(full_sync=True)
+        finally:
+            self._graph_loader = graph_loader
+            if result is not None and result.success:
+                writer.manifest.exports[self.connector_id] = {
+                    "watermark": encode_state(self._export_watermark),
+                    "confirmed": False,
+                }
+            self._export_watermark = None
+            manifest = await asyncio.to_thread(writer.close)
+        
+        logger.info(f"Import files ready, run: {' '.join(manifest.command(self.config.get('graph_database')))}")
+        return result
+    
+    async def confirm_import(self, import_dir: Optional[str] = None) -> bool:
+        """
+        Record that the exported import files have been imported
+        
+        Stores the watermark held back by export_import_files() and marks
+        the connector as synced.
+        
+        Args:
+            import_dir: Import directory (default: config "import_dir")
+            
+        Returns:
+            True if a pending export of this connector was confirmed
+        """
+        import_dir = import_dir or self.config.get("import_dir")
+        if not import_dir:
+            raise ValueError("import_dir not specified in connector config")
+        
+        manifest = await asyncio.to_thread(ImportManifest.load, import_dir)
+        export = manifest.exports.get(self.connector_id) if manifest else None
+        if export is None or export.get("confirmed"):
+            return False
+        
+        watermark = decode_state(export.get("watermark"))
+        if watermark is not None and not await asyncio.to_thread(self._save_watermark, watermark):
+            return False
+        await asyncio.to_thread(self._state.mark_synced)
+        
+        export["confirmed"] = True
+        await asyncio.to_thread(manifest.save)
+        logger.info(f"Confirmed import of connector {self.connector_id} from {import_dir}")
+        return True
     
-    def _transform_batch(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _transform_batch(
+        self,
+        batch: Union[List[Dict[str, Any]], pa.RecordBatch]
+    ) -> Union[List[Dict[str, Any]], ColumnarBatch]:
         """
         Transform data batch according to mapping
         
         Args:
-            batch: Raw data records
+            batch: Raw data records, or an Arrow record batch
             
         Returns:
-            Transformed records
+            Transformed records (columnar for Arrow input)
         """
+        transformed, _ = self._transform_with_errors(batch)
+        return transformed
+    
+    def _transform_with_errors(
+        self,
+        batch: Union[List[Dict[str, Any]], pa.RecordBatch]
+    ) -> Tuple[Union[List[Dict[str, Any]], ColumnarBatch], List[RecordError]]:
+        """
+        Transform data batch, collecting the records that cannot be transformed
+        
+        Args:
+            batch: Raw data records, or an Arrow record batch
+            
+        Returns:
+            Tuple of (transformed records, errors carrying the raw records)
+        """
+        if isinstance(batch, pa.RecordBatch):
+            return self._transform_columnar(batch), []
+        
         transformed = []
+        errors = []
         
-        for record in batch:
+        for index, record in enumerate(batch):
             try:
                 transformed_record = self._transform_record(record)
                 transformed.append(transformed_record)
             except Exception as e:
                 logger.warning(f"Failed to transform record: {e}")
+                errors.append(RecordError(index=index, error=str(e), record=record))
         
-        return transformed
+        return transformed, errors
     
     def _transform_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -218,44 +440,437 @@ class BaseConnector(ABC):
             if source_field in record:
                 properties[target_field] = record[source_field]
         
-        return {
+        transformed = {
             "type": entity_type,
             "properties": properties
         }
+        
+        relationships = []
+        for spec in self.mapping.get("relationships", []):
+            targets = record.get(spec["source_column"])
+            if targets is None:
+                continue
+            edge_properties = {
+                name: record.get(column) for name, column in spec.get("properties", {}).items()
+            }
+            for target in targets if isinstance(targets, list) else [targets]:
+                if target is not None:
+                    relationships.append({"spec": spec, "target": target, "properties": edge_properties})
+        if relationships:
+            transformed["relationships"] = relationships
+        
+        return transformed
+    
+    def _transform_columnar(self, batch: pa.RecordBatch) -> ColumnarBatch:
+        """
+        Transform an Arrow record batch according to mapping
+        
+        The mapping is applied as a column projection and rename, with
+        vectorized casts for target properties listed in the mapping's
+        field_types (Arrow type aliases, e.g. {"amount": "float64"}).
+        
+        Args:
+            batch: Raw record batch
+            
+        Returns:
+            Columnar batch of the mapped entity type
+        """
+        field_mappings = self.mapping.get("field_mappings", {})
+        field_types = self.mapping.get("field_types", {})
+        
+        names = []
+        columns = []
+        for target_field, source_field in field_mappings.items():
+            index = batch.schema.get_field_index(source_field)
+            if index < 0:
+                continue
+            
+            column = batch.column(index)
+            if target_field in field_types:
+                column = pc.cast(column, pa.type_for_alias(field_types[target_field]))
+            
+            names.append(target_field)
+            columns.append(column)
+        
+        relationships = []
+        for spec in self.mapping.get("relationships", []):
+            if spec["source_column"] not in batch.schema.names:
+                continue
+            targets = batch.column(spec["source_column"]).to_pylist()
+            property_columns = {
+                name: batch.column(column).to_pylist()
+                for name, column in spec.get("properties", {}).items()
+                if column in batch.schema.names
+            }
+            for i, target in enumerate(targets):
+                if target is None:
+                    continue
+                edge_properties = {name: values[i] for name, values in property_columns.items()}
+                for value in target if isinstance(target, list) else [target]:
+                    if value is not None:
+                        relationships.append((i, {"spec": spec, "target": value, "properties": edge_properties}))
+        
+        return ColumnarBatch(
+            entity_type=self.mapping.get("entity_type"),
+            data=pa.RecordBatch.from_arrays(columns, names=names),
+            relationships=relationships
+        )
     
-    async def _load_to_graph(self, records: List[Dict[str, Any]]) -> int:
+    async def _load_to_graph(
+        self,
+        records: Union[List[Dict[str, Any]], ColumnarBatch],
+        transaction_size: Optional[int] = None
+    ) -> LoadResult:
         """
         Load transformed records into Neo4j graph
         
+        With deduplication configured, duplicates are detected first and,
+        once loaded, linked to (or merged into) their canonical entity.
+        Import file exports are not deduplicated: the index lookups need
+        the entities in the graph.
+        
         Args:
             records: Transformed records
+            transaction_size: Records per transaction (default: the loader's)
             
         Returns:
-            Number of records loaded
+            Load result with loaded/failed counts and per-record errors
         """
-        from app.db.neo4j_client import neo4j_client
+        if self._deduplicator is None or not isinstance(self._graph_loader, GraphLoader):
+            return await asyncio.to_thread(self._graph_loader.load, records, transaction_size)
         
-        loaded = 0
+        if isinstance(records, ColumnarBatch):
+            records = records.to_records()
+        records, duplicates = await asyncio.to_thread(self._deduplicator.prepare, records)
+        result = await asyncio.to_thread(self._graph_loader.load, records, transaction_size)
         
-        for record in records:
+        failed = {error.index for error in result.errors}
+        duplicates = [match for match in duplicates if match.index not in failed]
+        try:
+            await asyncio.to_thread(self._deduplicator.link, duplicates)
+        except Exception as e:
+            logger.warning(f"Failed to link {len(duplicates)} duplicates: {e}")
+        return result
+    
+    def _dead_letter(self, transform_errors: List[RecordError], load_errors: List[RecordError]) -> bool:
+        """
+        Park the failed records of a batch in the dead-letter store
+        
+        Args:
+            transform_errors: Raw records that could not be transformed
+            load_errors: Transformed records that could not be loaded
+            
+        Returns:
+            True if every failed record was stored, so the batch may be
+            committed; False if dead-lettering is disabled or failed
+        """
+        if not self.config.get("dead_letter", True) or not self._dead_letters.available:
+            return False
+        
+        stored = True
+        for stage, errors in ((STAGE_TRANSFORM, transform_errors), (STAGE_LOAD, load_errors)):
+            entries = [{"record": error.record, "error": error.error} for error in errors]
+            stored = self._dead_letters.add(stage, entries) and stored
+        return stored
+    
+    async def replay_dead_letters(self, limit: int = 1000) -> SyncResult:
+        """
+        Retry pending dead-letter records
+        
+        Raw records are transformed again (picking up mapping fixes),
+        transformed records are loaded again. Records that succeed are marked
+        as replayed; the others stay pending with the new error.
+        
+        Args:
+            limit: Maximum number of records to replay
+            
+        Returns:
+            Result of the replay
+        """
+        start_time = time.time()
+        entries = await asyncio.to_thread(self._dead_letters.pending, limit)
+        replayed: List[int] = []
+        failed: Dict[int, str] = {}
+        
+        raw = [entry for entry in entries if entry["stage"] == STAGE_TRANSFORM]
+        to_load = [entry for entry in entries if entry["stage"] == STAGE_LOAD]
+        
+        # Re-transform raw records; those that still fail keep their entry
+        loadable_ids = [entry["id"] for entry in to_load]
+        records = [entry["record"] for entry in to_load]
+        for entry in raw:
             try:
-                entity_type = record["type"]
-                properties = record["properties"]
-                
-                query = f"""
-                CREATE (n:{entity_type} $properties)
-                SET n.id = toString(id(n))
-                SET n.created_at = datetime()
-                RETURN n
-                """
-                
-                neo4j_client.execute_write(query, {"properties": properties})
-                loaded += 1
-                
+                records.append(self._transform_record(entry["record"]))
+                loadable_ids.append(entry["id"])
             except Exception as e:
-                logger.error(f"Failed to load record to graph: {e}")
+                failed[entry["id"]] = str(e)
+        
+        if records:
+            load_result = await self._load_to_graph(records)
+            errors = {error.index: error.error for error in load_result.errors}
+            for index, record_id in enumerate(loadable_ids):
+                if index in errors:
+                    failed[record_id] = errors[index]
+                else:
+                    replayed.append(record_id)
+        
+        await asyncio.to_thread(self._dead_letters.resolve, replayed, failed)
+        logger.info(f"Replayed {len(replayed)} dead-letter records for connector {self.connector_id}, {len(failed)} failed again")
+        
+        return SyncResult(
+            success=True,
+            records_processed=len(replayed),
+            records_failed=len(failed),
+            duration_seconds=time.time() - start_time
+        )
+    
+    def _batch_watermark(self, batch: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Source position reached by a fetched batch
+        
+        Connectors that support incremental sync return the position after
+        the last record of the batch, which is persisted once the batch has
+        been loaded into the graph.
+        
+        Args:
+            batch: Raw data records
+            
+        Returns:
+            Watermark position, or None if the connector keeps no position
+        """
+        return None
+    
+    def _merge_watermark(
+        self,
+        current: Optional[Dict[str, Any]],
+        position: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Combine the committed watermark with the position of a newly committed batch
+        
+        Args:
+            current: Watermark committed so far in this run
+            position: Position of the batch
+            
+        Returns:
+            New watermark
+        """
+        return position
+    
+    def _defer_watermark(self, full_sync: bool) -> bool:
+        """
+        Whether the watermark is only persisted after the whole run
+        
+        Positions are committed per batch when batches arrive in watermark
+        order. Connectors reading unordered sources return True, so an
+        interrupted run never skips rows it has not loaded yet.
+        
+        Args:
+            full_sync: Whether this is a full sync
+            
+        Returns:
+            True to persist the watermark once at the end of the run
+        """
+        return full_sync
+    
+    def _continue_after_failure(self) -> bool:
+        """
+        Whether fetching continues once a batch could not be committed
+        
+        Batch connectors keep loading the rest of the source. Streaming
+        connectors return False: nothing after the failed batch can be
+        committed, so consuming further would only grow the redelivery.
+        
+        Returns:
+            True to keep fetching after a failed batch
+        """
+        return True
+    
+    def _store_watermark(self, watermark: Dict[str, Any]) -> bool:
+        """
+        Persist the committed watermark, or hold it back during an export
+        
+        Exported data only reaches the graph once the import files are
+        imported, see confirm_import().
+        
+        Returns:
+            True if the watermark was stored or held
+        """
+        if isinstance(self._graph_loader, AdminImportWriter):
+            self._export_watermark = watermark
+            return True
+        return self._save_watermark(watermark)
+    
+    def _save_watermark(self, watermark: Dict[str, Any]) -> bool:
+        """
+        Persist the committed watermark
+        
+        Returns:
+            True if the watermark was stored
+        """
+        try:
+            self._state.save_watermark(watermark)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to persist watermark for connector {self.connector_id}: {e}")
+            return False
+    
+    def _batch_checkpoint(self, batch: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Resume position of a full sync after a fetched batch
+        
+        Connectors that can restart a full read part way through return the
+        position after the batch (last key, byte offset, ...). It is read
+        back from self._resume_checkpoint when an interrupted full sync is
+        restarted.
+        
+        Args:
+            batch: Raw data records
+            
+        Returns:
+            Checkpoint position, or None if the connector cannot resume
+        """
+        return None
+    
+    def _merge_checkpoint(
+        self,
+        current: Optional[Dict[str, Any]],
+        position: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Combine the committed checkpoint with the position of a newly committed batch
+        
+        Args:
+            current: Checkpoint committed so far
+            position: Checkpoint position of the batch
+            
+        Returns:
+            New checkpoint position
+        """
+        return position
+    
+    def _checkpoints_enabled(self) -> bool:
+        """
+        Whether full syncs write checkpoints and resume from them
+        
+        Exports to import files are not checkpointed: data files are only
+        complete once the writer is closed.
+        """
+        if isinstance(self._graph_loader, AdminImportWriter):
+            return False
+        return bool(self.config.get("checkpoint", True))
+    
+    def _save_checkpoint(self, checkpoint: Optional[Dict[str, Any]]) -> bool:
+        """
+        Persist the full sync checkpoint (None clears it)
+        
+        Returns:
+            True if the checkpoint was stored
+        """
+        try:
+            self._state.save_checkpoint(checkpoint)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to persist checkpoint for connector {self.connector_id}: {e}")
+            return False
+    
+    def _fetch_size(self, batch_size: int) -> int:
+        """
+        Number of records to read for the next batch
+        
+        Connectors call this per batch, so fetch sizes follow the adaptive
+        batch controller during a sync.
+        
+        Args:
+            batch_size: Batch size requested by the pipeline
+            
+        Returns:
+            Current fetch batch size
+        """
+        return self._batch_control.fetch_size if self._batch_control is not None else batch_size
+    
+    async def _record_stats(self, pipeline: Optional[SyncPipeline], success: bool, records_processed: int) -> Dict[str, Any]:
+        """
+        Collect the statistics of a sync and persist them on the connector
+        
+        Args:
+            pipeline: Pipeline of the run (None if the sync failed before it started)
+            success: Whether the sync succeeded
+            records_processed: Records loaded
+            
+        Returns:
+            Stats reported in SyncResult.stats
+        """
+        stats = pipeline.metrics.to_dict() if pipeline is not None else {}
+        if self._batch_control is not None:
+            stats["batch_sizes"] = self._batch_control.get_stats()
+        if self._deduplicator is not None and stats:
+            stats["dedup"] = self._deduplicator.get_stats()
+        if not stats:
+            return stats
+        
+        try:
+            await asyncio.to_thread(
+                self._state.record_stats, stats, summarize_run(stats, success, records_processed)
+            )
+        except Exception as e:
+            logger.warning(f"Failed to persist sync stats for connector {self.connector_id}: {e}")
+        return stats
+    
+    def _projected_columns(self) -> Optional[List[str]]:
+        """
+        Source columns needed by the mapping
+        
+        Returns:
+            Mapped columns plus the timestamp, key and relationship columns,
+            or None to read every column when the mapping has no field mappings
+        """
+        columns = list(dict.fromkeys(self.mapping.get("field_mappings", {}).values()))
+        if not columns:
+            return None
+        
+        needed = [self.mapping.get("timestamp_column"), self._source_key_column()]
+        for spec in self.mapping.get("relationships", []):
+            needed.append(spec["source_column"])
+            needed.extend(spec.get("properties", {}).values())
+        
+        for column in needed:
+            if column and column not in columns:
+                columns.append(column)
+        return columns
+    
+    def _source_key_column(self) -> Optional[str]:
+        """
+        Source column holding the record's primary key
+        
+        Uses the mapping's source_key, falling back to the source column
+        mapped onto the natural key_field.
+        
+        Returns:
+            Column name, or None if the mapping declares no key
+        """
+        source_key = self.mapping.get("source_key")
+        if source_key:
+            return source_key
+        
+        key_field = self.mapping.get("key_field")
+        if key_field:
+            return self.mapping.get("field_mappings", {}).get(key_field)
+        return None
+    
+    def _key_fields(self) -> Dict[str, str]:
+        """
+        Natural key property per entity type, as declared in the mapping
+        
+        Returns:
+            Mapping of entity type to key property
+        """
+        entity_type = self.mapping.get("entity_type")
+        key_field = self.mapping.get("key_field")
         
-        return loaded
+        if entity_type and key_field:
+            return {entity_type: key_field}
+        return {}
     
     def get_status(self) -> Dict[str, Any]:
         """
@@ -0,0 +1,193 @@
+"""
+Adaptive Batch Sizing
+Grows and shrinks connector fetch and load batch sizes from measured latency, failures and memory
+"""
+from typing import Dict, Any, Optional
+from collections import deque
+import os
+import resource
+import threading
+
+from app.core.config import settings
+from app.core.logging import logger
+
+
+def process_rss_mb() -> float:
+    """Resident set size of the current process in MiB"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1 << 20)
+    except (OSError, ValueError, IndexError):
+        # Peak RSS where /proc is unavailable (KiB on Linux, bytes on macOS)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1 << 20) if peak > 1 << 32 else peak / 1024
+
+
+class BatchSizeController:
+    """
+    AIMD-style controller for fetch and load batch sizes
+
+    After every loaded batch the pipeline reports how many records were
+    written, how long that took and whether transactions failed. The load
+    (transaction) size is adjusted towards the target commit latency: it
+    shrinks in proportion when commits are slow and halves when
+    transactions fail, and grows by a quarter while commits are fast.
+    The fetch size grows while the process stays well below its memory
+    ceiling and halves when the ceiling is exceeded. Memory reductions are
+    followed by a cool-down, since freed memory is returned to the OS late.
+    """
+
+    GROWTH = 1.25
+    HISTORY_SIZE = 200
+
+    def __init__(
+        self,
+        fetch_size: int,
+        load_size: int,
+        min_size: int = 100,
+        max_size: int = 20000,
+        target_latency_ms: float = 250,
+        memory_limit_mb: float = 0,
+        cooldown: int = 4
+    ):
+        """
+        Args:
+            fetch_size: Initial number of records per fetched batch
+            load_size: Initial number of records per graph transaction
+            min_size: Lower bound of both sizes
+            max_size: Upper bound of both sizes
+            target_latency_ms: Desired duration of one graph transaction, below
+                the backpressure threshold
+            memory_limit_mb: Process RSS ceiling (0 disables the memory bound)
+            cooldown: Batches to wait after a memory reduction before reducing again
+        """
+        self.min_size = max(1, min_size)
+        self.max_size = max(self.min_size, max_size)
+        self.fetch_size = self._clamp(fetch_size)
+        self.load_size = self._clamp(load_size)
+        self.target_latency_ms = target_latency_ms
+        self.memory_limit_mb = memory_limit_mb
+        self.cooldown = cooldown
+        self.batches = 0
+        self.latency_ms: Optional[float] = None
+        self.rss_mb: Optional[float] = None
+        self.history: deque = deque(maxlen=self.HISTORY_SIZE)
+        self._memory_wait = 0
+        self._lock = threading.Lock()
+        self._record("initial")
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], fetch_size: int, load_size: int) -> "BatchSizeController":
+        """
+        Build a controller from connector configuration, falling back to settings
+
+        Args:
+            config: Connector configuration
+            fetch_size: Configured fetch batch size (starting point)
+            load_size: Configured transaction size (starting point)
+
+        Returns:
+            Controller
+        """
+        target_latency_ms = float(config.get("target_commit_ms", settings.CONNECTOR_TARGET_COMMIT_MS))
+        threshold_ms = settings.SYNC_WRITE_LATENCY_THRESHOLD_MS
+        if threshold_ms and target_latency_ms >= threshold_ms:
+            # Commits at the target would keep tripping the backpressure pause
+            logger.warning(
+                f"target_commit_ms {target_latency_ms:.0f} is not below the write latency threshold "
+                f"{threshold_ms}ms, using {settings.CONNECTOR_TARGET_COMMIT_MS}ms"
+            )
+            target_latency_ms = float(settings.CONNECTOR_TARGET_COMMIT_MS)
+
+        return cls(
+            fetch_size=fetch_size,
+            load_size=load_size,
+            min_size=int(config.get("min_batch_size", settings.CONNECTOR_MIN_BATCH_SIZE)),
+            max_size=int(config.get("max_batch_size", settings.CONNECTOR_MAX_BATCH_SIZE)),
+            target_latency_ms=target_latency_ms,
+            memory_limit_mb=float(config.get("memory_limit_mb", settings.CONNECTOR_MEMORY_LIMIT_MB))
+        )
+
+    def observe(self, records: int, seconds: float, transactions: int, failed_transactions: int = 0):
+        """
+        Adjust the batch sizes after a loaded batch
+
+        Args:
+            records: Records written in the batch
+            seconds: Time spent loading the batch
+            transactions: Transactions the batch was written in
+            failed_transactions: Transactions that failed (including retried attempts)
+        """
+        if records <= 0:
+            return
+
+        rss = process_rss_mb()
+        latency = seconds * 1000 / max(1, transactions)
+
+        with self._lock:
+            self.batches += 1
+            self.latency_ms = latency
+            self.rss_mb = rss
+            fetch_size, load_size = self.fetch_size, self.load_size
+            reason = None
+
+            if failed_transactions:
+                load_size = load_size // 2
+                reason = "transaction failures"
+            elif latency > self.target_latency_ms * 1.25:
+                load_size = int(load_size * max(0.5, self.target_latency_ms / latency))
+                reason = "slow commits"
+            elif latency < self.target_latency_ms * 0.75 and not self._memory_pressure(rss, 0.8):
+                load_size = int(load_size * self.GROWTH) + 1
+                reason = "fast commits"
+
+            if self._memory_wait:
+                self._memory_wait -= 1
+            elif self._memory_pressure(rss, 1.0):
+                fetch_size = fetch_size // 2
+                load_size = min(load_size, fetch_size)
+                self._memory_wait = self.cooldown
+                reason = "memory ceiling"
+            elif not self._memory_pressure(rss, 0.8) and not failed_transactions:
+                fetch_size = max(int(fetch_size * self.GROWTH) + 1, load_size)
+                reason = reason or "memory headroom"
+
+            fetch_size, load_size = self._clamp(fetch_size), self._clamp(load_size)
+            if (fetch_size, load_size) != (self.fetch_size, self.load_size):
+                if reason in ("transaction failures", "memory ceiling"):
+                    logger.info(
+                        f"Reducing batch sizes ({reason}): fetch {self.fetch_size} -> {fetch_size}, "
+                        f"load {self.load_size} -> {load_size}"
+                    )
+                self.fetch_size, self.load_size = fetch_size, load_size
+                self._record(reason)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Current sizes, last measurements and the history of changes"""
+        with self._lock:
+            return {
+                "fetch_size": self.fetch_size,
+                "load_size": self.load_size,
+                "batches": self.batches,
+                "latency_ms": round(self.latency_ms, 1) if self.latency_ms is not None else None,
+                "rss_mb": round(self.rss_mb, 1) if self.rss_mb is not None else None,
+                "target_latency_ms": self.target_latency_ms,
+                "memory_limit_mb": self.memory_limit_mb,
+                "history": list(self.history),
+            }
+
+    def _memory_pressure(self, rss: float, fraction: float) -> bool:
+        return bool(self.memory_limit_mb) and rss > self.memory_limit_mb * fraction
+
+    def _clamp(self, size: int) -> int:
+        return min(self.max_size, max(self.min_size, int(size)))
+
+    def _record(self, reason: str):
+        self.history.append({
+            "batch": self.batches,
+            "fetch_size": self.fetch_size,
+            "load_size": self.load_size,
+            "latency_ms": round(self.latency_ms, 1) if self.latency_ms is not None else None,
+            "rss_mb": round(self.rss_mb, 1) if self.rss_mb is not None else None,
+            "reason": reason,
+        })
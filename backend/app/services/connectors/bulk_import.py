@@ -0,0 +1,637 @@
+"""
+Neo4j Admin Import Writer
+Writes connector output as neo4j-admin database import CSV files for offline bulk loads
+"""
+from typing import Dict, Any, List, Optional, Tuple, Union
+from dataclasses import dataclass, field, asdict
+from datetime import date, datetime, time as dt_time, timezone
+import csv
+import gzip
+import json
+import os
+import threading
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.services.connectors.graph_loader import LoadResult, RecordError, ColumnarBatch, _to_property_value
+from app.utils.cypher import ENTITY_LABEL, is_valid_label
+from app.utils.ids import new_id, stored_property
+
+
+MANIFEST_FILE = "manifest.json"
+
+# Types widened into one another when a property changes type between records
+_NUMERIC_TYPES = ("long", "double")
+
+_SCALAR_TYPES = {
+    "string", "long", "double", "boolean", "date", "datetime", "localdatetime", "time", "localtime"
+}
+
+
+def _value_type(value: Any) -> str:
+    """neo4j-admin import type of a property value"""
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, int):
+        return "long"
+    if isinstance(value, float):
+        return "double"
+    if isinstance(value, datetime):
+        return "datetime" if value.tzinfo else "localdatetime"
+    if isinstance(value, date):
+        return "date"
+    if isinstance(value, dt_time):
+        return "time" if value.tzinfo else "localtime"
+    if isinstance(value, list):
+        element_types = {_value_type(v) for v in value if v is not None}
+        if len(element_types) == 1:
+            return f"{element_types.pop()}[]"
+        if element_types <= set(_NUMERIC_TYPES) and element_types:
+            return "double[]"
+        return "string[]"
+    return "string"
+
+
+def _widen(current: str, new: str) -> str:
+    """Common type of two property types"""
+    if current == new:
+        return current
+    array = current.endswith("[]")
+    if array != new.endswith("[]"):
+        return "string"
+    base = {current.rstrip("[]"), new.rstrip("[]")}
+    if base <= set(_NUMERIC_TYPES):
+        return "double[]" if array else "double"
+    return "string[]" if array else "string"
+
+
+def _format_value(value: Any, array_delimiter: str) -> Optional[str]:
+    """Render a property value as a CSV field"""
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (date, dt_time)):
+        return value.isoformat()
+    if isinstance(value, list):
+        return array_delimiter.join(
+            _format_value(v, array_delimiter) for v in value if v is not None
+        )
+    return str(value)
+
+
+@dataclass
+class ImportFileGroup:
+    """One header file and its data shards (paths relative to the import directory)"""
+    name: str
+    header: str
+    files: List[str] = field(default_factory=list)
+    rows: int = 0
+    label: Optional[str] = None  # node groups
+    id_space: Optional[str] = None
+    rel_type: Optional[str] = None  # relationship groups
+    start: Optional[Tuple[str, str]] = None  # (ID space, key property)
+    end: Optional[Tuple[str, str]] = None
+
+
+@dataclass
+class ImportManifest:
+    """Generated import files and the neo4j-admin command importing them"""
+    output_dir: str
+    nodes: List[ImportFileGroup] = field(default_factory=list)
+    relationships: List[ImportFileGroup] = field(default_factory=list)
+    id_spaces: Dict[str, str] = field(default_factory=dict)  # ID space -> key property
+    array_delimiter: str = ";"
+    multiline_fields: bool = False
+    exports: Dict[str, Dict[str, Any]] = field(default_factory=dict)  # connector id -> watermark, confirmed
+
+    @property
+    def node_count(self) -> int:
+        return sum(group.rows for group in self.nodes)
+
+    @property
+    def relationship_count(self) -> int:
+        return sum(group.rows for group in self.relationships)
+
+    def command(self, database: Optional[str] = None) -> List[str]:
+        """
+        neo4j-admin command importing the files into a new database
+
+        Args:
+            database: Target database (default: NEO4J_DATABASE)
+
+        Returns:
+            Command line arguments
+        """
+        def files(group: ImportFileGroup) -> str:
+            return ",".join(os.path.join(os.path.abspath(self.output_dir), path) for path in [group.header] + group.files)
+
+        args = ["neo4j-admin", "database", "import", "full"]
+        args += [f"--nodes={group.label}:{ENTITY_LABEL}={files(group)}" for group in self.nodes if group.files]
+        args += [f"--relationships={group.rel_type}={files(group)}" for group in self.relationships if group.files]
+        args += [
+            f"--array-delimiter={self.array_delimiter}",
+            "--skip-duplicate-nodes=true",
+            "--skip-bad-relationships=true",
+        ]
+        if self.multiline_fields:
+            args.append("--multiline-fields=true")
+        args.append(database or settings.NEO4J_DATABASE)
+        return args
+
+    def save(self):
+        with open(os.path.join(self.output_dir, MANIFEST_FILE), "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "nodes": [asdict(group) for group in self.nodes],
+                    "relationships": [asdict(group) for group in self.relationships],
+                    "id_spaces": self.id_spaces,
+                    "array_delimiter": self.array_delimiter,
+                    "multiline_fields": self.multiline_fields,
+                    "exports": self.exports,
+                },
+                f,
+                indent=2
+            )
+
+    @classmethod
+    def load(cls, output_dir: str) -> Optional["ImportManifest"]:
+        path = os.path.join(output_dir, MANIFEST_FILE)
+        if not os.path.exists(path):
+            return None
+
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+
+        def group(values: Dict[str, Any]) -> ImportFileGroup:
+            for name in ("start", "end"):
+                if values.get(name) is not None:
+                    values[name] = tuple(values[name])
+            return ImportFileGroup(**values)
+
+        return cls(
+            output_dir=output_dir,
+            nodes=[group(g) for g in data.get("nodes", [])],
+            relationships=[group(g) for g in data.get("relationships", [])],
+            id_spaces=data.get("id_spaces", {}),
+            array_delimiter=data.get("array_delimiter", ";"),
+            multiline_fields=data.get("multiline_fields", False),
+            exports=data.get("exports", {})
+        )
+
+
+class _GroupWriter:
+    """Writes the rows of one file group, rotating shards every shard_rows rows"""
+
+    def __init__(self, writer: "AdminImportWriter", group: ImportFileGroup, fixed: List[str], columns: List[Tuple[str, str]]):
+        self._writer = writer
+        self.group = group
+        self.columns = columns  # (property, type) after the fixed ID columns
+        self._types = dict(columns)
+        self._file = None
+        self._csv = None
+        self._shard_rows = 0
+
+        with open(os.path.join(writer.output_dir, group.header), "w", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerow(fixed + [
+                name if type_name == "string" else f"{name}:{type_name}" for name, type_name in columns
+            ])
+
+    def accepts(self, types: Dict[str, str]) -> bool:
+        """Whether properties of the given types fit the group's header"""
+        return all(
+            name in self._types and _widen(self._types[name], type_name) == self._types[name]
+            for name, type_name in types.items()
+        )
+
+    def write(self, fixed: List[str], properties: Dict[str, Any]):
+        if self._csv is None or self._shard_rows >= self._writer.shard_rows:
+            self._open_shard()
+
+        row = list(fixed)
+        for name, _ in self.columns:
+            row.append(self._writer._format(properties.get(name)))
+        self._csv.writerow(row)
+        self._shard_rows += 1
+        self.group.rows += 1
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._csv = None
+
+    def _open_shard(self):
+        self.close()
+        base = self.group.header[:-len("-header.csv")]
+        path = f"{base}-part{len(self.group.files) + 1:05d}.csv" + (".gz" if self._writer.compress else "")
+        full_path = os.path.join(self._writer.output_dir, path)
+        if self._writer.compress:
+            self._file = gzip.open(full_path, "wt", newline="", encoding="utf-8", compresslevel=self._writer.compress_level)
+        else:
+            self._file = open(full_path, "w", newline="", encoding="utf-8")
+        # Quote every value so that empty strings stay distinguishable from missing properties
+        self._csv = csv.writer(self._file, quoting=csv.QUOTE_NONNUMERIC)
+        self.group.files.append(path)
+        self._shard_rows = 0
+
+
+class AdminImportWriter:
+    """
+    Streams transformed connector batches into neo4j-admin import files
+
+    Drop-in replacement for GraphLoader.load(): instead of writing to Neo4j,
+    nodes and relationships are appended to sharded, optionally gzipped CSV
+    files. Each entity type is written to its own file groups with the
+    entity type as label and an ID space of the same name keyed by the
+    mapping's key_field (or the generated id when there is none).
+    Relationships reference the ID spaces of their end nodes.
+
+    A group's header is fixed once written; a record with new properties or
+    an incompatible property type starts a new group with the widened
+    header. Several connectors may export into the same directory one after
+    another: the manifest is reloaded and extended.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        key_fields: Optional[Dict[str, str]] = None,
+        shard_rows: Optional[int] = None,
+        compress: bool = True,
+        compress_level: int = 6,
+        array_delimiter: str = ";"
+    ):
+        """
+        Initialize writer
+
+        Args:
+            output_dir: Import directory (created if missing)
+            key_fields: Natural key property per entity type (a key "id"
+                refers to the source id, stored as source_id)
+            shard_rows: Rows per data file
+            compress: Write gzip-compressed data files
+            compress_level: gzip compression level
+            array_delimiter: Separator of array property elements
+        """
+        self.output_dir = output_dir
+        self.key_fields = {
+            entity_type: stored_property(key_field) for entity_type, key_field in (key_fields or {}).items()
+        }
+        self.shard_rows = shard_rows or settings.ADMIN_IMPORT_SHARD_ROWS
+        self.compress = compress
+        self.compress_level = compress_level
+        self._created_at = datetime.now(timezone.utc)
+        self._lock = threading.Lock()
+        self._nodes: Dict[str, _GroupWriter] = {}
+        self._relationships: Dict[tuple, _GroupWriter] = {}
+        self.relationships_unresolved = 0
+
+        os.makedirs(os.path.join(output_dir, "nodes"), exist_ok=True)
+        os.makedirs(os.path.join(output_dir, "relationships"), exist_ok=True)
+
+        self.manifest = ImportManifest.load(output_dir) or ImportManifest(output_dir=output_dir)
+        if self.manifest.array_delimiter != array_delimiter and (self.manifest.nodes or self.manifest.relationships):
+            raise ValueError(
+                f"Import directory {output_dir} uses array delimiter {self.manifest.array_delimiter!r}"
+            )
+        self.manifest.array_delimiter = array_delimiter
+
+    def load(
+        self,
+        records: Union[List[Dict[str, Any]], ColumnarBatch],
+        transaction_size: Optional[int] = None
+    ) -> LoadResult:
+        """
+        Append transformed records to the import files
+
+        Args:
+            records: Transformed records ({"type", "properties"}) or a columnar batch
+            transaction_size: Ignored; accepted for compatibility with GraphLoader.load
+
+        Returns:
+            Load result with per-record errors
+        """
+        if isinstance(records, ColumnarBatch):
+            records = self._columnar_records(records)
+
+        result = LoadResult()
+        with self._lock:
+            for index, record in enumerate(records):
+                try:
+                    self._write_record(record, result)
+                    result.loaded += 1
+                except ValueError as e:
+                    result.failed += 1
+                    result.errors.append(RecordError(index=index, error=str(e), record=record))
+        return result
+
+    def close(self) -> ImportManifest:
+        """
+        Close all data files and write the manifest
+
+        Returns:
+            Manifest of every file group in the import directory
+        """
+        with self._lock:
+            for group_writer in list(self._nodes.values()) + list(self._relationships.values()):
+                group_writer.close()
+            self._nodes.clear()
+            self._relationships.clear()
+            self.manifest.save()
+
+        logger.info(
+            f"Wrote neo4j-admin import files to {self.output_dir}: "
+            f"{self.manifest.node_count} nodes, {self.manifest.relationship_count} relationships"
+        )
+        return self.manifest
+
+    # ========== Records ==========
+
+    def _write_record(self, record: Dict[str, Any], result: LoadResult):
+        entity_type = record.get("type")
+        if not is_valid_label(entity_type):
+            raise ValueError(f"Invalid entity type: {entity_type!r}")
+
+        properties = record.get("properties")
+        if not isinstance(properties, dict):
+            raise ValueError("Record properties must be a mapping")
+
+        stored = {stored_property(key): _to_property_value(key, value) for key, value in properties.items()}
+        if len(stored) < len(properties):
+            raise ValueError("Records cannot carry both 'id' and 'source_id'")
+        properties = stored
+        properties["id"] = new_id()
+        if properties.get("created_at") is None:
+            properties["created_at"] = self._created_at
+
+        key_field = self.key_fields.get(entity_type) or "id"
+        node_id = self._format(properties.get(key_field))
+        if node_id is None:
+            raise ValueError(f"Missing natural key '{key_field}'")
+        self._register_id_space(entity_type, key_field)
+
+        # Validate all relationships before writing anything for the record
+        edges = []
+        for relationship in record.get("relationships", []):
+            spec = relationship["spec"]
+            target_type = spec["target_type"]
+            target_key = spec.get("target_key", "id")
+            if not all(is_valid_label(name) for name in (spec["type"], target_type)):
+                logger.warning(f"Invalid relationship {entity_type}-[{spec['type']}]->{target_type}")
+                result.relationships_unresolved += 1
+                continue
+            if self.manifest.id_spaces.get(target_type, target_key) != target_key:
+                # The target's ID space is keyed by another property
+                result.relationships_unresolved += 1
+                continue
+
+            edge_properties = {
+                name: _to_property_value(name, value)
+                for name, value in relationship.get("properties", {}).items()
+            }
+            source = (entity_type, key_field, node_id)
+            target = (target_type, target_key, self._format(relationship["target"]))
+            start, end = (target, source) if spec.get("direction") == "incoming" else (source, target)
+            edges.append((spec["type"], start, end, edge_properties))
+
+        self._node_group(entity_type, properties).write([node_id], properties)
+        for rel_type, start, end, edge_properties in edges:
+            self._relationship_group(rel_type, start[:2], end[:2], edge_properties).write(
+                [start[2], end[2]], edge_properties
+            )
+            result.relationships_loaded += 1
+
+    def _columnar_records(self, batch: ColumnarBatch) -> List[Dict[str, Any]]:
+        """Materialize a columnar batch as transformed records"""
+        records = [
+            {"type": batch.entity_type, "properties": row}
+            for row in batch.data.to_pylist()
+        ]
+        for index, edge in batch.relationships:
+            records[index].setdefault("relationships", []).append(edge)
+        return records
+
+    def _format(self, value: Any) -> Optional[str]:
+        formatted = _format_value(value, self.manifest.array_delimiter)
+        if formatted is not None and ("\n" in formatted or "\r" in formatted):
+            self.manifest.multiline_fields = True
+        return formatted
+
+    def _register_id_space(self, entity_type: str, key_field: str):
+        registered = self.manifest.id_spaces.setdefault(entity_type, key_field)
+        if registered != key_field:
+            raise ValueError(
+                f"ID space {entity_type} is keyed by '{registered}', cannot add nodes keyed by '{key_field}'"
+            )
+
+    # ========== File Groups ==========
+
+    def _node_group(self, label: str, properties: Dict[str, Any]) -> _GroupWriter:
+        types = {name: _value_type(value) for name, value in properties.items() if value is not None}
+        current = self._nodes.get(label)
+        if current is not None and current.accepts(types):
+            return current
+
+        columns = self._merge_columns(current, types)
+        group = ImportFileGroup(
+            name=label,
+            header=self._header_path("nodes", label),
+            label=label,
+            id_space=label
+        )
+        self.manifest.nodes.append(group)
+        self._nodes[label] = self._replace(current, _GroupWriter(self, group, [f":ID({label})"], columns))
+        return self._nodes[label]
+
+    def _relationship_group(
+        self,
+        rel_type: str,
+        start: Tuple[str, str],
+        end: Tuple[str, str],
+        properties: Dict[str, Any]
+    ) -> _GroupWriter:
+        types = {name: _value_type(value) for name, value in properties.items() if value is not None}
+        key = (rel_type, start, end)
+        current = self._relationships.get(key)
+        if current is not None and current.accepts(types):
+            return current
+
+        columns = self._merge_columns(current, types)
+        group = ImportFileGroup(
+            name=rel_type,
+            header=self._header_path("relationships", f"{start[0]}-{rel_type}-{end[0]}"),
+            rel_type=rel_type,
+            start=start,
+            end=end
+        )
+        self.manifest.relationships.append(group)
+        writer = _GroupWriter(self, group, [f":START_ID({start[0]})", f":END_ID({end[0]})"], columns)
+        self._relationships[key] = self._replace(current, writer)
+        return writer
+
+    def _merge_columns(self, current: Optional[_GroupWriter], types: Dict[str, str]) -> List[Tuple[str, str]]:
+        """Columns of the current group extended and widened by new property types"""
+        columns = dict(current.columns) if current is not None else {}
+        for name, type_name in types.items():
+            columns[name] = _widen(columns[name], type_name) if name in columns else type_name
+        return sorted(columns.items())
+
+    def _replace(self, current: Optional[_GroupWriter], new: _GroupWriter) -> _GroupWriter:
+        if current is not None:
+            current.close()
+        return new
+
+    def _header_path(self, kind: str, name: str) -> str:
+        index = len(self.manifest.nodes) + len(self.manifest.relationships)
+        return f"{kind}/{name}-{index:04d}-header.csv"
+
+
+# ========== Validation ==========
+
+@dataclass
+class ImportValidation:
+    """Result of validating an import directory"""
+    errors: List[str] = field(default_factory=list)
+    nodes: int = 0
+    relationships: int = 0
+    duplicate_nodes: int = 0
+    dangling_relationships: int = 0
+
+    @property
+    def valid(self) -> bool:
+        return not self.errors
+
+
+def _parse_value(value: str, type_name: str, array_delimiter: str):
+    """Parse a CSV field the way neo4j-admin would (raises ValueError)"""
+    if type_name.endswith("[]"):
+        element = type_name[:-2]
+        return [_parse_value(v, element, array_delimiter) for v in value.split(array_delimiter) if v != ""]
+    if type_name == "long":
+        return int(value)
+    if type_name == "double":
+        return float(value)
+    if type_name == "boolean":
+        if value not in ("true", "false"):
+            raise ValueError(f"invalid boolean {value!r}")
+        return value == "true"
+    if type_name == "date":
+        return date.fromisoformat(value)
+    if type_name in ("datetime", "localdatetime"):
+        return datetime.fromisoformat(value)
+    if type_name in ("time", "localtime"):
+        return dt_time.fromisoformat(value)
+    return value
+
+
+def _parse_header(path: str) -> List[Tuple[str, str, Optional[str]]]:
+    """Header columns as (name, type, ID space)"""
+    with open(path, newline="", encoding="utf-8") as f:
+        header = next(csv.reader(f), [])
+
+    columns = []
+    for column in header:
+        name, _, type_name = column.partition(":")
+        id_space = None
+        if type_name.endswith(")") and "(" in type_name:
+            type_name, _, id_space = type_name[:-1].partition("(")
+        type_name = type_name or "string"
+        if type_name not in ("ID", "START_ID", "END_ID") and type_name.rstrip("[]") not in _SCALAR_TYPES:
+            raise ValueError(f"unknown type {type_name!r} in column {column!r}")
+        columns.append((name, type_name, id_space))
+    return columns
+
+
+def validate_import_files(output_dir: str, max_errors: int = 100) -> ImportValidation:
+    """
+    Check generated import files without a database
+
+    Verifies that every header parses, every data row matches its header's
+    width and column types, node IDs are unique per ID space, and that
+    relationships reference existing ID spaces keyed by the expected
+    property. Duplicate nodes and relationships to unknown nodes are
+    counted rather than reported as errors, since the generated command
+    skips them.
+
+    Args:
+        output_dir: Import directory containing the manifest
+        max_errors: Stop collecting errors after this many
+
+    Returns:
+        Validation result
+    """
+    validation = ImportValidation()
+
+    def error(message: str):
+        if len(validation.errors) < max_errors:
+            validation.errors.append(message)
+
+    manifest = ImportManifest.load(output_dir)
+    if manifest is None:
+        error(f"No {MANIFEST_FILE} in {output_dir}")
+        return validation
+
+    ids: Dict[str, set] = {}
+
+    def rows(group: ImportFileGroup, expected: Dict[str, int]):
+        header_path = os.path.join(output_dir, group.header)
+        try:
+            columns = _parse_header(header_path)
+        except (OSError, ValueError) as e:
+            error(f"{group.header}: {e}")
+            return
+        for type_name, count in expected.items():
+            found = sum(1 for _, t, _ in columns if t == type_name)
+            if found != count:
+                error(f"{group.header}: expected {count} {type_name} column(s), found {found}")
+                return
+
+        for path in group.files:
+            full_path = os.path.join(output_dir, path)
+            opener = gzip.open if path.endswith(".gz") else open
+            try:
+                with opener(full_path, "rt", newline="", encoding="utf-8") as f:
+                    for line, row in enumerate(csv.reader(f), start=1):
+                        if len(row) != len(columns):
+                            error(f"{path}:{line}: {len(row)} fields, header has {len(columns)}")
+                            continue
+                        for (name, type_name, _), value in zip(columns, row):
+                            if value == "" or type_name in ("ID", "START_ID", "END_ID", "string"):
+                                continue
+                            try:
+                                _parse_value(value, type_name, manifest.array_delimiter)
+                            except ValueError:
+                                error(f"{path}:{line}: invalid {type_name} value {value!r} for {name}")
+                        yield columns, row
+            except (OSError, EOFError, gzip.BadGzipFile, csv.Error) as e:
+                error(f"{path}: {e}")
+
+    for group in manifest.nodes:
+        space = ids.setdefault(group.id_space, set())
+        for columns, row in rows(group, {"ID": 1}):
+            node_id = next(value for (_, t, _), value in zip(columns, row) if t == "ID")
+            if node_id in space:
+                validation.duplicate_nodes += 1
+            else:
+                space.add(node_id)
+            validation.nodes += 1
+
+    for group in manifest.relationships:
+        for space, key in (group.start, group.end):
+            if space not in ids:
+                error(f"{group.header}: unknown ID space {space}")
+            elif manifest.id_spaces.get(space) != key:
+                error(
+                    f"{group.header}: references {space} by '{key}', "
+                    f"but the ID space is keyed by '{manifest.id_spaces.get(space)}'"
+                )
+        start_ids = ids.get(group.start[0], set())
+        end_ids = ids.get(group.end[0], set())
+        for columns, row in rows(group, {"START_ID": 1, "END_ID": 1}):
+            values = {t: value for (_, t, _), value in zip(columns, row) if t in ("START_ID", "END_ID")}
+            if values["START_ID"] not in start_ids or values["END_ID"] not in end_ids:
+                validation.dangling_relationships += 1
+            validation.relationships += 1
+
+    return validation
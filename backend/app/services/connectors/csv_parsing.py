@@ -0,0 +1,148 @@
+"""
+CSV Chunk Parsing
+Type inference and chunk parsing for the CSV connector
+
+Runs inside process pool workers, so this module deliberately imports
+nothing from the application (no settings, no database clients).
+"""
+import csv
+import io
+import mmap
+from datetime import date, datetime
+from typing import Dict, Any, List, Optional, Tuple
+
+import pyarrow as pa
+
+
+def _parse_bool(value: str) -> bool:
+    lowered = value.strip().lower()
+    if lowered in ("true", "t", "yes", "y"):
+        return True
+    if lowered in ("false", "f", "no", "n"):
+        return False
+    raise ValueError(f"Not a boolean: {value!r}")
+
+
+# Inference order: the first type whose parser accepts every sampled value wins
+CONVERTERS = {
+    "integer": int,
+    "float": float,
+    "boolean": _parse_bool,
+    "date": date.fromisoformat,
+    "datetime": datetime.fromisoformat,
+    "string": str,
+}
+
+ARROW_TYPES = {
+    "integer": pa.int64(),
+    "float": pa.float64(),
+    "boolean": pa.bool_(),
+    "date": pa.date32(),
+    "datetime": pa.timestamp("us"),
+    "string": pa.string(),
+}
+
+
+def infer_type(values: List[str]) -> str:
+    """
+    Infer the column type from sampled non-empty values
+
+    Args:
+        values: Sampled raw values
+
+    Returns:
+        Type name (key of CONVERTERS)
+    """
+    for type_name, convert in CONVERTERS.items():
+        if type_name == "string":
+            break
+        try:
+            for value in values:
+                convert(value)
+        except ValueError:
+            continue
+        if values:
+            return type_name
+    return "string"
+
+
+def find_chunk_end(mm: mmap.mmap, start: int, chunk_size: int) -> int:
+    """
+    End offset of the line-aligned chunk starting at start
+
+    Args:
+        mm: Memory-mapped file
+        start: Chunk start offset (beginning of a line)
+        chunk_size: Target chunk size in bytes
+
+    Returns:
+        Offset just past the newline that ends the chunk (or the file size)
+    """
+    target = start + chunk_size
+    if target >= len(mm):
+        return len(mm)
+    newline = mm.find(b"\n", target)
+    return len(mm) if newline < 0 else newline + 1
+
+
+def parse_chunk(
+    path: str,
+    start: int,
+    end: int,
+    columns: List[str],
+    types: List[str],
+    options: Dict[str, Any]
+) -> Tuple[Any, int]:
+    """
+    Parse the rows in [start, end) of a CSV file
+
+    The worker maps the file itself, so only offsets travel to the process
+    and only parsed rows travel back.
+
+    Args:
+        path: File path
+        start: Chunk start offset
+        end: Chunk end offset
+        columns: Column names
+        types: Column type names
+        options: delimiter, quotechar, encoding, batch_format
+
+    Returns:
+        Tuple of (rows as list of dicts or Arrow record batch, number of rows)
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        text = mm[start:end].decode(options.get("encoding", "utf-8"))
+
+    reader = csv.reader(
+        io.StringIO(text, newline=""),
+        delimiter=options.get("delimiter", ","),
+        quotechar=options.get("quotechar", '"')
+    )
+    types = list(types)
+    converters = [CONVERTERS[t] for t in types]
+    values: List[List[Optional[Any]]] = [[] for _ in columns]
+    count = 0
+
+    for row in reader:
+        if not row:
+            continue
+        count += 1
+        for i, convert in enumerate(converters):
+            raw = row[i] if i < len(row) else ""
+            if raw == "":
+                values[i].append(None)
+                continue
+            try:
+                values[i].append(convert(raw))
+            except ValueError:
+                # The sample missed this value: keep the column as text
+                values[i] = [None if v is None else str(v) for v in values[i]]
+                values[i].append(raw)
+                types[i] = "string"
+                converters[i] = str
+
+    if options.get("batch_format") == "arrow":
+        arrays = [pa.array(column, type=ARROW_TYPES[t]) for column, t in zip(values, types)]
+        return pa.RecordBatch.from_arrays(arrays, names=columns), count
+
+    return [dict(zip(columns, row)) for row in zip(*values)], count
@@ -0,0 +1,173 @@
+"""
+Dead-Letter Store
+Persists records that failed to sync so they can be replayed later
+"""
+from typing import Dict, Any, List, Optional
+
+from app.core.logging import logger
+from app.services.connectors.sync_state import encode_state, decode_state
+
+
+STAGE_TRANSFORM = "transform"
+STAGE_LOAD = "load"
+
+
+class DeadLetterStore:
+    """
+    Dead-letter storage for a single connector
+
+    Like SyncStateStore, the connector_id is the primary key of the
+    DataConnector row; ad hoc connectors get a store that accepts nothing.
+    """
+
+    def __init__(self, connector_id: str):
+        """
+        Initialize store
+
+        Args:
+            connector_id: Connector identifier (DataConnector.id)
+        """
+        try:
+            self._pk: Optional[int] = int(connector_id)
+        except (TypeError, ValueError):
+            self._pk = None
+
+    @property
+    def available(self) -> bool:
+        return self._pk is not None
+
+    def add(self, stage: str, entries: List[Dict[str, Any]]) -> bool:
+        """
+        Store failed records
+
+        Args:
+            stage: STAGE_TRANSFORM (raw records) or STAGE_LOAD (transformed records)
+            entries: Dicts with "record" and "error"
+
+        Returns:
+            True if every record was stored
+        """
+        if not entries:
+            return True
+        if self._pk is None:
+            return False
+
+        from app.db.postgres_client import SessionLocal
+        from app.models.ontology import DeadLetterRecord
+
+        db = SessionLocal()
+        try:
+            db.add_all([
+                DeadLetterRecord(
+                    connector_id=self._pk,
+                    stage=stage,
+                    record=encode_state(entry["record"]),
+                    error=entry.get("error")
+                )
+                for entry in entries
+            ])
+            db.commit()
+            return True
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Failed to dead-letter {len(entries)} records for connector {self._pk}: {e}")
+            return False
+        finally:
+            db.close()
+
+    def pending(self, limit: int = 1000) -> List[Dict[str, Any]]:
+        """
+        Oldest records waiting for replay
+
+        Args:
+            limit: Maximum number of records
+
+        Returns:
+            Dicts with id, stage, record, error and attempts
+        """
+        if self._pk is None:
+            return []
+
+        from app.db.postgres_client import SessionLocal
+        from app.models.ontology import DeadLetterRecord
+
+        db = SessionLocal()
+        try:
+            rows = db.query(DeadLetterRecord).filter(
+                DeadLetterRecord.connector_id == self._pk,
+                DeadLetterRecord.status == "pending"
+            ).order_by(DeadLetterRecord.id).limit(limit).all()
+            return [
+                {
+                    "id": row.id,
+                    "stage": row.stage,
+                    "record": decode_state(row.record),
+                    "error": row.error,
+                    "attempts": row.attempts
+                }
+                for row in rows
+            ]
+        finally:
+            db.close()
+
+    def resolve(self, replayed: List[int], failed: Dict[int, str]):
+        """
+        Record the outcome of a replay
+
+        Args:
+            replayed: Ids of records that are now in the graph
+            failed: Error message per id of records that failed again
+        """
+        if self._pk is None:
+            return
+
+        from app.db.postgres_client import SessionLocal
+        from app.models.ontology import DeadLetterRecord
+
+        db = SessionLocal()
+        try:
+            if replayed:
+                db.query(DeadLetterRecord).filter(DeadLetterRecord.id.in_(replayed)).update(
+                    {"status": "replayed"}, synchronize_session=False
+                )
+            for record_id, error in failed.items():
+                db.query(DeadLetterRecord).filter(DeadLetterRecord.id == record_id).update(
+                    {"error": error, "attempts": DeadLetterRecord.attempts + 1},
+                    synchronize_session=False
+                )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def discard(self, record_ids: List[int]) -> int:
+        """
+        Mark records as discarded so they are no longer replayed
+
+        Args:
+            record_ids: Dead-letter record ids
+
+        Returns:
+            Number of records discarded
+        """
+        if self._pk is None or not record_ids:
+            return 0
+
+        from app.db.postgres_client import SessionLocal
+        from app.models.ontology import DeadLetterRecord
+
+        db = SessionLocal()
+        try:
+            count = db.query(DeadLetterRecord).filter(
+                DeadLetterRecord.connector_id == self._pk,
+                DeadLetterRecord.id.in_(record_ids)
+            ).update({"status": "discarded"}, synchronize_session=False)
+            db.commit()
+            return count
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
@@ -0,0 +1,621 @@
+"""
+Entity Deduplication
+Blocking-key and MinHash/LSH duplicate detection for records entering the graph
+"""
+from typing import Dict, Any, List, Optional, Set, Tuple
+from dataclasses import dataclass
+import hashlib
+import json
+import random
+import re
+import threading
+import unicodedata
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.utils.cypher import quote_identifier
+
+
+ACTION_LINK = "link"
+ACTION_MERGE = "merge"
+
+# Largest prime below 2**32; with 31-bit coefficients and 32-bit hashes the
+# permutations a * h + b stay within uint64
+_MERSENNE_PRIME = np.uint64(4294967291)
+
+# Prefix of the MinHash band keys; blocking key names may not start with it
+LSH_PREFIX = "lsh"
+
+_SOUNDEX_CODES = {
+    **dict.fromkeys("bfpv", "1"),
+    **dict.fromkeys("cgjkqsxz", "2"),
+    **dict.fromkeys("dt", "3"),
+    "l": "4",
+    **dict.fromkeys("mn", "5"),
+    "r": "6",
+}
+
+
+def _fold(value: Any) -> str:
+    """Lowercase ASCII form of a value (accents removed)"""
+    text = unicodedata.normalize("NFKD", str(value))
+    return text.encode("ascii", "ignore").decode("ascii").lower()
+
+
+def soundex(word: str) -> str:
+    """
+    American Soundex code of a word
+
+    Args:
+        word: Word to encode
+
+    Returns:
+        Four character code (e.g. "R163" for Robert and Rupert), or "" if
+        the word contains no letters
+    """
+    letters = [c for c in _fold(word) if "a" <= c <= "z"]
+    if not letters:
+        return ""
+
+    code = letters[0].upper()
+    previous = _SOUNDEX_CODES.get(letters[0])
+    for letter in letters[1:]:
+        digit = _SOUNDEX_CODES.get(letter)
+        if digit and digit != previous:
+            code += digit
+            if len(code) == 4:
+                break
+        # h and w do not separate letters with the same code, vowels do
+        if letter not in "hw":
+            previous = digit
+    return code.ljust(4, "0")
+
+
+def normalize_email(value: Any) -> Optional[str]:
+    """Lowercased address without surrounding whitespace and +tags"""
+    text = str(value).strip().lower()
+    local, at, domain = text.partition("@")
+    if not at or not local or not domain:
+        return None
+    return f"{local.split('+', 1)[0]}@{domain}"
+
+
+def normalize_account(value: Any) -> Optional[str]:
+    """Account or reference number with separators removed"""
+    text = re.sub(r"[^0-9a-z]", "", _fold(value))
+    return text.upper() or None
+
+
+def normalize_phonetic(value: Any) -> Optional[str]:
+    """Soundex codes of the words of a name, independent of word order"""
+    codes = sorted(filter(None, (soundex(word) for word in re.findall(r"[a-z]+", _fold(value)))))
+    return "-".join(codes) or None
+
+
+def normalize_text(value: Any) -> Optional[str]:
+    """Lowercased text with collapsed whitespace"""
+    text = " ".join(_fold(value).split())
+    return text or None
+
+
+NORMALIZERS = {
+    "email": normalize_email,
+    "account": normalize_account,
+    "phonetic": normalize_phonetic,
+    "text": normalize_text,
+}
+
+
+def shingles(values: List[Any], size: int = 3) -> Set[str]:
+    """
+    Character shingles of the normalized values
+
+    Args:
+        values: Property values to compare
+        size: Shingle length
+
+    Returns:
+        Set of shingles (empty if all values are empty)
+    """
+    result = set()
+    for value in values:
+        text = normalize_text(value) if value is not None else None
+        if not text:
+            continue
+        if len(text) <= size:
+            result.add(text)
+        else:
+            result.update(text[i:i + size] for i in range(len(text) - size + 1))
+    return result
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    """Jaccard similarity of two shingle sets"""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class MinHasher:
+    """
+    MinHash signatures with LSH banding
+
+    Records whose shingle sets have Jaccard similarity s share at least one
+    band with probability 1 - (1 - s^r)^b (b bands of r rows), so band
+    hashes serve as blocking keys that find similar records without
+    comparing every pair.
+    """
+
+    def __init__(self, permutations: int = 64, bands: int = 16, seed: int = 1):
+        """
+        Args:
+            permutations: Signature length
+            bands: Number of LSH bands (permutations are split evenly)
+            seed: Seed of the hash permutations
+        """
+        self.bands = max(1, min(bands, permutations))
+        self.rows = max(1, permutations // self.bands)
+        self.permutations = self.bands * self.rows
+
+        rng = random.Random(seed)
+        self._a = np.array([rng.randrange(1, 1 << 31) for _ in range(self.permutations)], dtype=np.uint64)
+        self._b = np.array([rng.randrange(0, 1 << 31) for _ in range(self.permutations)], dtype=np.uint64)
+
+    def signature(self, tokens: Set[str]) -> np.ndarray:
+        """
+        MinHash signature of a token set
+
+        Args:
+            tokens: Non-empty token set
+
+        Returns:
+            Array of permutations minima
+        """
+        hashes = np.array(
+            [int.from_bytes(hashlib.blake2b(t.encode(), digest_size=4).digest(), "little") for t in tokens],
+            dtype=np.uint64
+        )
+        permuted = (np.outer(hashes, self._a) + self._b) % _MERSENNE_PRIME
+        return permuted.min(axis=0)
+
+    def band_keys(self, tokens: Set[str]) -> List[str]:
+        """
+        LSH band hashes of a token set
+
+        Args:
+            tokens: Token set
+
+        Returns:
+            One key per band ("lsh<band>:<hash>"), empty for an empty set
+        """
+        if not tokens:
+            return []
+        signature = self.signature(tokens)
+        return [
+            f"{LSH_PREFIX}{band}:" + hashlib.blake2b(
+                signature[band * self.rows:(band + 1) * self.rows].tobytes(), digest_size=8
+            ).hexdigest()
+            for band in range(self.bands)
+        ]
+
+
+@dataclass
+class BlockingKey:
+    """A property whose normalized value groups candidate duplicates"""
+    name: str
+    property: str
+    normalizer: str = "text"
+    exact: bool = False  # sharing the key alone makes records duplicates
+
+    def key(self, properties: Dict[str, Any]) -> Optional[str]:
+        value = properties.get(self.property)
+        if value is None:
+            return None
+        normalized = NORMALIZERS[self.normalizer](value)
+        return f"{self.name}:{normalized}" if normalized else None
+
+
+@dataclass
+class DuplicateMatch:
+    """A record identified as a duplicate of an existing entity"""
+    index: int  # position of the duplicate in the batch
+    key: Any  # natural key of the duplicate record
+    canonical: Any  # natural key of the entity it duplicates
+    score: float
+    rule: str  # blocking key name, or "similarity"
+
+
+class BlockIndex:
+    """
+    Persistent block index of one entity type
+
+    Maps block keys to the natural keys of the canonical entities carrying
+    them. It is shared by every connector loading the entity type, so
+    duplicates are found across sources, and only grows by the block keys
+    of newly loaded records.
+    """
+
+    def __init__(self, entity_type: str, max_block_size: int):
+        """
+        Args:
+            entity_type: Entity type the index covers
+            max_block_size: Blocks with more members are ignored (too
+                unspecific to be worth comparing against)
+        """
+        self.entity_type = entity_type
+        self.max_block_size = max_block_size
+
+    def lookup(self, block_keys: List[str]) -> Tuple[Dict[str, List[Any]], int]:
+        """
+        Members of the given blocks
+
+        Args:
+            block_keys: Block keys to look up
+
+        Returns:
+            Tuple of (entity keys per block, number of oversized blocks skipped)
+        """
+        if not block_keys:
+            return {}, 0
+
+        from sqlalchemy import func
+        from app.db.postgres_client import SessionLocal
+        from app.models.ontology import DedupBlockEntry
+
+        db = SessionLocal()
+        try:
+            rank = func.row_number().over(
+                partition_by=DedupBlockEntry.block_key, order_by=DedupBlockEntry.id
+            ).label("rank")
+            members = db.query(DedupBlockEntry.block_key, DedupBlockEntry.entity_key, rank).filter(
+                DedupBlockEntry.entity_type == self.entity_type,
+                DedupBlockEntry.block_key.in_(block_keys)
+            ).subquery()
+            rows = db.query(members.c.block_key, members.c.entity_key).filter(
+                members.c.rank <= self.max_block_size + 1
+            ).all()
+        finally:
+            db.close()
+
+        blocks: Dict[str, List[Any]] = {}
+        for block_key, entity_key in rows:
+            blocks.setdefault(block_key, []).append(json.loads(entity_key))
+        oversized = [key for key, keys in blocks.items() if len(keys) > self.max_block_size]
+        for key in oversized:
+            del blocks[key]
+        return blocks, len(oversized)
+
+    def add(self, entries: List[Tuple[str, Any]]) -> int:
+        """
+        Register entities in blocks
+
+        Args:
+            entries: (block key, entity key) pairs; pairs already indexed are ignored
+
+        Returns:
+            Number of distinct pairs submitted
+        """
+        if not entries:
+            return 0
+
+        from sqlalchemy.dialects.postgresql import insert
+        from app.db.postgres_client import SessionLocal
+        from app.models.ontology import DedupBlockEntry
+
+        rows = sorted({(block_key, json.dumps(entity_key)) for block_key, entity_key in entries})
+        db = SessionLocal()
+        try:
+            db.execute(
+                insert(DedupBlockEntry).values([
+                    {"entity_type": self.entity_type, "block_key": block_key, "entity_key": entity_key}
+                    for block_key, entity_key in rows
+                ]).on_conflict_do_nothing(index_elements=["entity_type", "block_key", "entity_key"])
+            )
+            db.commit()
+            return len(rows)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+
+class Deduplicator:
+    """
+    Ingest stage detecting duplicates of one entity type
+
+    Every record is assigned block keys: normalized values of the
+    configured blocking properties (email, account number, name phonetics,
+    ...) and, if a similarity is configured, MinHash/LSH band hashes over
+    the selected properties. A record is only compared with the entities
+    sharing one of its blocks, looked up in the persistent block index and
+    among the earlier records of its batch, so the cost per record depends
+    on block sizes rather than on the number of entities.
+
+    Sharing an exact blocking key (e.g. the same email) makes two records
+    duplicates; other candidates must reach the Jaccard threshold over the
+    similarity properties. Duplicates are linked to the canonical entity
+    with SAME_AS relationships, or merged into it: the record is rewritten
+    to upsert the canonical entity, filling only properties it lacks.
+    """
+
+    def __init__(
+        self,
+        entity_type: str,
+        key_field: str,
+        blocking_keys: List[BlockingKey],
+        action: str = ACTION_LINK,
+        similarity_properties: Optional[List[str]] = None,
+        threshold: float = 0.8,
+        shingle_size: int = 3,
+        permutations: int = 64,
+        bands: int = 16,
+        max_block_size: int = 1000,
+        database: Optional[str] = None
+    ):
+        """
+        Args:
+            entity_type: Entity type to deduplicate
+            key_field: Natural key of the entity type
+            blocking_keys: Blocking key definitions
+            action: ACTION_LINK or ACTION_MERGE
+            similarity_properties: Properties compared by MinHash/Jaccard
+            threshold: Jaccard similarity at which candidates are duplicates
+            shingle_size: Character shingle length
+            permutations: MinHash signature length
+            bands: LSH bands
+            max_block_size: Blocks with more members are skipped
+            database: Target Neo4j database
+        """
+        if action not in (ACTION_LINK, ACTION_MERGE):
+            raise ValueError(f"Unknown dedup action: {action!r}")
+        for blocking_key in blocking_keys:
+            # The name prefixes the block keys, which _score splits at the first colon
+            if not blocking_key.name or ":" in blocking_key.name:
+                raise ValueError(f"Invalid blocking key name: {blocking_key.name!r}")
+            if blocking_key.name.startswith(LSH_PREFIX):
+                raise ValueError(
+                    f"Blocking key name {blocking_key.name!r} uses the prefix {LSH_PREFIX!r} reserved for MinHash bands"
+                )
+            if blocking_key.normalizer not in NORMALIZERS:
+                raise ValueError(f"Unknown normalizer for blocking key {blocking_key.name}: {blocking_key.normalizer!r}")
+
+        self.entity_type = entity_type
+        self.key_field = key_field
+        self.blocking_keys = blocking_keys
+        self.action = action
+        self.similarity_properties = similarity_properties or []
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.database = database
+        self.minhash = MinHasher(permutations, bands) if self.similarity_properties else None
+        self.index = BlockIndex(entity_type, max_block_size)
+        self._exact = {key.name for key in blocking_keys if key.exact}
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Dict[str, Any],
+        mapping: Dict[str, Any],
+        key_fields: Dict[str, str]
+    ) -> Optional["Deduplicator"]:
+        """
+        Build the deduplicator of a connector
+
+        Args:
+            config: Connector configuration; deduplication is configured under "dedup"
+            mapping: Schema mapping (default entity type)
+            key_fields: Natural key property per entity type
+
+        Returns:
+            Deduplicator, or None if deduplication is not configured
+        """
+        dedup = config.get("dedup")
+        if not dedup:
+            return None
+
+        entity_type = dedup.get("entity_type") or mapping.get("entity_type")
+        key_field = key_fields.get(entity_type)
+        if not key_field:
+            logger.warning(f"Deduplication of {entity_type} disabled: the entity type has no key field")
+            return None
+
+        similarity = dedup.get("similarity") or {}
+        return cls(
+            entity_type=entity_type,
+            key_field=key_field,
+            blocking_keys=[BlockingKey(**spec) for spec in dedup.get("blocking_keys", [])],
+            action=dedup.get("action", ACTION_LINK),
+            similarity_properties=similarity.get("properties"),
+            threshold=float(similarity.get("threshold", 0.8)),
+            shingle_size=int(similarity.get("shingle_size", 3)),
+            permutations=int(similarity.get("permutations", settings.DEDUP_MINHASH_PERMUTATIONS)),
+            bands=int(similarity.get("bands", settings.DEDUP_LSH_BANDS)),
+            max_block_size=int(dedup.get("max_block_size", settings.DEDUP_MAX_BLOCK_SIZE)),
+            database=config.get("graph_database")
+        )
+
+    def reset_stats(self):
+        """Reset the counters reported by get_stats"""
+        self.records_checked = 0
+        self.comparisons = 0
+        self.duplicates = 0
+        self.blocks_skipped = 0
+        self.index_entries = 0
+        self.rules: Dict[str, int] = {}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters since the last reset"""
+        return {
+            "entity_type": self.entity_type,
+            "action": self.action,
+            "records_checked": self.records_checked,
+            "comparisons": self.comparisons,
+            "duplicates": self.duplicates,
+            "by_rule": dict(self.rules),
+            "oversized_blocks_skipped": self.blocks_skipped,
+            "index_entries_added": self.index_entries,
+        }
+
+    def prepare(self, records: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[DuplicateMatch]]:
+        """
+        Detect the duplicates in a batch of transformed records
+
+        In merge mode duplicates are rewritten onto their canonical entity;
+        the returned list keeps the positions of the input. The block index
+        is updated with the block keys of the batch.
+
+        Args:
+            records: Transformed records
+
+        Returns:
+            Tuple of (records to load, detected duplicates)
+        """
+        # Block lookups and index updates of concurrent load workers must
+        # not interleave, or duplicates within two batches go unnoticed
+        with self._lock:
+            candidates = []
+            for index, record in enumerate(records):
+                if record.get("type") != self.entity_type:
+                    continue
+                properties = record.get("properties") or {}
+                key = properties.get(self.key_field)
+                if key is None:
+                    continue
+                tokens = shingles([properties.get(name) for name in self.similarity_properties], self.shingle_size)
+                blocks = [block for block in (spec.key(properties) for spec in self.blocking_keys) if block]
+                if self.minhash is not None:
+                    blocks += self.minhash.band_keys(tokens)
+                if blocks:
+                    candidates.append((index, key, blocks, tokens))
+            if not candidates:
+                return records, []
+
+            indexed, skipped = self.index.lookup(sorted({block for _, _, blocks, _ in candidates for block in blocks}))
+            known = self._fetch_properties({key for keys in indexed.values() for key in keys})
+
+            batch_blocks: Dict[str, List[Any]] = {}
+            batch_properties: Dict[Any, Dict[str, Any]] = {}
+            canonical_of: Dict[Any, Any] = {}
+            matches = []
+            entries = []
+            comparisons = 0
+
+            for index, key, blocks, tokens in candidates:
+                best: Optional[Tuple[float, str, Any]] = None
+                compared = set()
+                for block in blocks:
+                    for other in indexed.get(block, []) + batch_blocks.get(block, []):
+                        other = canonical_of.get(other, other)
+                        if other == key or (other, block) in compared:
+                            continue
+                        compared.add((other, block))
+                        score, rule = self._score(block, tokens, known.get(other) or batch_properties.get(other))
+                        comparisons += 1
+                        if score and (best is None or score > best[0]):
+                            best = (score, rule, other)
+
+                canonical = key
+                if best is not None:
+                    canonical = best[2]
+                    canonical_of[key] = canonical
+                    matches.append(DuplicateMatch(index, key, canonical, round(best[0], 4), best[1]))
+                else:
+                    batch_properties[key] = records[index]["properties"]
+                for block in blocks:
+                    members = batch_blocks.setdefault(block, [])
+                    if canonical not in members:
+                        members.append(canonical)
+                    entries.append((block, canonical))
+
+            if self.action == ACTION_MERGE and matches:
+                records = list(records)
+                for match in matches:
+                    target = known.get(match.canonical) or batch_properties.get(match.canonical) or {}
+                    record = records[match.index]
+                    properties = {
+                        name: value for name, value in record["properties"].items()
+                        if target.get(name) is None
+                    }
+                    properties[self.key_field] = match.canonical
+                    records[match.index] = {**record, "properties": properties}
+
+            added = self.index.add(entries)
+            self.records_checked += len(candidates)
+            self.comparisons += comparisons
+            self.duplicates += len(matches)
+            self.blocks_skipped += skipped
+            self.index_entries += added
+            for match in matches:
+                self.rules[match.rule] = self.rules.get(match.rule, 0) + 1
+
+        return records, matches
+
+    def link(self, matches: List[DuplicateMatch], chunk_size: int = 1000) -> int:
+        """
+        Write SAME_AS relationships from duplicates to their canonical entity
+
+        Args:
+            matches: Duplicates whose records were loaded
+            chunk_size: Relationships per transaction
+
+        Returns:
+            Number of relationships written
+        """
+        if self.action != ACTION_LINK or not matches:
+            return 0
+
+        from app.db.neo4j_client import neo4j_client
+
+        label = quote_identifier(self.entity_type)
+        key = quote_identifier(self.key_field)
+        query = f"""
+        UNWIND $pairs AS pair
+        MATCH (d:{label} {{{key}: pair.key}})
+        MATCH (c:{label} {{{key}: pair.canonical}})
+        MERGE (d)-[r:SAME_AS]->(c)
+        SET r.score = pair.score, r.rule = pair.rule, r.detected_at = datetime()
+        """
+        pairs = [
+            {"key": m.key, "canonical": m.canonical, "score": m.score, "rule": m.rule}
+            for m in matches
+        ]
+        for start in range(0, len(pairs), chunk_size):
+            neo4j_client.execute_write(query, {"pairs": pairs[start:start + chunk_size]}, database=self.database)
+        return len(pairs)
+
+    def _score(self, block: str, tokens: Set[str], other: Optional[Dict[str, Any]]) -> Tuple[float, str]:
+        """Similarity of a record to a candidate sharing the given block"""
+        if other is None:
+            # Indexed entity that no longer exists in the graph
+            return 0.0, ""
+        rule = block.split(":", 1)[0]
+        if rule in self._exact:
+            return 1.0, rule
+        if not self.similarity_properties:
+            return 0.0, ""
+        score = jaccard(
+            tokens,
+            shingles([other.get(name) for name in self.similarity_properties], self.shingle_size)
+        )
+        return (score, "similarity") if score >= self.threshold else (0.0, "")
+
+    def _fetch_properties(self, keys: Set[Any]) -> Dict[Any, Dict[str, Any]]:
+        """Current properties of indexed entities, by natural key"""
+        if not keys:
+            return {}
+
+        from app.db.neo4j_client import neo4j_client
+
+        label = quote_identifier(self.entity_type)
+        key = quote_identifier(self.key_field)
+        rows = neo4j_client.execute_read(
+            f"UNWIND $keys AS key MATCH (n:{label} {{{key}: key}}) RETURN key, properties(n) AS properties",
+            {"keys": list(keys)},
+            database=self.database
+        )
+        return {row["key"]: row["properties"] for row in rows}
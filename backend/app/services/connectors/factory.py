@@ -0,0 +1,64 @@
+"""
+Connector Factory
+Creates connector instances from DataConnector configuration rows
+"""
+from typing import Dict, Type
+
+from app.services.connectors.base_connector import BaseConnector
+
+
+def _connector_types() -> Dict[str, Type[BaseConnector]]:
+    # Imported lazily: each connector pulls in its own client library
+    from app.services.connectors.postgresql_connector import PostgreSQLConnector
+    from app.services.connectors.csv_connector import CSVConnector
+    from app.services.connectors.parquet_connector import ParquetConnector
+    from app.services.connectors.kafka_connector import KafkaConnector
+    from app.services.connectors.rest_connector import RESTConnector
+
+    return {
+        "postgresql": PostgreSQLConnector,
+        "csv": CSVConnector,
+        "tsv": CSVConnector,
+        "parquet": ParquetConnector,
+        "arrow": ParquetConnector,
+        "kafka": KafkaConnector,
+        "rest": RESTConnector,
+    }
+
+
+def connector_class(connector_type: str) -> Type[BaseConnector]:
+    """
+    Connector class for a connector type
+
+    Args:
+        connector_type: DataConnector.type
+
+    Returns:
+        Connector class
+
+    Raises:
+        ValueError: If the connector type is not supported
+    """
+    connector_types = _connector_types()
+    if connector_type not in connector_types:
+        raise ValueError(
+            f"Unsupported connector type: {connector_type} "
+            f"(supported: {', '.join(sorted(connector_types))})"
+        )
+    return connector_types[connector_type]
+
+
+def create_connector(connector) -> BaseConnector:
+    """
+    Create the connector for a DataConnector row
+
+    Args:
+        connector: DataConnector model instance
+
+    Returns:
+        Connector instance
+
+    Raises:
+        ValueError: If the connector type is not supported
+    """
+    return connector_class(connector.type)(str(connector.id), connector.config or {}, connector.mapping or {})
@@ -0,0 +1,725 @@
+"""
+Graph Bulk Loader
+Writes transformed connector batches to Neo4j with batched UNWIND statements
+"""
+from typing import Dict, Any, List, Optional, Callable, Tuple, Union
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import threading
+import time
+from datetime import date, datetime, time as dt_time
+from decimal import Decimal
+from uuid import UUID
+
+from neo4j.exceptions import TransientError, ServiceUnavailable, SessionExpired
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.services.connectors.backpressure import write_latency_monitor
+from app.utils.cypher import ENTITY_LABEL, is_valid_label, quote_identifier
+from app.utils.ids import new_ids, stored_property
+
+
+_PROPERTY_TYPES = (str, int, float, bool, date, datetime, dt_time)
+
+_ARROW_PROPERTY_TYPES = (
+    pa.types.is_integer, pa.types.is_floating, pa.types.is_boolean,
+    pa.types.is_string, pa.types.is_large_string, pa.types.is_temporal,
+    pa.types.is_null, pa.types.is_list, pa.types.is_large_list,
+)
+
+
+@dataclass
+class RecordError:
+    """Load error for a single record"""
+    index: int
+    error: str
+    record: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class LoadResult:
+    """Result of a bulk graph load"""
+    loaded: int = 0
+    failed: int = 0
+    unchanged: int = 0
+    relationships_loaded: int = 0
+    relationships_unresolved: int = 0
+    paused_seconds: float = 0.0  # time writes waited on ingestion backpressure
+    errors: List[RecordError] = field(default_factory=list)
+
+
+@dataclass
+class ColumnarBatch:
+    """
+    Transformed records of one entity type in column-major form
+
+    Columns are named after the target properties. The loader sends them to
+    Neo4j as one list per column and assembles the rows inside the UNWIND
+    statement, so no per-record Python dict is built.
+    """
+    entity_type: str
+    data: pa.RecordBatch
+    relationships: List[Tuple[int, Dict[str, Any]]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return self.data.num_rows
+
+    def record(self, index: int) -> Dict[str, Any]:
+        """Materialize a single transformed record (for error reporting)"""
+        return {
+            "type": self.entity_type,
+            "properties": {
+                name: self.data.column(i)[index].as_py()
+                for i, name in enumerate(self.data.schema.names)
+            }
+        }
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Materialize all transformed records, including their relationships"""
+        records = [{"type": self.entity_type, "properties": row} for row in self.data.to_pylist()]
+        for index, relationship in self.relationships:
+            records[index].setdefault("relationships", []).append(relationship)
+        return records
+
+
+class NodeIdCache:
+    """
+    Thread-safe LRU cache of natural key -> node element id
+
+    Relationship endpoints are resolved through this cache, so a node
+    referenced by many edges is looked up in the graph only once.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max(1, max_size)
+        self._entries: "OrderedDict[tuple, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(self, label: str, key_field: str, values: List[Any]) -> Dict[Any, str]:
+        """Cached node ids of the given key values"""
+        found = {}
+        with self._lock:
+            for value in values:
+                node_id = self._entries.get((label, key_field, value))
+                if node_id is None:
+                    self.misses += 1
+                    continue
+                self._entries.move_to_end((label, key_field, value))
+                found[value] = node_id
+                self.hits += 1
+        return found
+
+    def put_many(self, label: str, key_field: str, ids: Dict[Any, str]):
+        with self._lock:
+            for value, node_id in ids.items():
+                self._entries[(label, key_field, value)] = node_id
+                self._entries.move_to_end((label, key_field, value))
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, label: str, key_field: str, values: List[Any]):
+        with self._lock:
+            for value in values:
+                self._entries.pop((label, key_field, value), None)
+
+
+class GraphLoader:
+    """
+    Bulk loader for transformed connector records
+
+    Records are grouped by entity type and written with one parameterized
+    UNWIND statement per transaction, so a batch of N records costs
+    ceil(N / transaction_size) round trips instead of N.
+
+    Entity types with a natural key are upserted with MERGE on that key,
+    backed by a uniqueness constraint, and only nodes whose property values
+    differ from the incoming record are written.
+
+    Relationships declared by the mapping are written in a second UNWIND
+    pass once the nodes exist. Both endpoints are resolved from their
+    natural keys to element ids through an in-process cache (cache misses
+    are looked up in batches via the entity id index or the key
+    constraint's index), so each edge costs two id seeks instead of a scan.
+    """
+
+    def __init__(
+        self,
+        transaction_size: Optional[int] = None,
+        key_fields: Optional[Dict[str, str]] = None,
+        database: Optional[str] = None
+    ):
+        """
+        Initialize loader
+
+        Args:
+            transaction_size: Maximum number of records written per transaction
+            key_fields: Natural key property per entity type (a key "id"
+                refers to the source id, stored as source_id)
+            database: Target Neo4j database (defaults to NEO4J_DATABASE)
+        """
+        self.transaction_size = max(1, transaction_size or settings.GRAPH_LOAD_TRANSACTION_SIZE)
+        self.key_fields = {
+            entity_type: stored_property(key_field) for entity_type, key_field in (key_fields or {}).items()
+        }
+        self.database = database
+        self._constrained_keys = set()
+        self.node_ids = NodeIdCache(settings.GRAPH_NODE_CACHE_SIZE)
+        self.failed_transactions = 0
+        self._pauses = threading.local()
+
+    def load(
+        self,
+        records: Union[List[Dict[str, Any]], ColumnarBatch],
+        transaction_size: Optional[int] = None
+    ) -> LoadResult:
+        """
+        Load transformed records into the graph
+
+        Args:
+            records: Transformed records ({"type", "properties"}) or a columnar batch
+            transaction_size: Records per transaction for this call (default:
+                the loader's transaction_size)
+
+        Returns:
+            Load result with per-record errors
+        """
+        size = max(1, transaction_size or self.transaction_size)
+        self._pauses.seconds = 0.0
+        if isinstance(records, ColumnarBatch):
+            result = self._load_columnar(records, size)
+        else:
+            result = self._load_records(records, size)
+        result.paused_seconds = self._pauses.seconds
+        return result
+
+    def _load_records(self, records: List[Dict[str, Any]], size: int) -> LoadResult:
+        """Load record dicts, grouped by entity type"""
+        result = LoadResult()
+        groups: Dict[str, List[int]] = {}
+        rows_by_index: Dict[int, Dict[str, Any]] = {}
+
+        for index, record in enumerate(records):
+            try:
+                rows_by_index[index] = self._prepare_record(record)
+            except ValueError as e:
+                result.failed += 1
+                result.errors.append(RecordError(index=index, error=str(e), record=record))
+                continue
+            groups.setdefault(record["type"], []).append(index)
+
+        for entity_type, indices in groups.items():
+            key_field = self.key_fields.get(entity_type)
+            if key_field:
+                self._ensure_key_constraint(entity_type, key_field)
+            query = self._build_node_query(entity_type, key_field)
+
+            for start in range(0, len(indices), size):
+                chunk = indices[start:start + size]
+                rows = [rows_by_index[i] for i in chunk]
+                self._write_chunk(
+                    query, lambda lo, hi, rows=rows: {"rows": rows[lo:hi], "ids": new_ids(hi - lo)},
+                    entity_type, key_field, chunk, records.__getitem__, result
+                )
+
+        edges = []
+        for index, row in rows_by_index.items():
+            entity_type = records[index]["type"]
+            key_field = self.key_fields.get(entity_type)
+            for relationship in records[index].get("relationships", []):
+                from_key = row.get(key_field) if key_field else None
+                edges.append((index, entity_type, key_field, from_key, relationship))
+        if edges:
+            self._load_relationships(edges, records.__getitem__, result, size)
+
+        return result
+
+    def _load_columnar(self, batch: ColumnarBatch, size: int) -> LoadResult:
+        """Load a columnar batch, sending each transaction's rows as column lists"""
+        result = LoadResult()
+        entity_type = batch.entity_type
+        data = batch.data
+        indices = list(range(data.num_rows))
+
+        def fail_all(error: str) -> LoadResult:
+            result.failed = len(indices)
+            result.errors = [RecordError(index=i, error=error, record=batch.record(i)) for i in indices]
+            return result
+
+        if not is_valid_label(entity_type):
+            return fail_all(f"Invalid entity type: {entity_type!r}")
+
+        names = [stored_property(name) for name in data.schema.names]
+        if len(set(names)) != len(names):
+            return fail_all("Records cannot carry both 'id' and 'source_id'")
+        try:
+            data = pa.RecordBatch.from_arrays(
+                [_to_property_column(name, column) for name, column in zip(data.schema.names, data.columns)],
+                names=names
+            )
+        except ValueError as e:
+            return fail_all(str(e))
+        stored = data
+
+        key_field = self.key_fields.get(entity_type)
+        if key_field:
+            if key_field not in data.schema.names:
+                return fail_all(f"Missing natural key '{key_field}'")
+
+            valid = pc.is_valid(data.column(key_field))
+            if not pc.all(valid).as_py():
+                for i, is_valid in enumerate(valid.to_pylist()):
+                    if not is_valid:
+                        result.failed += 1
+                        result.errors.append(
+                            RecordError(index=i, error=f"Missing natural key '{key_field}'", record=batch.record(i))
+                        )
+                indices = [i for i, is_valid in enumerate(valid.to_pylist()) if is_valid]
+                data = data.filter(valid)
+
+            self._ensure_key_constraint(entity_type, key_field)
+
+        query = self._build_node_query(entity_type, key_field, columns=data.schema.names)
+
+        for start in range(0, data.num_rows, size):
+            chunk_data = data.slice(start, size)
+            columns = [column.to_pylist() for column in chunk_data.columns]
+            chunk = indices[start:start + chunk_data.num_rows]
+            self._write_chunk(
+                query,
+                lambda lo, hi, columns=columns: {
+                    "size": hi - lo, "columns": [c[lo:hi] for c in columns], "ids": new_ids(hi - lo)
+                },
+                entity_type, key_field, chunk, batch.record, result
+            )
+
+        if batch.relationships:
+            keys = stored.column(key_field).to_pylist() if key_field else None
+            edges = [
+                (index, entity_type, key_field, keys[index] if keys else None, relationship)
+                for index, relationship in batch.relationships
+            ]
+            self._load_relationships(edges, batch.record, result, size)
+
+        return result
+
+    def _write_chunk(
+        self,
+        query: str,
+        slice_parameters: Callable[[int, int], Dict[str, Any]],
+        entity_type: str,
+        key_field: Optional[str],
+        chunk: List[int],
+        get_record: Callable[[int], Dict[str, Any]],
+        result: LoadResult
+    ):
+        """
+        Write one transaction worth of records and account for the outcome
+
+        Transient errors are retried with exponential backoff. If the write
+        fails for any other reason, the chunk is bisected and both halves are
+        written separately, so a few poison records cost O(log n) extra round
+        trips and the rest of the chunk is still loaded. Records that fail
+        on their own are reported as errors.
+
+        Args:
+            query: UNWIND statement
+            slice_parameters: Returns the parameters for chunk[lo:hi]
+            entity_type: Node label
+            key_field: Natural key, or None
+            chunk: Record indices of the chunk
+            get_record: Returns the transformed record for error reporting
+            result: Load result to update
+        """
+        pending = [(0, len(chunk))]
+        while pending:
+            lo, hi = pending.pop()
+            try:
+                written = self._execute_with_retry(query, slice_parameters(lo, hi))
+            except Exception as e:
+                # Bisecting does not help while the database itself is failing
+                if hi - lo > 1 and not _is_transient(e):
+                    middle = (lo + hi) // 2
+                    pending.extend([(middle, hi), (lo, middle)])
+                    continue
+                logger.warning(f"Failed to load {hi - lo} {entity_type} record(s): {e}")
+                result.failed += hi - lo
+                result.errors.extend(
+                    RecordError(index=i, error=str(e), record=get_record(i)) for i in chunk[lo:hi]
+                )
+                continue
+
+            result.loaded += hi - lo
+            if key_field and written:
+                result.unchanged += hi - lo - written[0]["changed"]
+
+    def _execute_with_retry(self, query: str, parameters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Run a write transaction, retrying transient failures with backoff
+
+        Raises:
+            The last error if the write does not succeed
+        """
+        for attempt in range(settings.GRAPH_LOAD_MAX_RETRIES + 1):
+            try:
+                return self._execute(query, parameters)
+            except Exception as e:
+                self.failed_transactions += 1
+                if attempt >= settings.GRAPH_LOAD_MAX_RETRIES or not _is_transient(e):
+                    raise
+                delay = settings.GRAPH_LOAD_RETRY_BACKOFF_SECONDS * 2 ** attempt
+                logger.warning(f"Transient graph write error, retrying in {delay:.1f}s: {e}")
+                time.sleep(delay)
+
+    def _load_relationships(
+        self,
+        edges: List[Tuple[int, str, Optional[str], Any, Dict[str, Any]]],
+        get_record: Callable[[int], Dict[str, Any]],
+        result: LoadResult,
+        size: int
+    ):
+        """
+        Second pass: write the relationships of the loaded records
+
+        Edges whose endpoint does not exist (yet) are counted as unresolved
+        rather than failing the record. A record whose edges cannot be
+        written is counted as failed.
+
+        Args:
+            edges: (record index, entity type, key field, key value, relationship)
+            get_record: Returns the transformed record for error reporting
+            result: Load result to update
+            size: Edges per transaction
+        """
+        failed = {error.index for error in result.errors}
+        groups: Dict[tuple, List[Dict[str, Any]]] = {}
+
+        for index, entity_type, key_field, from_key, relationship in edges:
+            if index in failed:
+                continue
+            spec = relationship["spec"]
+            if not key_field or from_key is None:
+                logger.warning(f"Cannot link {spec['type']} from {entity_type}: the mapping declares no key_field")
+                result.relationships_unresolved += 1
+                continue
+
+            try:
+                properties = {
+                    name: _to_property_value(name, value)
+                    for name, value in relationship.get("properties", {}).items()
+                }
+            except ValueError as e:
+                failed.add(index)
+                self._fail_record(index, str(e), get_record, result)
+                continue
+
+            target = (spec["target_type"], spec.get("target_key", "id"), relationship["target"])
+            source = (entity_type, key_field, from_key)
+            start, end = (target, source) if spec.get("direction") == "incoming" else (source, target)
+            group = (spec["type"], start[0], start[1], end[0], end[1])
+            groups.setdefault(group, []).append(
+                {"index": index, "from_key": start[2], "to_key": end[2], "properties": properties}
+            )
+
+        for (rel_type, from_label, from_field, to_label, to_field), rows in groups.items():
+            if not all(is_valid_label(name) for name in (rel_type, from_label, to_label)):
+                logger.warning(f"Invalid relationship {from_label}-[{rel_type}]->{to_label}")
+                result.relationships_unresolved += len(rows)
+                continue
+
+            query = self._build_relationship_query(rel_type, from_label, from_field, to_label, to_field)
+            for start in range(0, len(rows), size):
+                chunk = rows[start:start + size]
+                self._write_relationship_chunk(
+                    query, chunk, (from_label, from_field), (to_label, to_field), failed, get_record, result
+                )
+
+    def _write_relationship_chunk(
+        self,
+        query: str,
+        rows: List[Dict[str, Any]],
+        start_key: Tuple[str, str],
+        end_key: Tuple[str, str],
+        failed: set,
+        get_record: Callable[[int], Dict[str, Any]],
+        result: LoadResult
+    ):
+        """
+        Resolve the endpoints of one transaction worth of edges and write them
+
+        Cached ids can be stale if nodes were deleted; edges whose endpoints
+        no longer match are retried once with freshly resolved ids.
+        """
+        pending = rows
+        for attempt in range(2):
+            from_ids = self._resolve_node_ids(*start_key, [row["from_key"] for row in pending])
+            to_ids = self._resolve_node_ids(*end_key, [row["to_key"] for row in pending])
+
+            params = []
+            for i, row in enumerate(pending):
+                if row["from_key"] in from_ids and row["to_key"] in to_ids:
+                    params.append({
+                        "i": i,
+                        "from": from_ids[row["from_key"]],
+                        "from_key": row["from_key"],
+                        "to": to_ids[row["to_key"]],
+                        "to_key": row["to_key"],
+                        "properties": row["properties"]
+                    })
+            result.relationships_unresolved += len(pending) - len(params)
+            if not params:
+                return
+
+            try:
+                written = self._execute_with_retry(query, {"rows": params})
+            except Exception as e:
+                logger.error(f"Bulk load of {len(params)} relationships failed: {e}")
+                for row in params:
+                    index = pending[row["i"]]["index"]
+                    if index not in failed:
+                        failed.add(index)
+                        self._fail_record(index, str(e), get_record, result)
+                return
+
+            linked = set(written[0]["linked"]) if written else set()
+            result.relationships_loaded += len(linked)
+            stale = [row for row in params if row["i"] not in linked]
+            if not stale:
+                return
+
+            self.node_ids.invalidate(*start_key, [row["from_key"] for row in stale])
+            self.node_ids.invalidate(*end_key, [row["to_key"] for row in stale])
+            if attempt == 1:
+                result.relationships_unresolved += len(stale)
+            pending = [pending[row["i"]] for row in stale]
+
+    def _resolve_node_ids(self, label: str, key_field: str, values: List[Any]) -> Dict[Any, str]:
+        """
+        Element ids for natural key values, from the cache or one batched lookup
+
+        Lookups by "id" seek the global index on the entity label; other
+        keys are backed by a uniqueness constraint on the label, created
+        on first use.
+
+        Args:
+            label: Node label
+            key_field: Natural key property
+            values: Key values
+
+        Returns:
+            Mapping of key value to element id (missing nodes are left out)
+        """
+        from app.db.graph_migrations import entity_label_ready
+
+        values = list(dict.fromkeys(values))
+        ids = self.node_ids.get_many(label, key_field, values)
+        missing = [value for value in values if value not in ids]
+        if not missing:
+            return ids
+
+        key = quote_identifier(key_field)
+        if key_field == "id" and entity_label_ready():
+            match = f"MATCH (n:{ENTITY_LABEL} {{id: key}}) WHERE n:{quote_identifier(label)}"
+        else:
+            if key_field != "id":
+                self._ensure_key_constraint(label, key_field)
+            match = f"MATCH (n:{quote_identifier(label)} {{{key}: key}})"
+
+        found = {}
+        for start in range(0, len(missing), self.transaction_size):
+            rows = self._read(
+                f"""
+                UNWIND $keys AS key
+                {match}
+                RETURN key, elementId(n) AS node_id
+                """,
+                {"keys": missing[start:start + self.transaction_size]}
+            )
+            found.update({row["key"]: row["node_id"] for row in rows})
+
+        self.node_ids.put_many(label, key_field, found)
+        ids.update(found)
+        return ids
+
+    def _build_relationship_query(
+        self,
+        rel_type: str,
+        from_label: str,
+        from_field: str,
+        to_label: str,
+        to_field: str
+    ) -> str:
+        """
+        Build the UNWIND statement writing one relationship type
+
+        Endpoints are matched by element id (an id seek); the label and key
+        checks guard against ids reused after a node was deleted.
+        """
+        return f"""
+        UNWIND $rows AS row
+        MATCH (a:{quote_identifier(from_label)}) WHERE elementId(a) = row.from AND a.{quote_identifier(from_field)} = row.from_key
+        MATCH (b:{quote_identifier(to_label)}) WHERE elementId(b) = row.to AND b.{quote_identifier(to_field)} = row.to_key
+        MERGE (a)-[r:{quote_identifier(rel_type)}]->(b)
+        SET r += row.properties
+        RETURN collect(row.i) AS linked
+        """
+
+    def _fail_record(
+        self,
+        index: int,
+        error: str,
+        get_record: Callable[[int], Dict[str, Any]],
+        result: LoadResult
+    ):
+        """Turn a loaded record into a failed one"""
+        result.loaded -= 1
+        result.failed += 1
+        result.errors.append(RecordError(index=index, error=error, record=get_record(index)))
+
+    def _execute(self, query: str, parameters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run a single write transaction, subject to ingestion backpressure"""
+        from app.db.neo4j_client import neo4j_client
+
+        waited = write_latency_monitor.wait_if_paused()
+        self._pauses.seconds = getattr(self._pauses, "seconds", 0.0) + waited
+        started = time.monotonic()
+        written = neo4j_client.execute_write(query, parameters, database=self.database)
+        write_latency_monitor.observe(time.monotonic() - started)
+        return written
+
+    def _read(self, query: str, parameters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run a read transaction; reads are not subject to write backpressure"""
+        from app.db.neo4j_client import neo4j_client
+
+        return neo4j_client.execute_read(query, parameters, database=self.database)
+
+    def _ensure_key_constraint(self, entity_type: str, key_field: str):
+        """Create the uniqueness constraint backing MERGE on (and lookups by) a natural key"""
+        if (entity_type, key_field) in self._constrained_keys:
+            return
+
+        try:
+            self._execute(
+                f"CREATE CONSTRAINT IF NOT EXISTS FOR (n:{quote_identifier(entity_type)}) "
+                f"REQUIRE n.{quote_identifier(key_field)} IS UNIQUE",
+                {}
+            )
+        except Exception as e:
+            logger.warning(f"Failed to create key constraint for {entity_type}.{key_field}: {e}")
+
+        self._constrained_keys.add((entity_type, key_field))
+
+    def _build_node_query(
+        self,
+        entity_type: str,
+        key_field: Optional[str] = None,
+        columns: Optional[List[str]] = None
+    ) -> str:
+        """
+        Build the UNWIND statement for one entity type
+
+        Args:
+            entity_type: Node label
+            key_field: Natural key to MERGE on, or None to CREATE
+            columns: Property names of a columnar batch; rows are then
+                assembled from $columns instead of being read from $rows
+
+        Returns:
+            Cypher statement; $ids holds a pre-generated id per row, used
+            for nodes that are created
+        """
+        if columns is None:
+            source = "UNWIND range(0, size($rows) - 1) AS i\n        WITH $rows[i] AS row, i"
+        else:
+            fields = ", ".join(f"{quote_identifier(name)}: $columns[{i}][i]" for i, name in enumerate(columns))
+            source = f"UNWIND range(0, $size - 1) AS i\n        WITH {{{fields}}} AS row, i"
+
+        if key_field:
+            key = quote_identifier(key_field)
+            return f"""
+        {source}
+        MERGE (n:{quote_identifier(entity_type)} {{{key}: row.{key}}})
+        ON CREATE SET n:{ENTITY_LABEL}, n.id = $ids[i], n.created_at = datetime()
+        WITH n, row
+        WHERE any(k IN keys(row) WHERE (n[k] IS NULL) <> (row[k] IS NULL) OR n[k] <> row[k])
+        SET n += row
+        SET n.updated_at = datetime()
+        RETURN count(n) AS changed
+        """
+
+        return f"""
+        {source}
+        CREATE (n:{quote_identifier(entity_type)}:{ENTITY_LABEL})
+        SET n += row
+        SET n.id = $ids[i]
+        SET n.created_at = datetime()
+        """
+
+    def _prepare_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validate a transformed record and convert it to storable properties
+
+        Args:
+            record: Transformed record
+
+        Returns:
+            Property map for the UNWIND row
+
+        Raises:
+            ValueError: If the record cannot be stored in Neo4j
+        """
+        entity_type = record.get("type")
+        if not is_valid_label(entity_type):
+            raise ValueError(f"Invalid entity type: {entity_type!r}")
+
+        properties = record.get("properties")
+        if not isinstance(properties, dict):
+            raise ValueError("Record properties must be a mapping")
+
+        prepared = {}
+        for key, value in properties.items():
+            prepared[stored_property(key)] = _to_property_value(key, value)
+        if "id" in properties and len(prepared) < len(properties):
+            raise ValueError("Records cannot carry both 'id' and 'source_id'")
+
+        key_field = self.key_fields.get(entity_type)
+        if key_field and prepared.get(key_field) is None:
+            raise ValueError(f"Missing natural key '{key_field}'")
+
+        return prepared
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether a write error is worth retrying unchanged"""
+    if isinstance(error, (TransientError, ServiceUnavailable, SessionExpired)):
+        return True
+    is_retryable = getattr(error, "is_retryable", None)
+    return bool(is_retryable and is_retryable())
+
+
+def _to_property_value(key: str, value: Any) -> Any:
+    """Convert a Python value to a Neo4j property value"""
+    if value is None or isinstance(value, _PROPERTY_TYPES):
+        return value
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, (list, tuple)):
+        return [_to_property_value(key, v) for v in value]
+    raise ValueError(f"Unsupported value for property '{key}': {type(value).__name__}")
+
+
+def _to_property_column(name: str, column: pa.Array) -> pa.Array:
+    """Cast an Arrow column to a type whose Python values Neo4j can store"""
+    if pa.types.is_dictionary(column.type):
+        column = column.dictionary_decode()
+    if pa.types.is_decimal(column.type):
+        return pc.cast(column, pa.float64())
+    if any(is_type(column.type) for is_type in _ARROW_PROPERTY_TYPES):
+        return column
+    raise ValueError(f"Unsupported column type for property '{name}': {column.type}")
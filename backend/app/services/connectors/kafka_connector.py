@@ -0,0 +1,440 @@
+"""
+Kafka Data Connector
+Streaming connector that consumes Kafka topics in micro-batches
+"""
+import asyncio
+import base64
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Iterator, Optional, Callable
+
+from kafka import KafkaConsumer, TopicPartition
+from kafka.structs import OffsetAndMetadata
+
+from app.services.connectors.base_connector import BaseConnector, ConnectorStatus
+from app.core.config import settings
+from app.core.logging import logger
+
+
+DEFAULT_BATCH_INTERVAL_MS = 1000
+POLL_TIMEOUT_MS = 100
+
+# Raw record standing in for a message whose value is not valid JSON; it
+# fails to transform and is dead-lettered with the original bytes
+UNDECODABLE_KEY = "_undecodable_message"
+
+
+@dataclass
+class StreamMetrics:
+    """Consumer lag and micro-batch latency of a streaming connector"""
+    messages_consumed: int = 0
+    decode_errors: int = 0
+    batches_committed: int = 0
+    last_batch_latency_ms: Optional[float] = None
+    avg_batch_latency_ms: Optional[float] = None
+    max_batch_latency_ms: Optional[float] = None
+    partition_lag: Dict[str, int] = field(default_factory=dict)
+
+    def observe_commit(self, latency_ms: float):
+        """Record the consume-to-commit latency of a committed micro-batch"""
+        self.batches_committed += 1
+        self.last_batch_latency_ms = latency_ms
+        self.max_batch_latency_ms = max(self.max_batch_latency_ms or 0.0, latency_ms)
+        if self.avg_batch_latency_ms is None:
+            self.avg_batch_latency_ms = latency_ms
+        else:
+            # Exponentially weighted, so the value follows the current load
+            self.avg_batch_latency_ms = 0.9 * self.avg_batch_latency_ms + 0.1 * latency_ms
+
+    @property
+    def total_lag(self) -> int:
+        return sum(self.partition_lag.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "messages_consumed": self.messages_consumed,
+            "decode_errors": self.decode_errors,
+            "batches_committed": self.batches_committed,
+            "last_batch_latency_ms": self.last_batch_latency_ms,
+            "avg_batch_latency_ms": self.avg_batch_latency_ms,
+            "max_batch_latency_ms": self.max_batch_latency_ms,
+            "consumer_lag": self.total_lag,
+            "partition_lag": dict(self.partition_lag),
+        }
+
+
+class KafkaConnector(BaseConnector):
+    """
+    Kafka Streaming Connector
+
+    A sync runs until stop() is called (or, with idle_timeout_seconds, until
+    the topics have been idle that long). Messages are grouped into
+    micro-batches bounded by batch_size and max_batch_interval_ms; every
+    micro-batch is written to the graph with one bulk load. Offsets are
+    committed to the consumer group only after the batch has been loaded,
+    which gives at-least-once delivery: after a failure the uncommitted
+    messages are consumed again.
+
+    Message values are decoded as JSON objects. Messages that cannot be
+    decoded fail in the transform stage and are dead-lettered with their
+    topic, partition, offset and base64-encoded value; their offsets are
+    only committed once they are stored.
+    """
+
+    streaming = True
+
+    def __init__(
+        self,
+        connector_id: str,
+        config: Dict[str, Any],
+        mapping: Dict[str, Any],
+        consumer_factory: Optional[Callable[..., Any]] = None
+    ):
+        """
+        Initialize connector
+
+        Args:
+            connector_id: Unique connector identifier
+            config: Connector configuration
+            mapping: Schema mapping from source to ontology
+            consumer_factory: Callable creating the consumer, called like
+                KafkaConsumer (defaults to KafkaConsumer)
+        """
+        super().__init__(connector_id, config, mapping)
+        self._consumer_factory = consumer_factory or KafkaConsumer
+        self._consumer = None
+        # kafka-python consumers are not thread-safe: polling and committing
+        # run in different worker threads
+        self._consumer_lock = threading.Lock()
+        self._stop_requested = threading.Event()
+        self._batch_position: Optional[Dict[str, Any]] = None
+        self.metrics = StreamMetrics()
+
+    @property
+    def topics(self) -> List[str]:
+        topics = self.config.get("topics") or self.config.get("topic")
+        if not topics:
+            raise ValueError("topics not specified in config")
+        return [topics] if isinstance(topics, str) else list(topics)
+
+    def _consumer_config(self, **overrides) -> Dict[str, Any]:
+        consumer_config = {
+            "bootstrap_servers": self.config.get("bootstrap_servers", settings.KAFKA_BOOTSTRAP_SERVERS),
+            "group_id": self.config.get("group_id", f"{settings.KAFKA_TOPIC_PREFIX}-connector-{self.connector_id}"),
+            "client_id": f"mdop-connector-{self.connector_id}",
+            "enable_auto_commit": False,
+            "auto_offset_reset": self.config.get("auto_offset_reset", "earliest"),
+        }
+        consumer_config.update(self.config.get("consumer_options", {}))
+        consumer_config.update(overrides)
+        return consumer_config
+
+    async def connect(self) -> bool:
+        """Create the consumer and subscribe to the topics"""
+        try:
+            self.status = ConnectorStatus.CONNECTING
+
+            self._consumer = await asyncio.to_thread(
+                self._consumer_factory, *self.topics, **self._consumer_config()
+            )
+            self.status = ConnectorStatus.CONNECTED
+
+            logger.info(f"Subscribed to Kafka topics {', '.join(self.topics)}")
+            return True
+
+        except Exception as e:
+            self.status = ConnectorStatus.ERROR
+            logger.error(f"Failed to connect to Kafka: {e}")
+            return False
+
+    async def disconnect(self) -> bool:
+        """Close the consumer without committing"""
+        try:
+            self._stop_requested.set()
+            if self._consumer:
+                with self._consumer_lock:
+                    self._consumer.close(autocommit=False)
+                self._consumer = None
+
+            self.status = ConnectorStatus.DISCONNECTED
+            logger.info("Disconnected from Kafka")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error disconnecting from Kafka: {e}")
+            return False
+
+    async def test_connection(self) -> bool:
+        """Check that the brokers are reachable and the topics exist"""
+        try:
+            def check():
+                consumer = self._consumer_factory(**self._consumer_config(group_id=None))
+                try:
+                    return set(self.topics) <= set(consumer.topics())
+                finally:
+                    consumer.close(autocommit=False)
+
+            return await asyncio.to_thread(check)
+        except Exception as e:
+            logger.error(f"Connection test failed: {e}")
+            return False
+
+    async def detect_schema(self) -> Dict[str, Any]:
+        """
+        Infer fields from a sample of messages
+
+        Uses a separate consumer outside the group, so no offsets move.
+
+        Returns:
+            Schema information including fields and their Python types
+        """
+        sample_rows = int(self.config.get("sample_rows", 100))
+
+        def sample():
+            consumer = self._consumer_factory(
+                *self.topics, **self._consumer_config(group_id=None, consumer_timeout_ms=5000)
+            )
+            records = []
+            try:
+                for message in consumer:
+                    try:
+                        record = self._decode(message.value)
+                    except ValueError:
+                        continue
+                    if record is not None:
+                        records.append(record)
+                    if len(records) >= sample_rows:
+                        break
+            finally:
+                consumer.close(autocommit=False)
+            return records
+
+        records = await asyncio.to_thread(sample)
+        fields: Dict[str, set] = {}
+        for record in records:
+            for name, value in record.items():
+                if value is not None:
+                    fields.setdefault(name, set()).add(type(value).__name__)
+                else:
+                    fields.setdefault(name, set())
+
+        schema = {
+            "topics": self.topics,
+            "columns": [
+                {
+                    "name": name,
+                    "type": "/".join(sorted(types)) or "null",
+                    "nullable": sum(1 for r in records if r.get(name) is None) > 0
+                }
+                for name, types in fields.items()
+            ]
+        }
+
+        logger.info(f"Detected schema for {', '.join(self.topics)}: {len(schema['columns'])} fields")
+        return schema
+
+    def stop(self):
+        """Ask a running sync to finish after the current micro-batch"""
+        self._stop_requested.set()
+
+    async def fetch_data(
+        self,
+        full_sync: bool = False,
+        batch_size: int = 1000
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Consume micro-batches until stopped
+
+        Args:
+            full_sync: If True, rewind the consumer group to the earliest
+                offsets first. If False, continue from the committed offsets
+            batch_size: Maximum number of messages per micro-batch
+
+        Yields:
+            Micro-batches of decoded messages
+        """
+        if not self._consumer:
+            await self.connect()
+
+        self._stop_requested.clear()
+        await asyncio.to_thread(self._rewind, full_sync)
+
+        interval = float(self.config.get("max_batch_interval_ms", DEFAULT_BATCH_INTERVAL_MS)) / 1000
+        idle_timeout = self.config.get("idle_timeout_seconds")
+        last_message_at = time.monotonic()
+
+        records: List[Dict[str, Any]] = []
+        offsets: Dict[TopicPartition, int] = {}
+        batch_started: Optional[float] = None
+
+        try:
+            while not self._stop_requested.is_set():
+                size = self._fetch_size(batch_size)
+                messages = await asyncio.to_thread(self._poll, max(1, size - len(records)))
+                now = time.monotonic()
+
+                for message in messages:
+                    if batch_started is None:
+                        batch_started = now
+                    offsets[TopicPartition(message.topic, message.partition)] = message.offset + 1
+                    try:
+                        record = self._decode(message.value)
+                    except ValueError as e:
+                        self.metrics.decode_errors += 1
+                        logger.warning(f"Undecodable Kafka message at {message.topic}:{message.partition}@{message.offset}: {e}")
+                        record = self._undecodable_record(message, e)
+                    if record is not None:
+                        records.append(record)
+                self.metrics.messages_consumed += len(messages)
+
+                if messages:
+                    last_message_at = now
+                elif idle_timeout is not None and now - last_message_at >= float(idle_timeout):
+                    logger.info(f"Kafka topics idle for {idle_timeout}s, ending sync")
+                    break
+
+                full = len(records) >= size
+                due = batch_started is not None and now - batch_started >= interval
+                if offsets and (full or due):
+                    self._batch_position = {"offsets": offsets, "fetched_at": batch_started}
+                    yield records
+                    records, offsets, batch_started = [], {}, None
+
+            # Hand out what has been consumed so far, so it can be committed
+            if offsets:
+                self._batch_position = {"offsets": offsets, "fetched_at": batch_started}
+                yield records
+        finally:
+            self._batch_position = None
+
+    def _batch_watermark(self, batch: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Next offset per partition after the micro-batch"""
+        return self._batch_position
+
+    def _merge_watermark(
+        self,
+        current: Optional[Dict[str, Any]],
+        position: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Offsets of the newly committed batch, on top of all earlier ones"""
+        offsets = dict(current["offsets"]) if current else {}
+        offsets.update(position["offsets"])
+        return {"offsets": offsets, "fetched_at": position["fetched_at"]}
+
+    def _defer_watermark(self, full_sync: bool) -> bool:
+        """Offsets are committed after every micro-batch, also when rewound"""
+        return False
+
+    def _continue_after_failure(self) -> bool:
+        """Stop consuming: the failed batch is redelivered on the next sync"""
+        return False
+
+    def _save_watermark(self, watermark: Dict[str, Any]) -> bool:
+        """
+        Commit the offsets to the consumer group
+
+        Offsets live in Kafka rather than in the connector's sync state.
+
+        Returns:
+            True if the offsets were committed
+        """
+        try:
+            offsets = {tp: OffsetAndMetadata(offset, None) for tp, offset in watermark["offsets"].items()}
+            with self._consumer_lock:
+                self._consumer.commit(offsets=offsets)
+        except Exception as e:
+            logger.error(f"Failed to commit Kafka offsets for connector {self.connector_id}: {e}")
+            return False
+
+        self.metrics.observe_commit((time.monotonic() - watermark["fetched_at"]) * 1000)
+        return True
+
+    def _transform_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Transform a decoded message; undecodable messages fail here"""
+        if UNDECODABLE_KEY in record:
+            raise ValueError(f"Undecodable Kafka message: {record[UNDECODABLE_KEY]['error']}")
+        return super()._transform_record(record)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Connector status including consumer lag and batch latency"""
+        status = super().get_status()
+        status["metrics"] = self.metrics.to_dict()
+        return status
+
+    # ========== Consumer Access ==========
+
+    def _poll(self, max_records: int) -> list:
+        """Poll the consumer and refresh the lag of the assigned partitions"""
+        with self._consumer_lock:
+            polled = self._consumer.poll(timeout_ms=POLL_TIMEOUT_MS, max_records=max(1, max_records))
+            self._update_lag()
+
+        messages = []
+        for partition_messages in polled.values():
+            messages.extend(partition_messages)
+        return messages
+
+    def _update_lag(self):
+        """Lag per partition: high watermark minus consumer position"""
+        for tp in self._consumer.assignment():
+            highwater = self._consumer.highwater(tp)
+            if highwater is None:
+                continue
+            lag = max(0, highwater - self._consumer.position(tp))
+            self.metrics.partition_lag[f"{tp.topic}:{tp.partition}"] = lag
+
+    def _rewind(self, full_sync: bool):
+        """
+        Reset the position of the assigned partitions
+
+        A previous sync in this process may have consumed past its last
+        commit; seeking back to the committed offsets redelivers those
+        messages. A full sync starts from the earliest offsets.
+        """
+        with self._consumer_lock:
+            assignment = self._consumer.assignment()
+            if not assignment:
+                if full_sync:
+                    # Assignment happens on the first poll
+                    self._consumer.poll(timeout_ms=POLL_TIMEOUT_MS, max_records=1)
+                    assignment = self._consumer.assignment()
+                if not assignment:
+                    return
+
+            if full_sync:
+                self._consumer.seek_to_beginning(*assignment)
+                return
+
+            for tp in assignment:
+                committed = self._consumer.committed(tp)
+                if committed is not None:
+                    self._consumer.seek(tp, committed)
+
+    def _decode(self, value: Optional[bytes]) -> Optional[Dict[str, Any]]:
+        """
+        Decode a message value into a record
+
+        Returns:
+            The record, or None for tombstones (messages without a value)
+
+        Raises:
+            ValueError: If the value is not valid JSON
+        """
+        if value is None:
+            return None
+        decoded = json.loads(value)
+        return decoded if isinstance(decoded, dict) else {"value": decoded}
+
+    def _undecodable_record(self, message, error: Exception) -> Dict[str, Any]:
+        """Raw record preserving an undecodable message for the dead-letter store"""
+        return {
+            UNDECODABLE_KEY: {
+                "topic": message.topic,
+                "partition": message.partition,
+                "offset": message.offset,
+                "value_base64": base64.b64encode(message.value).decode("ascii"),
+                "error": str(error),
+            }
+        }
@@ -0,0 +1,246 @@
+"""
+Sync Metrics
+Per-stage timings, throughput, queue depths, retries and memory of a connector sync
+"""
+from typing import Dict, Any, Optional
+from datetime import datetime, timezone
+import bisect
+import json
+import threading
+import time
+
+import pyarrow as pa
+
+from app.services.connectors.batch_control import process_rss_mb
+
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+_SIZE_SAMPLE = 10
+
+
+def estimate_bytes(batch) -> int:
+    """
+    Approximate size of a batch of records
+
+    Arrow batches report their buffer size; for dict records a small sample
+    is serialized to JSON and extrapolated.
+    """
+    if isinstance(batch, pa.RecordBatch):
+        return batch.nbytes
+    data = getattr(batch, "data", None)
+    if isinstance(data, pa.RecordBatch):
+        return data.nbytes
+
+    count = len(batch)
+    if not count:
+        return 0
+    step = max(1, count // _SIZE_SAMPLE)
+    sample = [batch[i] for i in range(0, count, step)][:_SIZE_SAMPLE]
+    size = sum(len(json.dumps(record, default=str)) for record in sample)
+    return size * count // len(sample)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram"""
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms: Optional[float] = None
+        self.max_ms: Optional[float] = None
+
+    def observe(self, seconds: float):
+        ms = seconds * 1000
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.min_ms = ms if self.min_ms is None else min(self.min_ms, ms)
+        self.max_ms = ms if self.max_ms is None else max(self.max_ms, ms)
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Upper bound of the bucket containing the given fraction of observations"""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, self.counts):
+            seen += count
+            if seen >= rank:
+                return round(min(bound, self.max_ms), 2)
+        return round(self.max_ms, 2)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 2) if self.count else None,
+            "min_ms": round(self.min_ms, 2) if self.min_ms is not None else None,
+            "max_ms": round(self.max_ms, 2) if self.max_ms is not None else None,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "buckets": {
+                (f"le_{bound}" if i < len(LATENCY_BUCKETS_MS) else "inf"): count
+                for i, (bound, count) in enumerate(zip(LATENCY_BUCKETS_MS + (None,), self.counts))
+                if count
+            },
+        }
+
+
+class StageMetrics:
+    """Batch timings and volume of one pipeline stage"""
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self.latency = LatencyHistogram()
+        self.batches = 0
+        self.records = 0
+        self.bytes = 0
+        self.busy_seconds = 0.0
+        self.blocked_seconds = 0.0  # waiting for room in the next stage's queue
+
+    def observe(self, seconds: float, records: int, size: int = 0):
+        self.latency.observe(seconds)
+        self.batches += 1
+        self.records += records
+        self.bytes += size
+        self.busy_seconds += seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        # Stage throughput while busy, accounting for parallel workers
+        capacity = self.busy_seconds / self.workers
+        return {
+            "workers": self.workers,
+            "batches": self.batches,
+            "records": self.records,
+            "bytes": self.bytes,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "blocked_seconds": round(self.blocked_seconds, 3),
+            "rows_per_second": round(self.records / capacity, 1) if capacity else None,
+            "bytes_per_second": round(self.bytes / capacity, 1) if capacity and self.bytes else None,
+            "latency": self.latency.to_dict(),
+        }
+
+
+class QueueMetrics:
+    """Depth samples of a bounded stage queue"""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.samples = 0
+        self.total = 0
+        self.max = 0
+        self.full = 0
+
+    def observe(self, depth: int):
+        self.samples += 1
+        self.total += depth
+        self.max = max(self.max, depth)
+        if depth >= self.capacity:
+            self.full += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "capacity": self.capacity,
+            "mean_depth": round(self.total / self.samples, 2) if self.samples else None,
+            "max_depth": self.max,
+            "full_ratio": round(self.full / self.samples, 3) if self.samples else None,
+        }
+
+
+class SyncMetrics:
+    """
+    Instrumentation of one sync run
+
+    The fetch stage is timed while waiting for the source, the transform
+    and load stages per batch. Time spent blocked on a full downstream
+    queue is tracked separately, so the stage with the highest busy time
+    per worker is the one bounding the sync.
+    """
+
+    STAGES = ("fetch", "transform", "load")
+
+    def __init__(self, transform_workers: int = 1, load_workers: int = 1, queue_size: int = 1):
+        self.started_at = datetime.now(timezone.utc)
+        self._started = time.monotonic()
+        self.stages = {
+            "fetch": StageMetrics(1),
+            "transform": StageMetrics(transform_workers),
+            "load": StageMetrics(load_workers),
+        }
+        self.queues = {
+            "transform": QueueMetrics(queue_size),
+            "load": QueueMetrics(queue_size),
+        }
+        self.retries: Dict[str, int] = {}
+        self.peak_rss_mb = process_rss_mb()
+        self._lock = threading.Lock()
+
+    def observe_stage(self, stage: str, seconds: float, records: int, size: int = 0):
+        with self._lock:
+            self.stages[stage].observe(seconds, records, size)
+
+    def observe_blocked(self, stage: str, seconds: float):
+        with self._lock:
+            self.stages[stage].blocked_seconds += seconds
+
+    def observe_queue(self, queue: str, depth: int):
+        with self._lock:
+            self.queues[queue].observe(depth)
+
+    def add_retries(self, kind: str, count: int):
+        if count:
+            with self._lock:
+                self.retries[kind] = self.retries.get(kind, 0) + count
+
+    def sample_memory(self):
+        rss = process_rss_mb()
+        with self._lock:
+            self.peak_rss_mb = max(self.peak_rss_mb, rss)
+
+    def bottleneck(self) -> Optional[str]:
+        """Stage with the most busy time per worker"""
+        busy = {name: stage.busy_seconds / stage.workers for name, stage in self.stages.items() if stage.batches}
+        return max(busy, key=busy.get) if busy else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            elapsed = time.monotonic() - self._started
+            loaded = self.stages["load"].records
+            return {
+                "started_at": self.started_at.isoformat(),
+                "elapsed_seconds": round(elapsed, 3),
+                "rows_per_second": round(loaded / elapsed, 1) if elapsed else None,
+                "bottleneck": self.bottleneck(),
+                "stages": {name: stage.to_dict() for name, stage in self.stages.items()},
+                "queues": {name: queue.to_dict() for name, queue in self.queues.items()},
+                "retries": dict(self.retries),
+                "peak_rss_mb": round(self.peak_rss_mb, 1),
+            }
+
+
+def summarize_run(stats: Dict[str, Any], success: bool, records_processed: int) -> Dict[str, Any]:
+    """
+    Compact per-run entry kept in the connector's sync history
+
+    Args:
+        stats: Full stats of the run (SyncResult.stats)
+        success: Whether the sync succeeded
+        records_processed: Records loaded
+
+    Returns:
+        Run summary
+    """
+    stages = stats.get("stages", {})
+    return {
+        "started_at": stats.get("started_at"),
+        "success": success,
+        "records_processed": records_processed,
+        "elapsed_seconds": stats.get("elapsed_seconds"),
+        "rows_per_second": stats.get("rows_per_second"),
+        "bottleneck": stats.get("bottleneck"),
+        "stage_rows_per_second": {name: stage.get("rows_per_second") for name, stage in stages.items()},
+        "peak_rss_mb": stats.get("peak_rss_mb"),
+    }
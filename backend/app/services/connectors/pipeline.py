@@ -0,0 +1,341 @@
+"""
+Connector Sync Pipeline
+Runs fetch, transform and load as concurrent stages connected by bounded queues
+"""
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import asyncio
+import time
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.services.connectors.metrics import SyncMetrics, estimate_bytes
+
+if TYPE_CHECKING:
+    from app.services.connectors.base_connector import BaseConnector
+
+
+_DONE = object()
+
+
+@dataclass
+class PipelineOptions:
+    """Sizing of the sync pipeline stages"""
+    batch_size: int = 1000
+    queue_size: int = 4
+    transform_workers: int = 1
+    load_workers: int = 1
+    adaptive: bool = False
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "PipelineOptions":
+        """
+        Build options from connector configuration, falling back to settings
+
+        Args:
+            config: Connector configuration
+
+        Returns:
+            Pipeline options
+        """
+        return cls(
+            batch_size=max(1, int(config.get("batch_size", settings.CONNECTOR_BATCH_SIZE))),
+            queue_size=max(1, int(config.get("queue_size", settings.CONNECTOR_QUEUE_SIZE))),
+            transform_workers=max(1, int(config.get("transform_workers", settings.CONNECTOR_TRANSFORM_WORKERS))),
+            load_workers=max(1, int(config.get("load_workers", settings.CONNECTOR_LOAD_WORKERS))),
+            adaptive=bool(config.get("adaptive_batching", settings.CONNECTOR_ADAPTIVE_BATCHING)),
+        )
+
+
+@dataclass
+class _BatchItem:
+    """A batch travelling through the pipeline"""
+    seq: int
+    records: List[Dict[str, Any]]
+    position: Optional[Dict[str, Any]]
+    checkpoint: Optional[Dict[str, Any]] = None
+    transformed: Optional[List[Dict[str, Any]]] = None
+    transform_errors: List[Any] = field(default_factory=list)
+    loaded: int = 0
+    failed: int = 0
+
+
+class _CommitTracker:
+    """
+    Commits batch positions in fetch order
+
+    Batches may finish loading out of order when several load workers run.
+    A position is only committed once every earlier batch has been loaded,
+    and nothing is committed past a failed batch.
+
+    Full syncs additionally commit a checkpoint (the connector's resume
+    position plus counters), which is persisted at most once per
+    checkpoint interval so that an interrupted run can resume.
+    """
+
+    def __init__(self, connector: "BaseConnector", full_sync: bool, resume: Optional[Dict[str, Any]] = None):
+        self._connector = connector
+        self._deferred = connector._defer_watermark(full_sync)
+        self._checkpointing = full_sync and connector._checkpoints_enabled()
+        self._checkpoint_interval = float(
+            connector.config.get("checkpoint_interval_seconds", settings.SYNC_CHECKPOINT_INTERVAL_SECONDS)
+        )
+        self._last_checkpoint_save = 0.0
+        self._next_seq = 0
+        self._finished: Dict[int, tuple] = {}
+        self._lock = asyncio.Lock()
+        self.blocked = False
+
+        resume = resume or {}
+        self.watermark: Optional[Dict[str, Any]] = resume.get("watermark")
+        self.checkpoint: Optional[Dict[str, Any]] = resume.get("position")
+        self.records_committed: int = resume.get("records_processed", 0)
+        self.records_failed: int = resume.get("records_failed", 0)
+        self.batches_committed: int = resume.get("batches", 0)
+        self._started_at = resume.get("started_at") or datetime.now(timezone.utc).isoformat()
+
+    async def complete(self, item: _BatchItem, ok: bool):
+        """
+        Mark a batch as finished and commit every contiguous finished position
+
+        Args:
+            item: Finished batch
+            ok: Whether every record of the batch reached the graph (or the
+                dead-letter store)
+        """
+        async with self._lock:
+            self._finished[item.seq] = (ok, item)
+
+            while not self.blocked and self._next_seq in self._finished:
+                ok, item = self._finished.pop(self._next_seq)
+                self._next_seq += 1
+
+                if not ok:
+                    self.blocked = True
+                    break
+
+                self.batches_committed += 1
+                self.records_committed += item.loaded
+                self.records_failed += item.failed
+                if item.checkpoint is not None:
+                    self.checkpoint = self._connector._merge_checkpoint(self.checkpoint, item.checkpoint)
+                if item.position is not None:
+                    self.watermark = self._connector._merge_watermark(self.watermark, item.position)
+                    if not self._deferred:
+                        saved = await asyncio.to_thread(self._connector._store_watermark, self.watermark)
+                        self.blocked = not saved
+
+            if self._checkpointing and self.checkpoint is not None:
+                now = time.monotonic()
+                if now - self._last_checkpoint_save >= self._checkpoint_interval:
+                    self._last_checkpoint_save = now
+                    await asyncio.to_thread(self._connector._save_checkpoint, self.checkpoint_state())
+
+    def checkpoint_state(self) -> Dict[str, Any]:
+        """Committed resume position, watermark and counters"""
+        return {
+            "position": self.checkpoint,
+            "watermark": self.watermark,
+            "records_processed": self.records_committed,
+            "records_failed": self.records_failed,
+            "batches": self.batches_committed,
+            "started_at": self._started_at,
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+
+class SyncPipeline:
+    """
+    Staged sync pipeline
+
+    The fetch stage reads batches from the connector, transform workers map
+    them onto the ontology and load workers write them to the graph. Stages
+    are connected by bounded queues, so a slow stage applies backpressure
+    to the ones before it and memory stays bounded. Blocking transform and
+    load work runs in the default executor, keeping the event loop free.
+    """
+
+    def __init__(
+        self,
+        connector: "BaseConnector",
+        options: PipelineOptions,
+        full_sync: bool,
+        resume: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Initialize pipeline
+
+        Args:
+            connector: Connector providing fetch, transform and load
+            options: Stage sizing
+            full_sync: Whether this is a full sync
+            resume: Checkpoint of an interrupted full sync to continue from
+        """
+        self.connector = connector
+        self.options = options
+        self.full_sync = full_sync
+        self.records_processed = 0
+        self.records_failed = 0
+        self.records_dead_lettered = 0
+        self._tracker = _CommitTracker(connector, full_sync, resume)
+        self.metrics = SyncMetrics(options.transform_workers, options.load_workers, options.queue_size)
+        self._transform_queue: asyncio.Queue = asyncio.Queue(maxsize=options.queue_size)
+        self._load_queue: asyncio.Queue = asyncio.Queue(maxsize=options.queue_size)
+        self._active_transformers = options.transform_workers
+
+    @property
+    def watermark(self) -> Optional[Dict[str, Any]]:
+        """Highest committed source position"""
+        return self._tracker.watermark
+
+    @property
+    def checkpoint(self) -> Optional[Dict[str, Any]]:
+        """Committed checkpoint state, or None if the connector keeps no resume position"""
+        if self._tracker.checkpoint is None:
+            return None
+        return self._tracker.checkpoint_state()
+
+    @property
+    def watermark_complete(self) -> bool:
+        """True if every fetched batch was committed"""
+        return not self._tracker.blocked
+
+    async def run(self):
+        """Run all stages until the source is exhausted"""
+        tasks = [asyncio.create_task(self._fetch())]
+        tasks += [asyncio.create_task(self._transform()) for _ in range(self.options.transform_workers)]
+        tasks += [asyncio.create_task(self._load()) for _ in range(self.options.load_workers)]
+
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def _fetch(self):
+        """Fetch stage: read batches from the source"""
+        batches = self.connector.fetch_data(
+            full_sync=self.full_sync,
+            batch_size=self.connector._fetch_size(self.options.batch_size)
+        )
+        seq = 0
+
+        try:
+            waiting = time.monotonic()
+            async for batch in batches:
+                self.metrics.observe_stage("fetch", time.monotonic() - waiting, len(batch), estimate_bytes(batch))
+                if self._tracker.blocked and not self.connector._continue_after_failure():
+                    logger.warning("Stopping fetch: an earlier batch could not be committed")
+                    break
+                position = self.connector._batch_watermark(batch)
+                checkpoint = self.connector._batch_checkpoint(batch) if self.full_sync else None
+
+                self.metrics.observe_queue("transform", self._transform_queue.qsize())
+                blocked = time.monotonic()
+                await self._transform_queue.put(
+                    _BatchItem(seq=seq, records=batch, position=position, checkpoint=checkpoint)
+                )
+                self.metrics.observe_blocked("fetch", time.monotonic() - blocked)
+                seq += 1
+                waiting = time.monotonic()
+        finally:
+            await batches.aclose()
+
+        for _ in range(self.options.transform_workers):
+            await self._transform_queue.put(_DONE)
+
+    async def _transform(self):
+        """Transform stage: map raw records onto the ontology"""
+        while True:
+            item = await self._transform_queue.get()
+            if item is _DONE:
+                break
+
+            started = time.monotonic()
+            try:
+                item.transformed, item.transform_errors = await asyncio.to_thread(
+                    self.connector._transform_with_errors, item.records
+                )
+            except Exception as e:
+                logger.error(f"Failed to transform batch: {e}")
+                self.records_failed += len(item.records)
+                await self._tracker.complete(item, False)
+                continue
+            self.metrics.observe_stage("transform", time.monotonic() - started, len(item.records))
+
+            self.metrics.observe_queue("load", self._load_queue.qsize())
+            blocked = time.monotonic()
+            await self._load_queue.put(item)
+            self.metrics.observe_blocked("transform", time.monotonic() - blocked)
+
+        # The last transform worker to finish closes the load stage
+        self._active_transformers -= 1
+        if self._active_transformers == 0:
+            for _ in range(self.options.load_workers):
+                await self._load_queue.put(_DONE)
+
+    async def _load(self):
+        """Load stage: write transformed records to the graph"""
+        while True:
+            item = await self._load_queue.get()
+            if item is _DONE:
+                break
+
+            control = self.connector._batch_control
+            loader = self.connector._graph_loader
+            load_size = control.load_size if control is not None else None
+            failed_before = getattr(loader, "failed_transactions", 0)
+            started = time.monotonic()
+
+            try:
+                load_result = await self.connector._load_to_graph(item.transformed, load_size)
+            except Exception as e:
+                logger.error(f"Failed to load batch: {e}")
+                self.records_failed += len(item.records)
+                if control is not None:
+                    control.observe(len(item.transformed), time.monotonic() - started, 1, 1)
+                await self._tracker.complete(item, False)
+                continue
+
+            elapsed = time.monotonic() - started
+            failed_transactions = getattr(loader, "failed_transactions", 0) - failed_before
+            self.metrics.observe_stage("load", elapsed, load_result.loaded, estimate_bytes(item.transformed))
+            self.metrics.add_retries("graph_transactions", failed_transactions)
+            self.metrics.sample_memory()
+            if control is not None:
+                # Backpressure pauses are not commit latency
+                control.observe(
+                    len(item.transformed),
+                    max(0.0, elapsed - load_result.paused_seconds),
+                    -(-len(item.transformed) // load_size),
+                    failed_transactions
+                )
+
+            failures = load_result.failed + len(item.records) - len(item.transformed)
+            self.records_processed += load_result.loaded
+            self.records_failed += failures
+
+            for error in load_result.errors[:10]:
+                logger.warning(f"Failed to load record {error.index}: {error.error}")
+            logger.debug(
+                f"Processed batch of {load_result.loaded} records "
+                f"({load_result.unchanged} unchanged, {load_result.relationships_loaded} relationships, "
+                f"{load_result.relationships_unresolved} unresolved)"
+            )
+
+            # Failed records parked in the dead-letter store no longer hold
+            # back the watermark
+            dead_lettered = False
+            if failures:
+                dead_lettered = await asyncio.to_thread(
+                    self.connector._dead_letter, item.transform_errors, load_result.errors
+                )
+                if dead_lettered:
+                    self.records_dead_lettered += failures
+
+            item.loaded = load_result.loaded
+            item.failed = failures
+            await self._tracker.complete(item, failures == 0 or dead_lettered)
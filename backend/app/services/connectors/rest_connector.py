@@ -0,0 +1,507 @@
+"""
+REST Data Connector
+Connector implementation for paginated REST/JSON APIs
+"""
+import asyncio
+import json
+import time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, List, Iterator, Optional, Tuple
+
+import aiohttp
+
+from app.services.connectors.base_connector import BaseConnector, ConnectorStatus
+from app.utils.json_path import compile_path, compile_paths, leaf_paths
+from app.core.config import settings
+from app.core.logging import logger
+
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+_sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+
+
+def get_shared_session() -> aiohttp.ClientSession:
+    """
+    Pooled HTTP session shared by all REST connectors of the event loop
+
+    Connections are kept alive between requests and syncs. Credentials are
+    sent per request and cookies are not stored, so connectors do not leak
+    state into each other.
+
+    Returns:
+        Client session bound to the running event loop
+    """
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=settings.REST_CONNECTOR_POOL_SIZE,
+            keepalive_timeout=settings.REST_CONNECTOR_KEEPALIVE_SECONDS
+        )
+        session = aiohttp.ClientSession(
+            connector=connector,
+            cookie_jar=aiohttp.DummyCookieJar(),
+            timeout=aiohttp.ClientTimeout(total=settings.CONNECTOR_TIMEOUT)
+        )
+        _sessions[loop] = session
+    return session
+
+
+async def close_shared_sessions():
+    """Close the pooled sessions (on application shutdown)"""
+    for loop, session in list(_sessions.items()):
+        if loop is asyncio.get_running_loop() and not session.closed:
+            await session.close()
+        _sessions.pop(loop, None)
+
+
+class RateLimiter:
+    """
+    Token bucket limiting the request rate of one connector
+
+    Servers asking to back off (429/503 with Retry-After) pause the bucket
+    for every request of the connector, not only the rejected one.
+    """
+
+    def __init__(self, rate: Optional[float], burst: int = 1):
+        """
+        Args:
+            rate: Requests per second, or None for no limit
+            burst: Number of requests that may be sent back to back
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a request may be sent"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                if self.rate is None:
+                    return
+
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def pause(self, seconds: float):
+        """Hold back all requests for the given time"""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delay in seconds or HTTP date)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class RESTConnector(BaseConnector):
+    """
+    REST/JSON API Connector
+
+    Pages are requested over a pooled keep-alive session. Offset and page
+    number pagination keep up to "concurrency" page requests in flight;
+    cursor and link pagination request the next page as soon as its cursor
+    is known, while the current page is still being loaded. Records are
+    flattened with compiled JSON paths: the source columns of
+    field_mappings are paths into each record (e.g. "address.city").
+
+    Incremental syncs of unpaginated endpoints send the ETag /
+    Last-Modified validators of the previous run, so an unchanged
+    collection costs a single 304 response. Validators of a paginated
+    endpoint only describe its first page, so paginated endpoints are
+    always read in full (narrowed by since_param, if configured).
+
+    Config:
+        base_url, endpoint, method, params, headers, auth
+        records_path: Path to the record list in a page (default: the page itself)
+        pagination: {"type": "none" | "offset" | "page" | "cursor" | "link", ...}
+        concurrency: Page requests in flight for offset/page pagination
+        rate_limit: {"requests_per_second": float, "burst": int}
+        max_retries: Retries for network errors, 429 and 5xx responses
+        since_param: Query parameter receiving the start time of the last sync
+    """
+
+    def __init__(self, connector_id: str, config: Dict[str, Any], mapping: Dict[str, Any]):
+        super().__init__(connector_id, config, mapping)
+        pagination = config.get("pagination", {})
+        self._pagination = pagination
+        self._page_size = int(pagination.get("page_size", 100))
+        self._records_path = compile_path(config["records_path"]) if config.get("records_path") else None
+        self._cursor_path = compile_path(pagination["cursor_path"]) if pagination.get("cursor_path") else None
+        self._next_url_path = compile_path(pagination["next_url_path"]) if pagination.get("next_url_path") else None
+        self._total_path = compile_path(pagination["total_path"]) if pagination.get("total_path") else None
+        self._flatten = self._build_flattener()
+        rate_limit = config.get("rate_limit", {})
+        self._rate_limiter = RateLimiter(rate_limit.get("requests_per_second"), int(rate_limit.get("burst", 1)))
+        self._validators: Optional[Dict[str, Any]] = None
+
+    @property
+    def url(self) -> str:
+        base_url = self.config.get("base_url", "").rstrip("/")
+        endpoint = self.config.get("endpoint", "").lstrip("/")
+        return f"{base_url}/{endpoint}" if endpoint else base_url
+
+    async def connect(self) -> bool:
+        """Attach to the shared session pool"""
+        try:
+            self.status = ConnectorStatus.CONNECTING
+            self._connection = get_shared_session()
+            self.status = ConnectorStatus.CONNECTED
+            logger.info(f"Connected REST connector to {self.url}")
+            return True
+
+        except Exception as e:
+            self.status = ConnectorStatus.ERROR
+            logger.error(f"Failed to set up REST connector: {e}")
+            return False
+
+    async def disconnect(self) -> bool:
+        """Release the session (the pool stays open for other connectors)"""
+        self._connection = None
+        self.status = ConnectorStatus.DISCONNECTED
+        return True
+
+    async def test_connection(self) -> bool:
+        """Request the first page"""
+        try:
+            await self._request(self.url, self._page_params(0))
+            return True
+        except Exception as e:
+            logger.error(f"Connection test failed: {e}")
+            return False
+
+    async def detect_schema(self) -> Dict[str, Any]:
+        """
+        Infer fields from the records of the first page
+
+        Returns:
+            Schema information with the JSON path and type of every field
+        """
+        status, page, _ = await self._request(self.url, self._page_params(0))
+        records, _, _ = self._parse_page(page, flatten=False)
+        sample = records[:int(self.config.get("sample_rows", 100))]
+
+        fields: Dict[str, set] = {}
+        for record in sample:
+            for path, value in leaf_paths(record).items():
+                types = fields.setdefault(path, set())
+                if value is not None:
+                    types.add(type(value).__name__)
+
+        schema = {
+            "url": self.url,
+            "columns": [
+                {"name": path, "type": "/".join(sorted(types)) or "null"}
+                for path, types in fields.items()
+            ]
+        }
+
+        logger.info(f"Detected schema for {self.url}: {len(schema['columns'])} fields")
+        return schema
+
+    async def fetch_data(
+        self,
+        full_sync: bool = False,
+        batch_size: int = 1000
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Fetch all pages of the endpoint
+
+        Args:
+            full_sync: If True, fetch unconditionally. If False, send the
+                validators of the last sync and skip an unchanged collection
+            batch_size: Maximum number of records per batch
+
+        Yields:
+            Batches of flattened records
+        """
+        if not self._connection:
+            await self.connect()
+
+        self._validators = {"synced_at": datetime.now(timezone.utc).isoformat()}
+        pages = self._fetch_pages(full_sync)
+        try:
+            async for records in pages:
+                offset = 0
+                while offset < len(records):
+                    size = self._fetch_size(batch_size)
+                    yield records[offset:offset + size]
+                    offset += size
+        finally:
+            await pages.aclose()
+
+    def _batch_watermark(self, batch: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Validators of this run's response, stored once the run completes"""
+        return self._validators
+
+    def _defer_watermark(self, full_sync: bool) -> bool:
+        """Validators describe the whole collection, not a position in it"""
+        return True
+
+    # ========== Pagination ==========
+
+    async def _fetch_pages(self, full_sync: bool):
+        pagination_type = self._pagination.get("type", "none")
+        # A 304 on the first page says nothing about later pages
+        conditional = not full_sync and pagination_type == "none"
+        headers = self._conditional_headers() if conditional else {}
+        params = self._page_params(0)
+        if not full_sync and self.config.get("since_param") and self._watermark:
+            params[self.config["since_param"]] = self._watermark.get("synced_at")
+
+        status, page, response_headers = await self._request(self.url, params, headers)
+        if status == 304:
+            logger.info(f"{self.url} not modified since the last sync")
+            return
+
+        if pagination_type == "none":
+            self._validators["etag"] = response_headers["etag"]
+            self._validators["last_modified"] = response_headers["last_modified"]
+
+        if pagination_type in ("offset", "page"):
+            pages = self._fetch_numbered_pages(page, params)
+        elif pagination_type in ("cursor", "link"):
+            pages = self._fetch_linked_pages(page, params, response_headers)
+        else:
+            records, _, _ = await asyncio.to_thread(self._parse_page, page)
+            yield records
+            return
+
+        try:
+            async for records in pages:
+                yield records
+        finally:
+            await pages.aclose()
+
+    async def _fetch_numbered_pages(self, first_page: Any, params: Dict[str, Any]):
+        """
+        Offset or page number pagination with a window of concurrent requests
+
+        Pages are yielded in order; the first short or empty page ends the
+        collection and cancels the requests beyond it.
+        """
+        records, _, total = await asyncio.to_thread(self._parse_page, first_page)
+        yield records
+        if len(records) < self._page_size:
+            return
+
+        last_page = None if total is None else -(-int(total) // self._page_size) - 1
+        concurrency = max(1, int(self.config.get("concurrency", 4)))
+        in_flight: deque = deque()
+        next_page = 1
+
+        def schedule():
+            nonlocal next_page
+            while len(in_flight) < concurrency and (last_page is None or next_page <= last_page):
+                page_params = {**params, **self._page_params(next_page)}
+                in_flight.append(asyncio.create_task(self._request(self.url, page_params)))
+                next_page += 1
+
+        try:
+            schedule()
+            while in_flight:
+                _, page, _ = await in_flight.popleft()
+                records, _, _ = await asyncio.to_thread(self._parse_page, page)
+                if records:
+                    yield records
+                if len(records) < self._page_size:
+                    break
+                schedule()
+        finally:
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+    async def _fetch_linked_pages(self, first_page: Any, params: Dict[str, Any], headers):
+        """
+        Cursor or next-link pagination with one page of prefetch
+
+        The request for the next page is sent before the current page is
+        handed to the pipeline, so network latency overlaps with loading.
+        """
+        page, response_headers = first_page, headers
+        prefetch: Optional[asyncio.Task] = None
+
+        try:
+            while True:
+                records, next_request, _ = await asyncio.to_thread(self._parse_page, page, response_headers)
+                if next_request is not None:
+                    url, next_params = next_request
+                    if next_params is not None:
+                        next_params = {**params, **next_params}
+                    prefetch = asyncio.create_task(self._request(url, next_params))
+
+                if records:
+                    yield records
+                if prefetch is None:
+                    break
+
+                _, page, response_headers = await prefetch
+                prefetch = None
+        finally:
+            if prefetch is not None:
+                prefetch.cancel()
+                await asyncio.gather(prefetch, return_exceptions=True)
+
+    def _page_params(self, page_number: int) -> Dict[str, Any]:
+        """Query parameters of the n-th page (0-based)"""
+        params = dict(self.config.get("params", {}))
+        pagination_type = self._pagination.get("type", "none")
+
+        if pagination_type == "offset":
+            params[self._pagination.get("offset_param", "offset")] = page_number * self._page_size
+            params[self._pagination.get("limit_param", "limit")] = self._page_size
+        elif pagination_type == "page":
+            params[self._pagination.get("page_param", "page")] = int(self._pagination.get("start_page", 1)) + page_number
+            params[self._pagination.get("limit_param", "per_page")] = self._page_size
+        elif pagination_type == "cursor" and self._pagination.get("limit_param"):
+            params[self._pagination["limit_param"]] = self._page_size
+        return params
+
+    def _parse_page(
+        self,
+        page: Any,
+        headers=None,
+        flatten: bool = True
+    ) -> Tuple[List[Dict[str, Any]], Optional[Tuple[str, Optional[Dict[str, Any]]]], Optional[int]]:
+        """
+        Extract records, the next request and the total count from a page
+
+        Returns:
+            Tuple of (records, (url, params) of the next page or None, total)
+        """
+        records = self._records_path(page) if self._records_path else page
+        if records is None:
+            records = []
+        elif isinstance(records, dict):
+            records = [records]
+        if flatten and self._flatten:
+            records = [self._flatten(record) for record in records]
+
+        next_request = None
+        pagination_type = self._pagination.get("type", "none")
+        if pagination_type == "cursor" and self._cursor_path:
+            cursor = self._cursor_path(page)
+            if cursor not in (None, ""):
+                next_request = (self.url, {self._pagination.get("cursor_param", "cursor"): cursor})
+        elif pagination_type == "link":
+            next_url = self._next_url_path(page) if self._next_url_path else None
+            if not next_url and headers is not None:
+                next_url = headers["links"].get("next")
+            if next_url:
+                # The link already carries every query parameter
+                next_request = (str(next_url), None)
+
+        total = self._total_path(page) if self._total_path else None
+        return records, next_request, total
+
+    def _build_flattener(self):
+        """Compile the mapped source paths into a record flattener"""
+        paths = self._projected_columns()
+        return compile_paths(paths) if paths else None
+
+    # ========== HTTP ==========
+
+    def _conditional_headers(self) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since from the last sync's validators"""
+        headers = {}
+        if self._watermark:
+            if self._watermark.get("etag"):
+                headers["If-None-Match"] = self._watermark["etag"]
+            if self._watermark.get("last_modified"):
+                headers["If-Modified-Since"] = self._watermark["last_modified"]
+        return headers
+
+    def _request_headers(self) -> Dict[str, str]:
+        headers = {"Accept": "application/json", **self.config.get("headers", {})}
+        auth = self.config.get("auth", {})
+        if auth.get("type") == "bearer":
+            headers["Authorization"] = f"Bearer {auth['token']}"
+        elif auth.get("type") == "api_key":
+            headers[auth.get("header", "X-API-Key")] = auth["value"]
+        return headers
+
+    def _request_auth(self) -> Optional[aiohttp.BasicAuth]:
+        auth = self.config.get("auth", {})
+        if auth.get("type") == "basic":
+            return aiohttp.BasicAuth(auth["username"], auth.get("password", ""))
+        return None
+
+    async def _request(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[int, Any, Dict[str, Any]]:
+        """
+        Send a rate-limited request, retrying transient failures
+
+        Returns:
+            Tuple of (status, parsed JSON body or None for 304, dict with
+            the etag, last_modified and Link relations of the response)
+        """
+        session = self._connection or get_shared_session()
+        max_retries = int(self.config.get("max_retries", 3))
+        request_headers = {**self._request_headers(), **(headers or {})}
+
+        for attempt in range(max_retries + 1):
+            await self._rate_limiter.acquire()
+            try:
+                async with session.request(
+                    self.config.get("method", "GET"),
+                    url,
+                    params=params,
+                    headers=request_headers,
+                    auth=self._request_auth(),
+                    json=self.config.get("body")
+                ) as response:
+                    if response.status in RETRY_STATUSES and attempt < max_retries:
+                        delay = _retry_after_seconds(response.headers.get("Retry-After"))
+                        if delay is not None:
+                            self._rate_limiter.pause(delay)
+                        else:
+                            await asyncio.sleep(min(30, 0.5 * 2 ** attempt))
+                        logger.warning(f"{url} answered {response.status}, retrying (attempt {attempt + 1})")
+                        continue
+
+                    response.raise_for_status()
+                    response_headers = {
+                        "etag": response.headers.get("ETag"),
+                        "last_modified": response.headers.get("Last-Modified"),
+                        "links": {str(rel): str(link["url"]) for rel, link in response.links.items()},
+                    }
+                    if response.status == 304:
+                        return response.status, None, response_headers
+
+                    body = await response.read()
+                    return response.status, json.loads(body) if body else None, response_headers
+
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt >= max_retries:
+                    raise
+                logger.warning(f"Request to {url} failed: {e}, retrying (attempt {attempt + 1})")
+                await asyncio.sleep(min(30, 0.5 * 2 ** attempt))
+
+        raise RuntimeError(f"Request to {url} failed after {max_retries} retries")
@@ -0,0 +1,337 @@
+"""
+Connector Sync Scheduler
+Runs connector syncs on schedules with global and per-database concurrency limits
+"""
+from typing import Dict, Any, List, Optional
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import asyncio
+import heapq
+import itertools
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.services.connectors.backpressure import write_latency_monitor
+from app.services.connectors.base_connector import SyncResult
+from app.services.connectors.factory import connector_class, create_connector
+from app.services.connectors.sync_state import SyncStateStore
+from app.utils.cron import Schedule
+
+
+@dataclass(order=True)
+class _SyncJob:
+    """A queued sync; ordered by priority (highest first), then age"""
+    sort_key: tuple
+    connector_id: int = field(compare=False)
+    full_sync: bool = field(compare=False)
+    database: str = field(compare=False)
+    timeout: Optional[float] = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+
+
+class SyncScheduler:
+    """
+    In-process orchestrator for connector syncs
+
+    Active connectors with a schedule are queued when due; ad hoc syncs are
+    queued through trigger(). Queued syncs start in priority order as long
+    as a global slot and a slot for the connector's target Neo4j database
+    are free, and never while ingestion is paused because graph write
+    latency is elevated. A connector is never queued or run twice at once.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: Optional[int] = None,
+        max_per_database: Optional[int] = None,
+        poll_interval: Optional[float] = None
+    ):
+        """
+        Initialize scheduler
+
+        Args:
+            max_concurrent: Maximum number of syncs running at once
+            max_per_database: Maximum number of syncs per target database
+            poll_interval: Seconds between checks for due schedules
+        """
+        self.max_concurrent = max_concurrent or settings.SYNC_MAX_CONCURRENT
+        self.max_per_database = max_per_database or settings.SYNC_MAX_CONCURRENT_PER_DATABASE
+        self.poll_interval = poll_interval or settings.SYNC_SCHEDULER_INTERVAL_SECONDS
+        self._queue: List[_SyncJob] = []
+        self._queued: Dict[int, _SyncJob] = {}
+        self._running: Dict[int, asyncio.Task] = {}
+        self._running_per_database: Dict[str, int] = {}
+        self._next_run: Dict[int, datetime] = {}
+        self._schedules: Dict[int, Schedule] = {}
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self):
+        """Start the schedule and dispatch loops"""
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._schedule_loop()),
+            asyncio.create_task(self._dispatch_loop()),
+        ]
+        logger.info(
+            f"Sync scheduler started ({self.max_concurrent} concurrent, "
+            f"{self.max_per_database} per database)"
+        )
+
+    async def stop(self):
+        """Stop scheduling and cancel running syncs"""
+        tasks = self._tasks + list(self._running.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks = []
+
+        for job in self._queued.values():
+            if not job.future.done():
+                job.future.cancel()
+        self._queue.clear()
+        self._queued.clear()
+        logger.info("Sync scheduler stopped")
+
+    async def trigger(
+        self,
+        connector_id: int,
+        full_sync: bool = False,
+        priority: Optional[int] = None
+    ) -> asyncio.Future:
+        """
+        Queue an ad hoc sync
+
+        Args:
+            connector_id: DataConnector id
+            full_sync: Whether to run a full sync
+            priority: Overrides the connector's priority
+
+        Returns:
+            Future resolving to the SyncResult. If the connector is already
+            queued, the future of the queued sync is returned; a sync
+            requested while one is running starts after it.
+        """
+        connector = await asyncio.to_thread(self._load_connector, connector_id)
+        if connector is None:
+            raise ValueError(f"Connector {connector_id} not found")
+        return await self._enqueue(connector, full_sync, priority)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Queue, running syncs and backpressure state"""
+        return {
+            "running": sorted(self._running),
+            "queued": [job.connector_id for job in sorted(self._queue)],
+            "running_per_database": dict(self._running_per_database),
+            "next_runs": {cid: run.isoformat() for cid, run in self._next_run.items()},
+            "backpressure": write_latency_monitor.get_status(),
+        }
+
+    # ========== Scheduling ==========
+
+    async def _schedule_loop(self):
+        """Queue connectors whose schedule is due"""
+        while True:
+            try:
+                connectors = await asyncio.to_thread(self._load_scheduled_connectors)
+                await self._enqueue_due(connectors, datetime.now(timezone.utc))
+            except Exception as e:
+                logger.error(f"Failed to check connector schedules: {e}")
+            await asyncio.sleep(self.poll_interval)
+
+    async def _enqueue_due(self, connectors: list, now: datetime):
+        active = set()
+        for connector in connectors:
+            active.add(connector.id)
+            schedule = self._schedules.get(connector.id)
+            if schedule is None or schedule.expression != connector.schedule.strip():
+                last_run = connector.last_sync_at or now
+                if last_run.tzinfo is None:
+                    last_run = last_run.replace(tzinfo=timezone.utc)
+                try:
+                    schedule = Schedule(connector.schedule)
+                    next_run = schedule.next_after(last_run)
+                except ValueError as e:
+                    logger.error(f"Invalid schedule for connector {connector.id}: {e}")
+                    self._forget(connector.id)
+                    continue
+                # Cached only once it is known to fire
+                self._schedules[connector.id] = schedule
+                self._next_run[connector.id] = next_run
+
+            if self._next_run[connector.id] <= now:
+                if connector.id not in self._queued and connector.id not in self._running:
+                    await self._enqueue(connector, False, None)
+                try:
+                    self._next_run[connector.id] = schedule.next_after(now)
+                except ValueError as e:
+                    logger.error(f"Invalid schedule for connector {connector.id}: {e}")
+                    self._forget(connector.id)
+
+        # Forget connectors that were deactivated or unscheduled
+        for connector_id in list(self._schedules):
+            if connector_id not in active:
+                self._forget(connector_id)
+
+    def _forget(self, connector_id: int):
+        """Drop the cached schedule and next run time of a connector"""
+        self._schedules.pop(connector_id, None)
+        self._next_run.pop(connector_id, None)
+
+    async def _enqueue(self, connector, full_sync: bool, priority: Optional[int]) -> asyncio.Future:
+        existing = self._queued.get(connector.id)
+        if existing is not None:
+            return existing.future
+
+        priority = (connector.priority or 0) if priority is None else priority
+        config = connector.config or {}
+        job = _SyncJob(
+            sort_key=(-priority, next(self._counter)),
+            connector_id=connector.id,
+            full_sync=full_sync,
+            database=config.get("graph_database") or settings.NEO4J_DATABASE,
+            timeout=self._timeout(connector),
+            future=asyncio.get_running_loop().create_future()
+        )
+        # Registered before the status write, so concurrent calls share the
+        # job; pushed after it, so "running" cannot be overwritten by "queued"
+        self._queued[connector.id] = job
+        await asyncio.to_thread(SyncStateStore(str(connector.id)).mark_status, "queued")
+        heapq.heappush(self._queue, job)
+        self._wakeup.set()
+        return job.future
+
+    def _timeout(self, connector) -> Optional[float]:
+        """
+        Timeout of a sync in seconds, or None for no timeout
+
+        An explicit sync_timeout in the connector config wins. Otherwise
+        batch connectors get SYNC_TIMEOUT_SECONDS; streaming connectors run
+        until stopped and get none.
+        """
+        config = connector.config or {}
+        if "sync_timeout" in config:
+            timeout = config["sync_timeout"]
+        else:
+            try:
+                streaming = connector_class(connector.type).streaming
+            except ValueError:
+                streaming = False
+            timeout = None if streaming else settings.SYNC_TIMEOUT_SECONDS
+        return float(timeout) if timeout else None
+
+    # ========== Dispatch ==========
+
+    async def _dispatch_loop(self):
+        """Start queued syncs whenever slots are free"""
+        while True:
+            self._wakeup.clear()
+            self._dispatch()
+
+            # Re-check once a pause ends even if nothing else happens
+            timeout = write_latency_monitor.pause_seconds if write_latency_monitor.paused else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def _dispatch(self):
+        if write_latency_monitor.paused:
+            return
+
+        deferred = []
+        while self._queue and len(self._running) < self.max_concurrent:
+            job = heapq.heappop(self._queue)
+            if job.connector_id in self._running:
+                # A previous sync of the connector is still finishing
+                deferred.append(job)
+                continue
+            if self._running_per_database.get(job.database, 0) >= self.max_per_database:
+                deferred.append(job)
+                continue
+
+            self._queued.pop(job.connector_id, None)
+            self._running_per_database[job.database] = self._running_per_database.get(job.database, 0) + 1
+            self._running[job.connector_id] = asyncio.create_task(self._run(job))
+
+        for job in deferred:
+            heapq.heappush(self._queue, job)
+
+    async def _run(self, job: _SyncJob):
+        """Run one sync with its timeout and record the outcome"""
+        state = SyncStateStore(str(job.connector_id))
+        result: Optional[SyncResult] = None
+        connector = None
+
+        try:
+            row = await asyncio.to_thread(self._load_connector, job.connector_id)
+            if row is None:
+                raise ValueError(f"Connector {job.connector_id} not found")
+
+            connector = create_connector(row)
+            await asyncio.to_thread(state.mark_status, "running")
+            logger.info(f"Running {'full' if job.full_sync else 'incremental'} sync of connector {job.connector_id}")
+
+            result = await asyncio.wait_for(connector.sync(full_sync=job.full_sync), job.timeout)
+            await asyncio.to_thread(
+                state.mark_status, "success" if result.success else "error", result.error_message
+            )
+
+        except asyncio.TimeoutError:
+            message = f"Sync timed out after {job.timeout:g}s"
+            logger.error(f"Connector {job.connector_id}: {message}")
+            result = SyncResult(False, 0, 0, job.timeout or 0, error_message=message)
+            await asyncio.to_thread(state.mark_status, "error", message)
+        except asyncio.CancelledError:
+            await asyncio.to_thread(state.mark_status, "pending")
+            if not job.future.done():
+                job.future.cancel()
+            raise
+        except Exception as e:
+            logger.error(f"Sync of connector {job.connector_id} failed: {e}")
+            result = SyncResult(False, 0, 0, 0, error_message=str(e))
+            await asyncio.to_thread(state.mark_status, "error", str(e))
+        finally:
+            if connector is not None:
+                try:
+                    await connector.disconnect()
+                except Exception as e:
+                    logger.warning(f"Failed to disconnect connector {job.connector_id}: {e}")
+
+            self._running.pop(job.connector_id, None)
+            self._running_per_database[job.database] -= 1
+            self._wakeup.set()
+
+        if not job.future.done():
+            job.future.set_result(result)
+
+    # ========== Metadata Access ==========
+
+    def _load_connector(self, connector_id: int):
+        from app.db.postgres_client import SessionLocal
+        from app.models.ontology import DataConnector
+
+        db = SessionLocal()
+        try:
+            return db.query(DataConnector).filter(DataConnector.id == connector_id).first()
+        finally:
+            db.close()
+
+    def _load_scheduled_connectors(self) -> list:
+        from app.db.postgres_client import SessionLocal
+        from app.models.ontology import DataConnector
+
+        db = SessionLocal()
+        try:
+            return db.query(DataConnector).filter(
+                DataConnector.is_active == True,  # noqa: E712
+                DataConnector.schedule.isnot(None)
+            ).all()
+        finally:
+            db.close()
+
+
+# Global scheduler instance
+sync_scheduler = SyncScheduler()
@@ -0,0 +1,192 @@
+"""
+Connector Sync State
+Persists per-connector sync progress on the DataConnector metadata row
+"""
+from typing import Dict, Any, Optional
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+from app.core.config import settings
+from app.core.logging import logger
+
+
+def encode_state(value: Any) -> Any:
+    """
+    Convert a sync state value to JSON, preserving temporal and decimal types
+
+    Args:
+        value: State value (watermark, checkpoint, ...)
+
+    Returns:
+        JSON-serializable value
+    """
+    if isinstance(value, datetime):
+        return {"__type__": "datetime", "value": value.isoformat()}
+    if isinstance(value, date):
+        return {"__type__": "date", "value": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"__type__": "decimal", "value": str(value)}
+    if isinstance(value, dict):
+        return {str(k): encode_state(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [encode_state(v) for v in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def decode_state(value: Any) -> Any:
+    """
+    Inverse of encode_state
+
+    Args:
+        value: JSON value read from the metadata DB
+
+    Returns:
+        State value with temporal and decimal types restored
+    """
+    if isinstance(value, dict):
+        value_type = value.get("__type__")
+        if value_type == "datetime":
+            return datetime.fromisoformat(value["value"])
+        if value_type == "date":
+            return date.fromisoformat(value["value"])
+        if value_type == "decimal":
+            return Decimal(value["value"])
+        return {k: decode_state(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [decode_state(v) for v in value]
+    return value
+
+
+class SyncStateStore:
+    """
+    Sync state storage for a single connector
+
+    The connector_id is the primary key of its DataConnector row. Connectors
+    created ad hoc (without a metadata row) get a store that silently keeps
+    no state.
+    """
+
+    def __init__(self, connector_id: str):
+        """
+        Initialize store
+
+        Args:
+            connector_id: Connector identifier (DataConnector.id)
+        """
+        try:
+            self._pk: Optional[int] = int(connector_id)
+        except (TypeError, ValueError):
+            self._pk = None
+
+    def load_watermark(self) -> Optional[Dict[str, Any]]:
+        """
+        Load the persisted high-watermark
+
+        Returns:
+            Watermark position, or None if no incremental sync has committed yet
+        """
+        row = self._read("sync_watermark")
+        return decode_state(row) if row else None
+
+    def save_watermark(self, watermark: Optional[Dict[str, Any]]):
+        """
+        Persist the high-watermark of the last committed batch
+
+        Args:
+            watermark: Watermark position
+        """
+        self._write(sync_watermark=encode_state(watermark) if watermark is not None else None)
+
+    def load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """
+        Load the checkpoint of an interrupted full sync
+
+        Returns:
+            Checkpoint with position, watermark and counters, or None
+        """
+        row = self._read("sync_checkpoint")
+        return decode_state(row) if row else None
+
+    def save_checkpoint(self, checkpoint: Optional[Dict[str, Any]]):
+        """
+        Persist the full sync checkpoint after a committed batch
+
+        Args:
+            checkpoint: Checkpoint state, or None once the full sync completed
+        """
+        self._write(sync_checkpoint=encode_state(checkpoint) if checkpoint is not None else None)
+
+    def record_stats(self, stats: Dict[str, Any], summary: Dict[str, Any]):
+        """
+        Persist the stats of the latest sync and append it to the run history
+
+        Args:
+            stats: Full stats of the run
+            summary: Compact run entry kept for the last SYNC_STATS_HISTORY runs
+        """
+        previous = self._read("sync_stats") or {}
+        runs = (previous.get("runs") or []) + [encode_state(summary)]
+        self._write(sync_stats={
+            "last": encode_state(stats),
+            "runs": runs[-settings.SYNC_STATS_HISTORY:],
+        })
+
+    def mark_synced(self):
+        """Record the completion time of a successful sync"""
+        try:
+            self._write(last_sync_at=datetime.now(timezone.utc))
+        except Exception as e:
+            logger.error(f"Failed to record sync time for connector {self._pk}: {e}")
+
+    def mark_status(self, status: str, error: Optional[str] = None):
+        """
+        Record the sync status shown on the connector
+
+        Args:
+            status: pending, queued, running, success or error
+            error: Error message of a failed sync
+        """
+        try:
+            self._write(sync_status=status, sync_error=error)
+        except Exception as e:
+            logger.error(f"Failed to record sync status for connector {self._pk}: {e}")
+
+    def _read(self, column: str) -> Any:
+        """Read a single column of the connector row"""
+        if self._pk is None:
+            return None
+
+        from app.db.postgres_client import SessionLocal
+        from app.models.ontology import DataConnector
+
+        db = SessionLocal()
+        try:
+            connector = db.query(DataConnector).filter(DataConnector.id == self._pk).first()
+            return getattr(connector, column) if connector else None
+        except Exception as e:
+            logger.error(f"Failed to read {column} for connector {self._pk}: {e}")
+            return None
+        finally:
+            db.close()
+
+    def _write(self, **values):
+        """Update columns of the connector row"""
+        if self._pk is None:
+            return
+
+        from app.db.postgres_client import SessionLocal
+        from app.models.ontology import DataConnector
+
+        db = SessionLocal()
+        try:
+            db.query(DataConnector).filter(DataConnector.id == self._pk).update(
+                values, synchronize_session=False
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
@@ -2,9 +2,11 @@
 Ontology Service
 Core business logic for ontology management
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator, Tuple
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
+from contextlib import aclosing
+import asyncio
 import time
 
 from app.models.ontology import EntityType, RelationshipType, OntologyVersion
@@ -13,13 +15,25 @@ from app.schemas.ontology import (
     RelationshipTypeCreate, RelationshipTypeUpdate,
     EntityCreate, RelationshipCreate
 )
-from app.db.neo4j_client import neo4j_client
+from app.db.neo4j_client import neo4j_client, async_neo4j_client
 from app.db.redis_client import redis_client
+from app.db.graph_migrations import entity_label_ready
+from app.services.query.filters import FilterError, compile_filter, index_usage
+from app.services.query.pagination import PagePosition, encode_cursor, decode_cursor
+from app.utils.cypher import ENTITY_LABEL, is_valid_label, quote_identifier
+from app.utils.ids import new_id
+from app.core.config import settings
 from app.core.logging import logger
 
 
 class OntologyService:
-    """Service for managing ontology definitions and instances"""
+    """
+    Service for managing ontology definitions and instances
+    
+    Type definitions live in PostgreSQL and are managed synchronously.
+    Entity and relationship instances are read and written through the
+    async Neo4j driver, so the instance methods are coroutines.
+    """
     
     def __init__(self, db: Session):
         self.db = db
@@ -137,7 +151,7 @@ class OntologyService:
     
     # ========== Entity Instance Management ==========
     
-    def create_entity(self, entity_data: EntityCreate) -> Dict[str, Any]:
+    async def create_entity(self, entity_data: EntityCreate) -> Dict[str, Any]:
         """
         Create an entity instance in Neo4j graph
         
@@ -148,25 +162,33 @@ class OntologyService:
             Created entity with ID
         """
         # Verify entity type exists
-        entity_type = self.db.query(EntityType).filter(EntityType.name == entity_data.type).first()
+        entity_type = await asyncio.to_thread(
+            lambda: self.db.query(EntityType).filter(EntityType.name == entity_data.type).first()
+        )
         if not entity_type:
             raise HTTPException(status_code=404, detail=f"Entity type '{entity_data.type}' not found")
         
         # Validate properties against schema
         # TODO: Implement JSON schema validation
         
-        # Create node in Neo4j
+        # Create node in Neo4j. The ID is assigned up front, so a retried
+        # request with the same ID returns the entity instead of duplicating it
+        entity_id = entity_data.id or new_id()
         query = f"""
-        CREATE (n:{entity_data.type} $properties)
-        SET n.id = toString(id(n))
-        SET n.created_at = datetime()
-        RETURN n
+        MERGE (n:{ENTITY_LABEL} {{id: $id}})
+        ON CREATE SET n:{entity_data.type}, n += $properties, n.created_at = datetime()
+        RETURN n, labels(n) as labels
         """
         
-        result = neo4j_client.execute_write(query, {"properties": entity_data.properties})
+        result = await async_neo4j_client.execute_write(query, {
+            "id": entity_id,
+            "properties": {**entity_data.properties, "id": entity_id}
+        })
         
         if not result:
             raise HTTPException(status_code=500, detail="Failed to create entity")
+        if entity_data.type not in result[0]["labels"]:
+            raise HTTPException(status_code=409, detail=f"Entity ID '{entity_id}' is already used by another entity type")
         
         node = result[0]["n"]
         
@@ -178,18 +200,26 @@ class OntologyService:
             "properties": dict(node)
         }
     
-    def get_entity(self, entity_id: str) -> Dict[str, Any]:
-        """Get entity by ID"""
-        query = """
-        MATCH (n)
-        WHERE n.id = $entity_id
-        RETURN n, labels(n) as labels
+    async def get_entity(self, entity_id: str) -> Dict[str, Any]:
         """
+        Get entity by ID
         
-        result = neo4j_client.execute_read(query, {"entity_id": entity_id})
+        Ids are unique once the entity_id_unique migration has run; nodes
+        written before it may still share one, which is reported as a
+        conflict rather than answered with an arbitrary node.
+        """
+        query = f"""
+        MATCH (n{self._entity_label()} {{id: $entity_id}})
+        RETURN n, [label IN labels(n) WHERE label <> '{ENTITY_LABEL}'] as labels
+        LIMIT 2
+        """
+        
+        result = await async_neo4j_client.execute_read(query, {"entity_id": entity_id})
         
         if not result:
             raise HTTPException(status_code=404, detail="Entity not found")
+        if len(result) > 1:
+            raise HTTPException(status_code=409, detail=f"Entity ID '{entity_id}' is not unique")
         
         node = result[0]["n"]
         labels = result[0]["labels"]
@@ -200,60 +230,194 @@ class OntologyService:
             "properties": dict(node)
         }
     
-    def search_entities(self, entity_type: str, filters: Dict[str, Any], skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
-        """Search entities by type and filters"""
-        # Build WHERE clause from filters
-        where_clauses = []
-        parameters = {"skip": skip, "limit": limit}
-        
-        for key, value in filters.items():
-            where_clauses.append(f"n.{key} = ${key}")
-            parameters[key] = value
+    async def search_entities(self, entity_type: str, filters: Optional[Dict[str, Any]], skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Search entities by type and filter, paged by offset
         
-        where_clause = " AND ".join(where_clauses) if where_clauses else "1=1"
+        Offset paging is kept for backwards compatibility: SKIP costs grow
+        with the offset, page_entities should be used for deep paging.
         
-        query = f"""
-        MATCH (n:{entity_type})
-        WHERE {where_clause}
-        RETURN n
+        Args:
+            entity_type: Entity type name
+            filters: Filter expression (see app.services.query.filters)
+            skip: Entities to skip
+            limit: Maximum entities to return
+            
+        Returns:
+            Matching entities
+        """
+        query, parameters = await self._entity_search_query(entity_type, filters)
+        query += """
         SKIP $skip
         LIMIT $limit
         """
+        parameters.update(skip=skip, limit=limit)
+        
+        result = await async_neo4j_client.execute_read(query, parameters)
+        
+        return [self._entity_from_node(record["n"], entity_type) for record in result]
+    
+    async def page_entities(
+        self,
+        entity_type: str,
+        filters: Optional[Dict[str, Any]],
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        order_by: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Page through entities by keyset
+        
+        Entities are ordered by order_by (if given) and then by id. Each
+        page continues strictly after the sort key of the previous page's
+        last entity instead of skipping the earlier pages. Ordered by id
+        alone, the type's unique id constraint serves this as a range seek.
+        There is no composite (order_by, id) index, so with order_by the
+        continuation predicate is a filter over the entities of the type,
+        which are then sorted; such pages get cheaper towards the end but
+        do not cost the same at every depth. Entities without the order_by
+        property are not returned.
+        
+        Args:
+            entity_type: Entity type name
+            filters: Filter expression (see app.services.query.filters)
+            limit: Page size
+            cursor: Continuation token of the previous page
+            order_by: Indexed property to order by (default: id)
+            
+        Returns:
+            Page with items, next_cursor (None on the last page) and has_more
+        """
+        if order_by is not None and not is_valid_label(order_by):
+            raise HTTPException(status_code=400, detail=f"Invalid order_by property: {order_by!r}")
+        
+        conditions = []
+        parameters = {"limit": limit + 1}
+        sort = f"n.{quote_identifier(order_by)}" if order_by else None
+        if sort:
+            conditions.append(f"{sort} IS NOT NULL")
+        
+        if cursor:
+            try:
+                position = decode_cursor(cursor, entity_type, order_by)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            parameters.update(cursor_value=position.value, cursor_id=position.id)
+            if sort:
+                conditions.append(
+                    f"({sort} > $cursor_value OR ({sort} = $cursor_value AND n.id > $cursor_id))"
+                )
+            else:
+                conditions.append("n.id > $cursor_id")
+        
+        query, filter_parameters = await self._entity_search_query(entity_type, filters, conditions)
+        parameters = {**filter_parameters, **parameters}
+        query += f"""
+        ORDER BY {sort + ", " if sort else ""}n.id
+        LIMIT $limit
+        """
+        
+        result = await async_neo4j_client.execute_read(query, parameters)
+        nodes = [record["n"] for record in result]
+        has_more = len(nodes) > limit
+        nodes = nodes[:limit]
+        
+        next_cursor = None
+        if has_more:
+            last = nodes[-1]
+            next_cursor = encode_cursor(PagePosition(
+                entity_type=entity_type,
+                order_by=order_by,
+                value=last[order_by] if order_by else None,
+                id=last["id"]
+            ))
+        
+        return {
+            "items": [self._entity_from_node(node, entity_type) for node in nodes],
+            "next_cursor": next_cursor,
+            "has_more": has_more
+        }
+    
+    async def explain_entities(self, entity_type: str, filters: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Show how an entity search would be executed
         
-        result = neo4j_client.execute_read(query, parameters)
+        The search query is planned with EXPLAIN, not run.
         
-        return [
-            {
-                "id": record["n"]["id"],
-                "type": entity_type,
-                "properties": dict(record["n"])
-            }
-            for record in result
-        ]
+        Args:
+            entity_type: Entity type name
+            filters: Filter expression (see app.services.query.filters)
+            
+        Returns:
+            Compiled query and parameters, the index operators of the plan,
+            whether it scans the label instead, and the indexes on the type
+        """
+        query, parameters = await self._entity_search_query(entity_type, filters)
+        plan = await async_neo4j_client.explain(query, parameters)
+        available = await async_neo4j_client.execute_read(
+            "SHOW INDEXES YIELD name, type, labelsOrTypes, properties, state "
+            "WHERE $label IN labelsOrTypes RETURN name, type, properties, state",
+            {"label": entity_type}
+        )
+        
+        return {
+            "query": " ".join(query.split()),
+            "parameters": parameters,
+            **index_usage(plan),
+            "available_indexes": available
+        }
+    
+    async def stream_entities(
+        self,
+        entity_type: str,
+        filters: Optional[Dict[str, Any]],
+        chunk_size: Optional[int] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Stream all entities of a type matching the filter
+        
+        Entities are read lazily from one open transaction, so memory stays
+        bounded by the chunk size however many entities match. The filter
+        is validated when this coroutine is awaited, before any entity is
+        read, so callers can still report errors with a status code.
+        
+        Args:
+            entity_type: Entity type name
+            filters: Filter expression (see app.services.query.filters)
+            chunk_size: Entities per yielded chunk (defaults to NEO4J_FETCH_SIZE)
+            
+        Returns:
+            Async iterator over chunks of entities
+        """
+        query, parameters = await self._entity_search_query(entity_type, filters)
+        return self._iter_entity_chunks(query, parameters, entity_type, chunk_size or settings.NEO4J_FETCH_SIZE)
     
     # ========== Relationship Instance Management ==========
     
-    def create_relationship(self, rel_data: RelationshipCreate) -> Dict[str, Any]:
+    async def create_relationship(self, rel_data: RelationshipCreate) -> Dict[str, Any]:
         """Create a relationship instance in Neo4j"""
         # Verify relationship type exists
-        rel_type = self.db.query(RelationshipType).filter(RelationshipType.name == rel_data.type).first()
+        rel_type = await asyncio.to_thread(
+            lambda: self.db.query(RelationshipType).filter(RelationshipType.name == rel_data.type).first()
+        )
         if not rel_type:
             raise HTTPException(status_code=404, detail=f"Relationship type '{rel_data.type}' not found")
         
         # Create relationship in Neo4j
         query = f"""
-        MATCH (from), (to)
-        WHERE from.id = $from_id AND to.id = $to_id
-        CREATE (from)-[r:{rel_data.type} $properties]->(to)
-        SET r.id = toString(id(r))
-        SET r.created_at = datetime()
+        MATCH (from{self._entity_label()} {{id: $from_id}})
+        MATCH (to{self._entity_label()} {{id: $to_id}})
+        MERGE (from)-[r:{rel_data.type} {{id: $id}}]->(to)
+        ON CREATE SET r += $properties, r.created_at = datetime()
         RETURN r, from.id as from_id, to.id as to_id
         """
         
-        result = neo4j_client.execute_write(query, {
+        rel_id = rel_data.id or new_id()
+        result = await async_neo4j_client.execute_write(query, {
+            "id": rel_id,
             "from_id": rel_data.from_entity_id,
             "to_id": rel_data.to_entity_id,
-            "properties": rel_data.properties
+            "properties": {**rel_data.properties, "id": rel_id}
         })
         
         if not result:
@@ -273,6 +437,76 @@ class OntologyService:
     
     # ========== Helper Methods ==========
     
+    async def _entity_search_query(
+        self,
+        entity_type: str,
+        filters: Optional[Dict[str, Any]],
+        conditions: Optional[List[str]] = None
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Build the MATCH statement selecting entities by type, filter and extra conditions
+        
+        The filter is validated against the property schema of the entity
+        type and compiled to parameterized predicates.
+        """
+        if not is_valid_label(entity_type):
+            raise HTTPException(status_code=400, detail=f"Invalid entity type: {entity_type!r}")
+        
+        where_clauses = list(conditions or [])
+        parameters = {}
+        
+        if filters:
+            entity_type_def = await asyncio.to_thread(
+                lambda: self.db.query(EntityType).filter(EntityType.name == entity_type).first()
+            )
+            if not entity_type_def:
+                raise HTTPException(status_code=404, detail=f"Entity type '{entity_type}' not found")
+            try:
+                predicate, parameters = compile_filter(filters, entity_type_def.properties)
+            except FilterError as e:
+                raise HTTPException(status_code=400, detail=f"Invalid filter: {e}")
+            if predicate:
+                where_clauses.append(f"({predicate})" if where_clauses else predicate)
+        
+        where_clause = " AND ".join(where_clauses) if where_clauses else "1=1"
+        
+        query = f"""
+        MATCH (n:{entity_type})
+        WHERE {where_clause}
+        RETURN n
+        """
+        return query, parameters
+    
+    async def _iter_entity_chunks(
+        self,
+        query: str,
+        parameters: Dict[str, Any],
+        entity_type: str,
+        size: int
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Read entity chunks from a streamed search query"""
+        stream = async_neo4j_client.stream(query, parameters, chunk_size=size, fetch_size=size)
+        async with aclosing(stream) as chunks:
+            async for chunk in chunks:
+                yield [self._entity_from_node(record["n"], entity_type) for record in chunk]
+    
+    def _entity_label(self) -> str:
+        """
+        Label pattern for entity lookups by id
+        
+        Lookups seek the global id index on the entity label; until the
+        backfill of older nodes has completed they fall back to a scan.
+        """
+        return f":{ENTITY_LABEL}" if entity_label_ready() else ""
+    
+    def _entity_from_node(self, node: Any, entity_type: str) -> Dict[str, Any]:
+        """Convert a returned node to the entity response shape"""
+        return {
+            "id": node["id"],
+            "type": entity_type,
+            "properties": dict(node)
+        }
+    
     def _create_neo4j_entity_constraint(self, entity_type_name: str):
         """Create Neo4j uniqueness constraint for entity type"""
         try:
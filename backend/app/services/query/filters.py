@@ -0,0 +1,316 @@
+"""
+Entity Filter Language
+Typed filter expressions validated against entity type schemas and compiled to Cypher
+"""
+from typing import Dict, List, Any, Optional, Tuple, Union
+from dataclasses import dataclass, field
+from datetime import date, datetime
+
+from app.utils.cypher import quote_identifier
+
+
+class FilterError(ValueError):
+    """Raised for malformed filters or filters that do not match the schema"""
+
+
+# Comparison operators and the Cypher they compile to
+_COMPARISONS = {
+    "eq": "=",
+    "ne": "<>",
+    "lt": "<",
+    "lte": "<=",
+    "gt": ">",
+    "gte": ">=",
+}
+OPERATORS = set(_COMPARISONS) | {"between", "in", "prefix", "exists"}
+_RANGE_OPERATORS = {"lt", "lte", "gt", "gte", "between"}
+
+# Properties every entity carries, whatever its type schema declares
+BUILTIN_FIELDS = {
+    "id": {"type": "string"},
+    "created_at": {"type": "datetime"},
+}
+
+MAX_IN_VALUES = 1000
+
+
+@dataclass
+class Condition:
+    """Predicate on a single property"""
+    field: str
+    op: str
+    value: Any = None
+
+
+@dataclass
+class BoolExpression:
+    """Boolean combination of filter expressions"""
+    op: str  # and, or, not
+    operands: List["Expression"] = field(default_factory=list)
+
+
+Expression = Union[Condition, BoolExpression]
+
+
+def parse_filter(data: Any) -> Optional[Expression]:
+    """
+    Parse a filter expression from its JSON form
+
+    Conditions are written as {"field": "age", "op": "gte", "value": 30};
+    "between" takes [low, high], "in" a list, "prefix" a string and
+    "exists" a boolean. They are combined with {"and": [...]},
+    {"or": [...]} and {"not": {...}}. A plain mapping of properties to
+    values, e.g. {"name": "Acme"}, is shorthand for equality on each.
+
+    Args:
+        data: Decoded JSON filter
+
+    Returns:
+        Expression tree, or None for an empty filter
+
+    Raises:
+        FilterError: If the filter is malformed
+    """
+    if data is None or data == {}:
+        return None
+    if not isinstance(data, dict):
+        raise FilterError("A filter must be a JSON object")
+
+    if "field" in data:
+        unknown = set(data) - {"field", "op", "value"}
+        if unknown:
+            raise FilterError(f"Unexpected keys in condition: {sorted(unknown)}")
+        op = data.get("op", "eq")
+        if op not in OPERATORS:
+            raise FilterError(f"Unknown operator '{op}', expected one of {sorted(OPERATORS)}")
+        if not isinstance(data["field"], str) or not data["field"]:
+            raise FilterError("Condition field must be a property name")
+        if op != "exists" and "value" not in data:
+            raise FilterError(f"Operator '{op}' requires a value")
+        return Condition(field=data["field"], op=op, value=data.get("value", True))
+
+    bool_keys = {"and", "or", "not"} & set(data)
+    if bool_keys:
+        if len(data) != 1:
+            raise FilterError("A boolean expression must have exactly one of 'and', 'or', 'not'")
+        op = bool_keys.pop()
+        if op == "not":
+            operand = parse_filter(data["not"])
+            if operand is None:
+                raise FilterError("'not' requires an expression")
+            return BoolExpression(op="not", operands=[operand])
+        if not isinstance(data[op], list) or not data[op]:
+            raise FilterError(f"'{op}' requires a non-empty list of expressions")
+        operands = [parse_filter(item) for item in data[op]]
+        if any(operand is None for operand in operands):
+            raise FilterError(f"'{op}' operands must not be empty")
+        return BoolExpression(op=op, operands=operands)
+
+    # Shorthand: equality on every key
+    conditions = [Condition(field=key, op="eq", value=value) for key, value in data.items()]
+    return conditions[0] if len(conditions) == 1 else BoolExpression(op="and", operands=conditions)
+
+
+def _coerce(value: Any, field_type: Optional[str], name: str) -> Any:
+    """Check a filter value against the declared property type"""
+    if value is None:
+        raise FilterError(f"Null is not a valid value for '{name}', use the 'exists' operator")
+    if isinstance(value, (dict, list)):
+        raise FilterError(f"Value for '{name}' must be a scalar")
+
+    if field_type == "string":
+        if not isinstance(value, str):
+            raise FilterError(f"'{name}' is a string property")
+    elif field_type == "integer":
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise FilterError(f"'{name}' is an integer property")
+    elif field_type in ("number", "float"):
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise FilterError(f"'{name}' is a numeric property")
+    elif field_type == "boolean":
+        if not isinstance(value, bool):
+            raise FilterError(f"'{name}' is a boolean property")
+    elif field_type in ("date", "datetime"):
+        # Temporal values arrive as ISO strings and are sent to Neo4j as
+        # temporal parameters, so they compare against stored temporals
+        try:
+            if field_type == "date":
+                return date.fromisoformat(value)
+            return datetime.fromisoformat(value)
+        except (TypeError, ValueError):
+            raise FilterError(f"'{name}' expects an ISO {field_type} string")
+    return value
+
+
+class FilterCompiler:
+    """
+    Compile filter expressions to parameterized Cypher predicates
+
+    Field names are checked against the entity type's property schema and
+    values against the declared types. Predicates are emitted in the form
+    the planner serves from indexes: comparisons directly on n.<property>,
+    STARTS WITH for prefixes (range and text indexes), IS NOT NULL for
+    existence, and top-level conjunctions kept flat so equality and range
+    predicates on several properties can be matched to a composite index.
+    Disjunctions of equalities on one property become a single IN.
+    """
+
+    def __init__(self, properties: Dict[str, Any], variable: str = "n", prefix: str = "f"):
+        """
+        Args:
+            properties: Property definitions of the entity type
+            variable: Node variable the predicates refer to
+            prefix: Prefix of the generated parameter names
+        """
+        self.fields = {**(properties or {}), **BUILTIN_FIELDS}
+        self.variable = variable
+        self.prefix = prefix
+        self.parameters: Dict[str, Any] = {}
+
+    def compile(self, expression: Optional[Expression]) -> Tuple[Optional[str], Dict[str, Any]]:
+        """
+        Compile an expression
+
+        Args:
+            expression: Parsed filter
+
+        Returns:
+            WHERE predicate (None for an empty filter) and its parameters
+
+        Raises:
+            FilterError: If a field or value does not match the schema
+        """
+        self.parameters = {}
+        if expression is None:
+            return None, {}
+        return self._compile(_normalize(expression)), self.parameters
+
+    def _compile(self, expression: Expression) -> str:
+        if isinstance(expression, Condition):
+            return self._condition(expression)
+        if expression.op == "not":
+            return f"NOT ({self._compile(expression.operands[0])})"
+        parts = []
+        for operand in expression.operands:
+            part = self._compile(operand)
+            if expression.op == "or" or (isinstance(operand, BoolExpression) and operand.op == "or"):
+                part = f"({part})"
+            parts.append(part)
+        return (" AND " if expression.op == "and" else " OR ").join(parts)
+
+    def _condition(self, condition: Condition) -> str:
+        if condition.field not in self.fields:
+            raise FilterError(f"Unknown property '{condition.field}'")
+        definition = self.fields[condition.field]
+        field_type = definition.get("type") if isinstance(definition, dict) else None
+        prop = f"{self.variable}.{quote_identifier(condition.field)}"
+        op, value = condition.op, condition.value
+
+        if op in _RANGE_OPERATORS and field_type == "boolean":
+            raise FilterError(f"Operator '{op}' is not supported for boolean property '{condition.field}'")
+
+        if op == "exists":
+            if not isinstance(value, bool):
+                raise FilterError("'exists' takes true or false")
+            return f"{prop} IS NOT NULL" if value else f"{prop} IS NULL"
+        if op == "prefix":
+            if field_type not in (None, "string") or not isinstance(value, str):
+                raise FilterError(f"'prefix' requires a string property and value, got '{condition.field}'")
+            return f"{prop} STARTS WITH {self._param(value)}"
+        if op == "in":
+            if not isinstance(value, list) or not value:
+                raise FilterError("'in' takes a non-empty list")
+            if len(value) > MAX_IN_VALUES:
+                raise FilterError(f"'in' takes at most {MAX_IN_VALUES} values")
+            values = [_coerce(item, field_type, condition.field) for item in value]
+            return f"{prop} IN {self._param(values)}"
+        if op == "between":
+            if not isinstance(value, list) or len(value) != 2:
+                raise FilterError("'between' takes [low, high]")
+            low, high = (_coerce(item, field_type, condition.field) for item in value)
+            return f"{prop} >= {self._param(low)} AND {prop} <= {self._param(high)}"
+
+        value = _coerce(value, field_type, condition.field)
+        return f"{prop} {_COMPARISONS[op]} {self._param(value)}"
+
+    def _param(self, value: Any) -> str:
+        name = f"{self.prefix}{len(self.parameters)}"
+        self.parameters[name] = value
+        return f"${name}"
+
+
+def _normalize(expression: Expression) -> Expression:
+    """Flatten nested and/or and merge equality disjunctions on one property"""
+    if isinstance(expression, Condition):
+        return expression
+    operands = [_normalize(operand) for operand in expression.operands]
+    if expression.op == "not":
+        return BoolExpression(op="not", operands=operands)
+
+    flat: List[Expression] = []
+    for operand in operands:
+        if isinstance(operand, BoolExpression) and operand.op == expression.op:
+            flat.extend(operand.operands)
+        else:
+            flat.append(operand)
+    if len(flat) == 1:
+        return flat[0]
+
+    if expression.op == "or" and all(
+        isinstance(operand, Condition) and operand.op in ("eq", "in") for operand in flat
+    ) and len({operand.field for operand in flat}) == 1:
+        values = []
+        for operand in flat:
+            if operand.op == "eq":
+                values.append(operand.value)
+            elif isinstance(operand.value, list):
+                values.extend(operand.value)
+            else:
+                raise FilterError("'in' takes a non-empty list")
+        return Condition(field=flat[0].field, op="in", value=values)
+
+    return BoolExpression(op=expression.op, operands=flat)
+
+
+def compile_filter(data: Any, properties: Dict[str, Any]) -> Tuple[Optional[str], Dict[str, Any]]:
+    """
+    Parse and compile a filter in one step
+
+    Args:
+        data: Decoded JSON filter
+        properties: Property definitions of the entity type
+
+    Returns:
+        WHERE predicate (None for an empty filter) and its parameters
+
+    Raises:
+        FilterError: If the filter is malformed or does not match the schema
+    """
+    return FilterCompiler(properties).compile(parse_filter(data))
+
+
+def index_usage(plan: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Summarize how a query plan accesses nodes
+
+    Args:
+        plan: Plan returned by EXPLAIN, as the driver returns it: nested
+            dictionaries with operatorType, args, identifiers and children
+
+    Returns:
+        Index operators with their details, and whether the plan falls
+        back to scanning a label or all nodes
+    """
+    indexes = []
+    scans = []
+    pending = [plan] if plan else []
+    while pending:
+        operator = pending.pop()
+        name = str(operator.get("operatorType", "")).split("@")[0]
+        details = (operator.get("args") or {}).get("Details")
+        if "Index" in name:
+            indexes.append({"operator": name, "details": details})
+        elif name in ("NodeByLabelScan", "AllNodesScan"):
+            scans.append({"operator": name, "details": details})
+        pending.extend(operator.get("children") or [])
+    return {"indexes": indexes, "scans": scans, "full_scan": bool(scans) and not indexes}
@@ -0,0 +1,82 @@
+"""
+Keyset Pagination
+Opaque continuation tokens for paging through graph query results
+"""
+from typing import Dict, Any, Optional
+from dataclasses import dataclass
+import base64
+import binascii
+import json
+
+from app.services.connectors.sync_state import encode_state, decode_state
+
+
+_CURSOR_VERSION = 1
+
+
+@dataclass
+class PagePosition:
+    """Sort key of the last entity returned on a page"""
+    entity_type: str
+    order_by: Optional[str]  # None when ordered by id only
+    value: Any  # value of order_by on the last entity
+    id: str  # id of the last entity (tie-breaker)
+
+
+def encode_cursor(position: PagePosition) -> str:
+    """
+    Encode a page position as an opaque, URL-safe token
+
+    Args:
+        position: Position after the last returned entity
+
+    Returns:
+        Continuation token
+    """
+    value = position.value
+    if hasattr(value, "to_native"):
+        # Neo4j temporal types
+        value = value.to_native()
+    payload = {
+        "v": _CURSOR_VERSION,
+        "type": position.entity_type,
+        "order": position.order_by,
+        "value": encode_state(value),
+        "id": position.id,
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(token: str, entity_type: str, order_by: Optional[str]) -> PagePosition:
+    """
+    Decode a continuation token
+
+    Args:
+        token: Token returned with the previous page
+        entity_type: Entity type of the current request
+        order_by: Sort property of the current request
+
+    Returns:
+        Position to continue after
+
+    Raises:
+        ValueError: If the token is malformed or belongs to another query
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload: Dict[str, Any] = json.loads(raw)
+    except (binascii.Error, ValueError) as e:
+        raise ValueError("Malformed cursor") from e
+
+    if not isinstance(payload, dict) or payload.get("v") != _CURSOR_VERSION or not isinstance(payload.get("id"), str):
+        raise ValueError("Malformed cursor")
+    if payload.get("type") != entity_type or payload.get("order") != order_by:
+        raise ValueError("Cursor belongs to a different entity type or sort order")
+
+    return PagePosition(
+        entity_type=entity_type,
+        order_by=order_by,
+        value=decode_state(payload.get("value")),
+        id=payload["id"]
+    )
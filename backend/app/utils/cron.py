@@ -0,0 +1,136 @@
+"""
+Schedule Utilities
+Parsing of cron expressions and fixed intervals for connector schedules
+"""
+import re
+from datetime import datetime, timedelta
+from typing import List, Optional, Set
+
+
+_ALIASES = {
+    "@hourly": "0 * * * *",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@weekly": "0 0 * * 0",
+    "@monthly": "0 0 1 * *",
+}
+
+_INTERVAL_PATTERN = re.compile(r"^@every\s+(\d+)\s*([smhd]?)$")
+_INTERVAL_UNITS = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400}
+
+# (minimum, maximum) per cron field: minute, hour, day of month, month, day of week
+_FIELD_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 6)]
+
+
+def _parse_field(field: str, minimum: int, maximum: int) -> Set[int]:
+    """Expand one cron field (*, a, a-b, lists and /step) into its values"""
+    values = set()
+    for part in field.split(","):
+        range_part, _, step = part.partition("/")
+        step_value = int(step) if step else 1
+        if step_value < 1:
+            raise ValueError(f"Invalid step in cron field {field!r}")
+
+        if range_part == "*":
+            start, end = minimum, maximum
+        elif "-" in range_part:
+            start, end = (int(v) for v in range_part.split("-", 1))
+        else:
+            start = int(range_part)
+            end = maximum if step else start
+
+        if start < minimum or end > maximum or start > end:
+            raise ValueError(f"Cron field {field!r} out of range {minimum}-{maximum}")
+        values.update(range(start, end + 1, step_value))
+    return values
+
+
+class Schedule:
+    """
+    Connector schedule
+
+    Accepts a five-field cron expression ("*/15 * * * *"), one of the
+    aliases @hourly, @daily, @midnight, @weekly, @monthly, or a fixed
+    interval "@every <n>[s|m|h|d]".
+    """
+
+    def __init__(self, expression: str):
+        """
+        Args:
+            expression: Schedule expression
+
+        Raises:
+            ValueError: If the expression cannot be parsed or never fires
+        """
+        self.expression = expression.strip()
+        self.interval: Optional[timedelta] = None
+        self._fields: List[Set[int]] = []
+        self._dom_restricted = False
+        self._dow_restricted = False
+
+        match = _INTERVAL_PATTERN.match(self.expression)
+        if match:
+            seconds = int(match.group(1)) * _INTERVAL_UNITS[match.group(2)]
+            if seconds <= 0:
+                raise ValueError(f"Invalid interval {expression!r}")
+            self.interval = timedelta(seconds=seconds)
+            return
+
+        fields = _ALIASES.get(self.expression, self.expression).split()
+        if len(fields) != 5:
+            raise ValueError(f"Invalid schedule {expression!r}: expected 5 cron fields or @every <interval>")
+
+        # Cron treats 7 as Sunday, like 0
+        fields[4] = re.sub(r"\b7\b", "0", fields[4])
+        self._fields = [_parse_field(f, lo, hi) for f, (lo, hi) in zip(fields, _FIELD_RANGES)]
+        self._dom_restricted = fields[2] != "*"
+        self._dow_restricted = fields[4] != "*"
+
+        # Reject dates that do not exist ("0 0 31 2 *"); the search from a
+        # leap year's start covers every day that does
+        self.next_after(datetime(2000, 1, 1))
+
+    def next_after(self, moment: datetime) -> datetime:
+        """
+        First run time strictly after the given moment
+
+        Args:
+            moment: Reference time (its timezone is kept)
+
+        Returns:
+            Next run time
+        """
+        if self.interval is not None:
+            return moment + self.interval
+
+        minutes, hours, days, months, weekdays = self._fields
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+
+        # Bounded search: every valid expression matches within five years
+        limit = candidate + timedelta(days=366 * 5)
+        while candidate < limit:
+            if candidate.month not in months:
+                year = candidate.year + (1 if candidate.month == 12 else 0)
+                month = 1 if candidate.month == 12 else candidate.month + 1
+                candidate = candidate.replace(year=year, month=month, day=1, hour=0, minute=0)
+                continue
+            if not self._day_matches(candidate, days, weekdays):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            if candidate.hour not in hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+                continue
+            if candidate.minute not in minutes:
+                candidate += timedelta(minutes=1)
+                continue
+            return candidate
+
+        raise ValueError(f"Schedule {self.expression!r} never fires")
+
+    def _day_matches(self, moment: datetime, days: Set[int], weekdays: Set[int]) -> bool:
+        # Cron semantics: if both day fields are restricted, either may match
+        day_match = moment.day in days
+        weekday_match = (moment.weekday() + 1) % 7 in weekdays
+        if self._dom_restricted and self._dow_restricted:
+            return day_match or weekday_match
+        return day_match and weekday_match
@@ -0,0 +1,38 @@
+"""
+Cypher Utilities
+Helpers for safely building dynamic Cypher statements
+"""
+import re
+
+
+_LABEL_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+# Label carried by every entity node in addition to its type, backing the
+# global index on the entity id
+ENTITY_LABEL = "Entity"
+
+
+def is_valid_label(name: str) -> bool:
+    """
+    Check whether a name can be used as a node label or relationship type
+
+    Args:
+        name: Label or relationship type name
+
+    Returns:
+        True if the name is a plain identifier
+    """
+    return isinstance(name, str) and bool(_LABEL_PATTERN.match(name))
+
+
+def quote_identifier(name: str) -> str:
+    """
+    Quote a label, relationship type or property key for use in Cypher
+
+    Args:
+        name: Identifier to quote
+
+    Returns:
+        Backtick-quoted identifier
+    """
+    return "`" + str(name).replace("`", "``") + "`"
@@ -0,0 +1,129 @@
+"""
+Entity IDs
+Sortable unique identifiers (ULIDs) generated before entities are written
+"""
+from typing import List
+from datetime import datetime, timezone
+import os
+import re
+import threading
+import time
+
+
+# Crockford base32, as used by ULIDs
+_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_ID_PATTERN = re.compile(r"^[0-7][0-9A-HJKMNP-TV-Z]{25}$")
+_RANDOM_BITS = 80
+
+# Property keeping an "id" supplied by source data: entity ids are always
+# generated, so a mapped source id column is stored under this name
+SOURCE_ID_PROPERTY = "source_id"
+
+_lock = threading.Lock()
+_last_ms = 0
+_last_random = 0
+
+
+def _next_value() -> int:
+    """128-bit ULID value; callers hold _lock"""
+    global _last_ms, _last_random
+
+    ms = time.time_ns() // 1_000_000
+    if ms > _last_ms:
+        _last_ms = ms
+        _last_random = int.from_bytes(os.urandom(_RANDOM_BITS // 8), "big")
+    else:
+        # Same millisecond (or the clock went back): increment the random
+        # part so IDs of this process stay strictly increasing
+        _last_random += 1
+        if _last_random >> _RANDOM_BITS:
+            _last_ms += 1
+            _last_random = 0
+    return (_last_ms << _RANDOM_BITS) | _last_random
+
+
+def _encode(value: int) -> str:
+    chars = []
+    for _ in range(26):
+        chars.append(_ALPHABET[value & 31])
+        value >>= 5
+    return "".join(reversed(chars))
+
+
+def new_id() -> str:
+    """
+    Generate a new entity ID
+
+    IDs are ULIDs: a millisecond timestamp followed by 80 random bits,
+    encoded as 26 Crockford base32 characters. They sort lexicographically
+    by creation time, are unique without coordination and can be assigned
+    before the entity is written.
+
+    Returns:
+        26 character ID
+    """
+    with _lock:
+        value = _next_value()
+    return _encode(value)
+
+
+def new_ids(count: int) -> List[str]:
+    """
+    Generate several increasing entity IDs at once
+
+    Args:
+        count: Number of IDs
+
+    Returns:
+        List of IDs
+    """
+    with _lock:
+        values = [_next_value() for _ in range(count)]
+    return [_encode(value) for value in values]
+
+
+def stored_property(name: str) -> str:
+    """
+    Graph property a mapped target property is stored under
+
+    Args:
+        name: Target property of a connector mapping
+
+    Returns:
+        SOURCE_ID_PROPERTY for "id", otherwise the name itself
+    """
+    return SOURCE_ID_PROPERTY if name == "id" else name
+
+
+def is_valid_id(value: str) -> bool:
+    """
+    Check whether a value is a well-formed ULID
+
+    Args:
+        value: Candidate ID
+
+    Returns:
+        True for 26 character Crockford base32 IDs
+    """
+    return isinstance(value, str) and bool(_ID_PATTERN.match(value))
+
+
+def id_timestamp(value: str) -> datetime:
+    """
+    Creation time encoded in an ID
+
+    Args:
+        value: ULID
+
+    Returns:
+        Timezone-aware creation time (millisecond precision)
+
+    Raises:
+        ValueError: If the value is not a ULID
+    """
+    if not is_valid_id(value):
+        raise ValueError(f"Not a valid ID: {value!r}")
+    ms = 0
+    for char in value[:10]:
+        ms = ms * 32 + _ALPHABET.index(char)
+    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc)
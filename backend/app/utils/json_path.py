@@ -0,0 +1,128 @@
+"""
+JSON Path Utilities
+Compiled extractors for values in nested JSON documents
+"""
+import re
+from typing import Any, Callable, Dict, Iterable, List, Union
+
+
+_TOKEN_PATTERN = re.compile(r'\.?([^.\[\]]+)|\[(\*|-?\d+)\]|\["((?:[^"\\]|\\.)*)"\]')
+
+_Step = Union[str, int, None]
+
+
+def _parse(path: str) -> List[_Step]:
+    """Split a path into key (str), index (int) and wildcard (None) steps"""
+    if path.startswith("$"):
+        path = path[1:]
+
+    steps: List[_Step] = []
+    position = 0
+    while position < len(path):
+        match = _TOKEN_PATTERN.match(path, position)
+        if not match or match.end() == position:
+            raise ValueError(f"Invalid JSON path {path!r} at position {position}")
+        key, index, quoted = match.groups()
+        if key is not None:
+            steps.append(key)
+        elif quoted is not None:
+            steps.append(quoted.replace('\\"', '"'))
+        elif index == "*":
+            steps.append(None)
+        else:
+            steps.append(int(index))
+        position = match.end()
+    return steps
+
+
+def compile_path(path: str) -> Callable[[Any], Any]:
+    """
+    Compile a path such as "customer.addresses[0].city" into an extractor
+
+    Keys are separated by dots (or written as ["key"]), [n] selects a list
+    element and [*] maps the rest of the path over a list. Missing keys and
+    type mismatches yield None instead of raising.
+
+    Args:
+        path: Path expression, optionally prefixed with "$"
+
+    Returns:
+        Function extracting the value from a parsed JSON document
+    """
+    def identity(value):
+        return value
+
+    def key_step(key, rest):
+        def extract(value):
+            if isinstance(value, dict):
+                return rest(value.get(key))
+            return None
+        return extract
+
+    def index_step(index, rest):
+        def extract(value):
+            if isinstance(value, list) and -len(value) <= index < len(value):
+                return rest(value[index])
+            return None
+        return extract
+
+    def wildcard_step(rest):
+        def extract(value):
+            if isinstance(value, list):
+                return [rest(item) for item in value]
+            return None
+        return extract
+
+    extractor = identity
+    for step in reversed(_parse(path)):
+        if step is None:
+            extractor = wildcard_step(extractor)
+        elif isinstance(step, int):
+            extractor = index_step(step, extractor)
+        else:
+            extractor = key_step(step, extractor)
+    return extractor
+
+
+def compile_paths(paths: Iterable[str]) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Compile several paths into one flattening function
+
+    Args:
+        paths: Path expressions
+
+    Returns:
+        Function mapping a document to {path: extracted value}
+    """
+    extractors = [(path, compile_path(path)) for path in dict.fromkeys(paths)]
+
+    def flatten(document):
+        return {path: extract(document) for path, extract in extractors}
+
+    return flatten
+
+
+def leaf_paths(document: Any, prefix: str = "") -> Dict[str, Any]:
+    """
+    List the paths of all scalar values in a document
+
+    Lists are described with [*] and sampled from their first element.
+
+    Args:
+        document: Parsed JSON document
+        prefix: Path of the document itself
+
+    Returns:
+        Mapping of path to the value found there
+    """
+    if isinstance(document, dict):
+        paths = {}
+        for key, value in document.items():
+            key_path = f"{prefix}.{key}" if prefix else str(key)
+            if not re.fullmatch(r"[^.\[\]\"]+", str(key)):
+                key_path = f'{prefix}["{key}"]'
+            paths.update(leaf_paths(value, key_path))
+        return paths
+    if isinstance(document, list) and document and isinstance(document[0], (dict, list)):
+        return leaf_paths(document[0], f"{prefix}[*]")
+    return {prefix: document}
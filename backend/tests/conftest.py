@@ -0,0 +1,74 @@
+"""
+Test Configuration
+Settings for running the backend tests without a deployment environment
+"""
+import os
+from typing import Dict, Any, List, Optional, Tuple
+
+import pytest
+
+
+# Required settings; the tests never connect to these services
+for name, value in {
+    "SECRET_KEY": "test-secret",
+    "NEO4J_URI": "bolt://localhost:7687",
+    "NEO4J_USER": "neo4j",
+    "NEO4J_PASSWORD": "test",
+    "POSTGRES_HOST": "localhost",
+    "POSTGRES_DB": "mdop_test",
+    "POSTGRES_USER": "mdop",
+    "POSTGRES_PASSWORD": "test",
+    "REDIS_HOST": "localhost",
+    "ELASTICSEARCH_HOST": "localhost",
+    "KAFKA_BOOTSTRAP_SERVERS": "localhost:9092",
+}.items():
+    os.environ.setdefault(name, value)
+
+
+class FakeNeo4j:
+    """
+    The subset of Neo4jClient used by the graph loader, recording every write
+
+    Node writes fail if a row's name is in poison (like a constraint or
+    type error), and the first transient_failures writes fail with a
+    TransientError.
+    """
+
+    def __init__(self):
+        self.writes: List[Tuple[str, Dict[str, Any]]] = []
+        self.stored: List[Dict[str, Any]] = []  # rows of successful node writes
+        self.poison = set()
+        self.transient_failures = 0
+
+    def execute_write(self, query: str, parameters: Optional[Dict[str, Any]] = None, database=None):
+        from neo4j.exceptions import TransientError
+
+        parameters = parameters or {}
+        self.writes.append((query, parameters))
+        if self.transient_failures:
+            self.transient_failures -= 1
+            raise TransientError("Deadlock detected")
+        rows = parameters.get("rows", [])
+        poisoned = [row["name"] for row in rows if row.get("name") in self.poison]
+        if poisoned:
+            raise RuntimeError(f"Cannot store {poisoned[0]}")
+        self.stored.extend(rows)
+        return [{"changed": len(rows)}] if "MERGE" in query else []
+
+    def execute_read(self, query: str, parameters: Optional[Dict[str, Any]] = None, database=None):
+        return []
+
+    def node_writes(self) -> List[Tuple[str, Dict[str, Any]]]:
+        return [(query, parameters) for query, parameters in self.writes if "$ids" in query]
+
+
+@pytest.fixture
+def graph(monkeypatch) -> FakeNeo4j:
+    """Fake Neo4j client in place of the global one"""
+    import app.db.neo4j_client as neo4j_client_module
+    from app.core.config import settings
+
+    fake = FakeNeo4j()
+    monkeypatch.setattr(neo4j_client_module, "neo4j_client", fake)
+    monkeypatch.setattr(settings, "GRAPH_LOAD_RETRY_BACKOFF_SECONDS", 0)
+    return fake
@@ -0,0 +1,67 @@
+"""
+CSV Connector Tests
+Chunked parsing of files spanning several chunks and fetches
+"""
+import pytest
+
+from app.services.connectors.csv_connector import CSVConnector
+
+
+ROWS = 5000
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "customers.csv"
+    lines = ["id,name,score"] + [f"{i},customer {i},{i * 0.5}" for i in range(ROWS)]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+async def fetch_all(connector: CSVConnector, batch_size: int):
+    batches = []
+    try:
+        async for batch in connector.fetch_data(full_sync=True, batch_size=batch_size):
+            batches.append(batch)
+    finally:
+        await connector.disconnect()
+    return batches
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("batch_size", [100, 1000, 10000])
+async def test_reads_every_row_of_a_file_larger_than_one_fetch(csv_file, batch_size):
+    assert csv_file.stat().st_size > batch_size
+
+    connector = CSVConnector(
+        "csv-test",
+        {"path": str(csv_file), "chunk_size": 4096, "workers": 2},
+        {"entity_type": "Customer"}
+    )
+    batches = await fetch_all(connector, batch_size)
+
+    rows = [row for batch in batches for row in batch]
+    assert len(rows) == ROWS
+    assert [row["id"] for row in rows] == list(range(ROWS))
+    assert all(len(batch) <= batch_size for batch in batches)
+
+
+@pytest.mark.asyncio
+async def test_last_batch_of_each_chunk_carries_the_chunk_end(csv_file):
+    connector = CSVConnector(
+        "csv-test",
+        {"path": str(csv_file), "chunk_size": 4096, "workers": 1},
+        {"entity_type": "Customer"}
+    )
+    offsets = []
+    try:
+        async for batch in connector.fetch_data(full_sync=True, batch_size=50):
+            watermark = connector._batch_watermark(batch)
+            if watermark is not None:
+                offsets.append(watermark["offset"])
+    finally:
+        await connector.disconnect()
+
+    assert len(offsets) > 1
+    assert offsets == sorted(offsets)
+    assert offsets[-1] == csv_file.stat().st_size
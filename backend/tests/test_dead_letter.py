@@ -0,0 +1,127 @@
+"""
+Dead-Letter Tests
+Failed records are parked during a sync and replayed later, against a fake
+Neo4j client and an in-memory dead-letter table
+"""
+from typing import Dict, Any, List
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.db.postgres_client as postgres_client
+from app.models.ontology import DeadLetterRecord
+from app.services.connectors.base_connector import BaseConnector
+from app.services.connectors.dead_letter import DeadLetterStore, STAGE_LOAD, STAGE_TRANSFORM
+
+
+class ListConnector(BaseConnector):
+    """Connector serving fixed batches of raw records"""
+
+    def __init__(self, batches: List[List[Dict[str, Any]]]):
+        super().__init__(
+            "list-test",
+            {"adaptive_batching": False, "checkpoint": False},
+            {"entity_type": "Customer", "field_mappings": {"name": "name", "city": "city"}}
+        )
+        self.batches = batches
+        self._dead_letters = DeadLetterStore("1")
+
+    async def connect(self) -> bool:
+        return True
+
+    async def disconnect(self) -> bool:
+        return True
+
+    async def test_connection(self) -> bool:
+        return True
+
+    async def detect_schema(self) -> Dict[str, Any]:
+        return {"columns": []}
+
+    async def fetch_data(self, full_sync: bool = False, batch_size: int = 1000):
+        for batch in self.batches:
+            yield batch
+
+
+@pytest.fixture
+def dead_letter_db(monkeypatch):
+    """In-memory dead-letter table in place of PostgreSQL"""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    DeadLetterRecord.__table__.create(engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    monkeypatch.setattr(postgres_client, "SessionLocal", session_factory)
+    return session_factory
+
+
+def stored_entries(session_factory) -> List[DeadLetterRecord]:
+    db = session_factory()
+    try:
+        return db.query(DeadLetterRecord).order_by(DeadLetterRecord.id).all()
+    finally:
+        db.close()
+
+
+def customers(*names: str) -> List[Dict[str, Any]]:
+    return [{"name": name, "city": "Berlin"} for name in names]
+
+
+@pytest.mark.asyncio
+async def test_poison_record_is_dead_lettered_and_the_rest_loaded(graph, dead_letter_db):
+    graph.poison = {"c3"}
+    connector = ListConnector([customers("c0", "c1", "c2", "c3"), customers("c4", "c5")])
+
+    result = await connector.sync(full_sync=True)
+
+    assert result.success
+    assert result.records_processed == 5
+    assert result.records_dead_lettered == 1
+    assert sorted(row["name"] for row in graph.stored) == ["c0", "c1", "c2", "c4", "c5"]
+    [entry] = stored_entries(dead_letter_db)
+    assert entry.stage == STAGE_LOAD
+    assert entry.status == "pending"
+    assert entry.record["properties"] == {"name": "c3", "city": "Berlin"}
+    assert "Cannot store c3" in entry.error
+
+
+@pytest.mark.asyncio
+async def test_replay_loads_fixed_records_and_keeps_failing_ones(graph, dead_letter_db):
+    graph.poison = {"c1", "c2"}
+    connector = ListConnector([customers("c0", "c1", "c2")])
+    await connector.sync(full_sync=True)
+    assert len(stored_entries(dead_letter_db)) == 2
+
+    # c1 can be stored now, c2 still fails
+    graph.poison = {"c2"}
+    result = await connector.replay_dead_letters()
+
+    assert result.records_processed == 1
+    assert result.records_failed == 1
+    assert [row["name"] for row in graph.stored] == ["c0", "c1"]
+    first, second = stored_entries(dead_letter_db)
+    assert (first.status, second.status) == ("replayed", "pending")
+    assert second.attempts == 2
+    assert "Cannot store c2" in second.error
+    assert [entry["record"]["properties"]["name"] for entry in connector._dead_letters.pending()] == ["c2"]
+
+
+@pytest.mark.asyncio
+async def test_replay_transforms_raw_records_again(graph, dead_letter_db):
+    connector = ListConnector([])
+    connector._dead_letters.add(STAGE_TRANSFORM, [{"record": {"name": "c7", "city": "Köln"}, "error": "bad mapping"}])
+
+    result = await connector.replay_dead_letters()
+
+    assert result.records_processed == 1
+    assert graph.stored == [{"name": "c7", "city": "Köln"}]
+    assert [entry.status for entry in stored_entries(dead_letter_db)] == ["replayed"]
+
+
+def test_discarded_records_are_not_replayed(dead_letter_db):
+    store = DeadLetterStore("1")
+    store.add(STAGE_LOAD, [{"record": {"type": "Customer", "properties": {"name": "c1"}}, "error": "boom"}])
+    [entry] = store.pending()
+
+    assert store.discard([entry["id"]]) == 1
+    assert store.pending() == []
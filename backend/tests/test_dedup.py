@@ -0,0 +1,147 @@
+"""
+Deduplication Tests
+Normalizers, blocking keys and duplicate detection within a batch, against
+an in-memory block index
+"""
+from typing import Dict, Any, List, Tuple
+
+import pytest
+
+from app.services.connectors.dedup import (
+    ACTION_MERGE, BlockingKey, Deduplicator, MinHasher,
+    normalize_account, normalize_email, normalize_phonetic, shingles, soundex
+)
+
+
+class MemoryBlockIndex:
+    """Block index kept in a dict instead of PostgreSQL"""
+
+    def __init__(self):
+        self.blocks: Dict[str, List[Any]] = {}
+
+    def lookup(self, block_keys: List[str]) -> Tuple[Dict[str, List[Any]], int]:
+        return {key: list(self.blocks[key]) for key in block_keys if key in self.blocks}, 0
+
+    def add(self, entries: List[Tuple[str, Any]]) -> int:
+        for block_key, entity_key in entries:
+            members = self.blocks.setdefault(block_key, [])
+            if entity_key not in members:
+                members.append(entity_key)
+        return len(entries)
+
+
+def deduplicator(entities: Dict[Any, Dict[str, Any]] = None, **kwargs) -> Deduplicator:
+    """Deduplicator of customers keyed by customer_no, with graph entities given by key"""
+    kwargs.setdefault("blocking_keys", [
+        BlockingKey(name="email", property="email", normalizer="email", exact=True),
+        BlockingKey(name="name", property="name", normalizer="phonetic"),
+    ])
+    dedup = Deduplicator("Customer", "customer_no", **kwargs)
+    dedup.index = MemoryBlockIndex()
+    entities = entities or {}
+    dedup._fetch_properties = lambda keys: {key: entities[key] for key in keys if key in entities}
+    return dedup
+
+
+def customer(number: str, **properties) -> Dict[str, Any]:
+    return {"type": "Customer", "properties": {"customer_no": number, **properties}}
+
+
+@pytest.mark.parametrize("word, code", [
+    ("Robert", "R163"), ("Rupert", "R163"), ("Ashcraft", "A261"), ("Tymczak", "T522"), ("Müller", "M460"), ("42", ""),
+])
+def test_soundex(word, code):
+    assert soundex(word) == code
+
+
+def test_normalizers():
+    assert normalize_email("  Jane.Doe+news@Example.com ") == "jane.doe@example.com"
+    assert normalize_email("not an address") is None
+    assert normalize_account("de89 3704-0044") == "DE8937040044"
+    assert normalize_phonetic("Meier, Hans") == normalize_phonetic("hans mayer") == "H520-M600"
+    assert normalize_phonetic("123") is None
+
+
+def test_blocking_key():
+    key = BlockingKey(name="email", property="email", normalizer="email")
+
+    assert key.key({"email": "Jane@Example.com"}) == "email:jane@example.com"
+    assert key.key({"email": "invalid"}) is None
+    assert key.key({}) is None
+
+
+def test_band_keys_of_similar_values_overlap():
+    minhash = MinHasher(permutations=64, bands=16)
+
+    keys = minhash.band_keys(shingles(["Acme Trading GmbH, Hauptstrasse 1"]))
+    similar = minhash.band_keys(shingles(["Acme Trading GmbH, Hauptstraße 1"]))
+    different = minhash.band_keys(shingles(["Globex Corporation, Elm Street 9"]))
+
+    assert len(keys) == 16
+    assert all(key.startswith(f"lsh{band}:") for band, key in enumerate(keys))
+    assert keys == minhash.band_keys(shingles(["acme  trading gmbh, hauptstrasse 1"]))
+    assert set(keys) & set(similar)
+    assert not set(keys) & set(different)
+    assert minhash.band_keys(set()) == []
+
+
+def test_exact_key_duplicate_within_batch():
+    dedup = deduplicator()
+    records = [
+        customer("C1", email="jane@example.com", name="Jane Doe"),
+        customer("C2", email="Jane+shop@Example.com", name="J. Doe"),
+        customer("C3", email="john@example.com", name="John Roe"),
+    ]
+
+    loaded, matches = dedup.prepare(records)
+
+    assert loaded == records
+    [match] = matches
+    assert (match.index, match.key, match.canonical, match.score, match.rule) == (1, "C2", "C1", 1.0, "email")
+    assert dedup.get_stats()["by_rule"] == {"email": 1}
+
+
+def test_duplicate_of_an_indexed_entity_in_a_later_batch():
+    entities = {"C1": {"customer_no": "C1", "email": "jane@example.com"}}
+    dedup = deduplicator(entities)
+    dedup.prepare([customer("C1", email="jane@example.com")])
+
+    _, [match] = dedup.prepare([customer("C9", email="JANE@example.com")])
+
+    assert (match.key, match.canonical) == ("C9", "C1")
+
+
+def test_similarity_duplicate_needs_the_threshold():
+    dedup = deduplicator(similarity_properties=["name", "address"], threshold=0.6)
+    records = [
+        customer("C1", name="Acme Trading GmbH", address="Hauptstrasse 1, Berlin"),
+        customer("C2", name="ACME Trading GmbH", address="Hauptstraße 1, Berlin"),
+        customer("C3", name="Acme Holding AG", address="Ringweg 7, Hamburg"),
+    ]
+
+    _, [match] = dedup.prepare(records)
+
+    assert (match.key, match.canonical, match.rule) == ("C2", "C1", "similarity")
+    assert 0.6 <= match.score < 1.0
+
+
+def test_merge_rewrites_duplicates_onto_the_canonical_entity():
+    dedup = deduplicator(action=ACTION_MERGE)
+    records = [
+        customer("C1", email="jane@example.com", name="Jane Doe"),
+        customer("C2", email="jane@example.com", name="Jane D.", phone="+49 30 123"),
+        {"type": "Order", "properties": {"order_no": "O1"}},
+    ]
+
+    loaded, [match] = dedup.prepare(records)
+
+    assert loaded[0] == records[0]
+    assert loaded[1] == customer("C1", phone="+49 30 123")
+    assert loaded[2] == records[2]
+    assert records[1]["properties"]["customer_no"] == "C2"
+
+
+@pytest.mark.parametrize("name", ["lsh0", "lsh", "lsh_name", "email:work", ""])
+def test_reserved_blocking_key_names_are_rejected(name):
+    with pytest.raises(ValueError):
+        Deduplicator("Customer", "customer_no", [BlockingKey(name=name, property="email")])
@@ -0,0 +1,137 @@
+"""
+Entity Filter Tests
+Compiling filter expressions to Cypher and summarizing EXPLAIN plans
+"""
+import pytest
+
+from app.services.query.filters import FilterError, compile_filter, index_usage
+
+
+PROPERTIES = {
+    "name": {"type": "string"},
+    "city": {"type": "string"},
+    "age": {"type": "integer"},
+    "active": {"type": "boolean"},
+}
+
+
+# EXPLAIN plan of a filtered entity search as returned by the neo4j 5
+# driver (ResultSummary.plan), with abbreviated args
+INDEX_SEEK_PLAN = {
+    "operatorType": "ProduceResults@neo4j",
+    "args": {
+        "planner-impl": "IDP",
+        "Details": "n",
+        "PipelineInfo": "Fused in Pipeline 1",
+        "planner-version": "5.13",
+        "runtime-version": "5.13",
+        "runtime": "PIPELINED",
+        "EstimatedRows": 51.0,
+        "planner": "COST",
+        "Order": "n.id ASC",
+    },
+    "identifiers": ["n"],
+    "children": [{
+        "operatorType": "Top@neo4j",
+        "args": {"Details": "n.id ASC LIMIT 51", "EstimatedRows": 51.0, "PipelineInfo": "In Pipeline 1"},
+        "identifiers": ["n"],
+        "children": [{
+            "operatorType": "Filter@neo4j",
+            "args": {"Details": "n.age >= $f1 AND n:Entity", "EstimatedRows": 3.3, "PipelineInfo": "Fused in Pipeline 0"},
+            "identifiers": ["n"],
+            "children": [{
+                "operatorType": "NodeIndexSeek@neo4j",
+                "args": {
+                    "Details": "RANGE INDEX n:Customer(city) WHERE city = $f0",
+                    "EstimatedRows": 10.0,
+                    "PipelineInfo": "Fused in Pipeline 0",
+                },
+                "identifiers": ["n"],
+                "children": [],
+            }],
+        }],
+    }],
+}
+
+LABEL_SCAN_PLAN = {
+    "operatorType": "ProduceResults@neo4j",
+    "args": {"Details": "n", "EstimatedRows": 51.0},
+    "identifiers": ["n"],
+    "children": [{
+        "operatorType": "Filter@neo4j",
+        "args": {"Details": "n.name STARTS WITH $f0 AND n:Entity", "EstimatedRows": 51.0},
+        "identifiers": ["n"],
+        "children": [{
+            "operatorType": "NodeByLabelScan@neo4j",
+            "args": {"Details": "n:Customer", "EstimatedRows": 1000.0},
+            "identifiers": ["n"],
+            "children": [],
+        }],
+    }],
+}
+
+
+def test_index_usage_reads_details_from_plan_args():
+    usage = index_usage(INDEX_SEEK_PLAN)
+
+    assert usage["indexes"] == [
+        {"operator": "NodeIndexSeek", "details": "RANGE INDEX n:Customer(city) WHERE city = $f0"}
+    ]
+    assert usage["scans"] == []
+    assert usage["full_scan"] is False
+
+
+def test_index_usage_reports_label_scans():
+    usage = index_usage(LABEL_SCAN_PLAN)
+
+    assert usage["indexes"] == []
+    assert usage["scans"] == [{"operator": "NodeByLabelScan", "details": "n:Customer"}]
+    assert usage["full_scan"] is True
+
+
+def test_index_usage_of_empty_plan():
+    assert index_usage({}) == {"indexes": [], "scans": [], "full_scan": False}
+
+
+def test_compiles_conjunction_flat_with_parameters():
+    predicate, parameters = compile_filter(
+        {"and": [{"field": "city", "op": "eq", "value": "Berlin"}, {"field": "age", "op": "gte", "value": 30}]},
+        PROPERTIES
+    )
+
+    assert predicate == "n.`city` = $f0 AND n.`age` >= $f1"
+    assert parameters == {"f0": "Berlin", "f1": 30}
+
+
+def test_merges_equality_disjunction_into_in():
+    predicate, parameters = compile_filter(
+        {"or": [{"field": "city", "value": "Berlin"}, {"field": "city", "op": "in", "value": ["Hamburg", "Köln"]}]},
+        PROPERTIES
+    )
+
+    assert predicate == "n.`city` IN $f0"
+    assert parameters == {"f0": ["Berlin", "Hamburg", "Köln"]}
+
+
+def test_parenthesizes_disjunction_inside_conjunction():
+    predicate, _ = compile_filter(
+        {"and": [
+            {"field": "active", "value": True},
+            {"or": [{"field": "city", "value": "Berlin"}, {"field": "age", "op": "lt", "value": 18}]},
+        ]},
+        PROPERTIES
+    )
+
+    assert predicate == "n.`active` = $f0 AND ((n.`city` = $f1) OR (n.`age` < $f2))"
+
+
+@pytest.mark.parametrize("data", [
+    {"field": "unknown", "value": 1},
+    {"field": "age", "value": "thirty"},
+    {"field": "active", "op": "gt", "value": True},
+    {"field": "name", "op": "between", "value": ["a"]},
+    {"and": []},
+])
+def test_rejects_filters_that_do_not_match_the_schema(data):
+    with pytest.raises(FilterError):
+        compile_filter(data, PROPERTIES)
@@ -0,0 +1,107 @@
+"""
+Graph Loader Tests
+UNWIND node writes against an in-process fake of the Neo4j client
+"""
+import pyarrow as pa
+
+from app.core.config import settings
+from app.services.connectors.bulk_import import AdminImportWriter
+from app.services.connectors.graph_loader import GraphLoader, ColumnarBatch
+from app.utils.ids import is_valid_id
+
+
+def test_source_id_is_stored_as_source_id(graph):
+    result = GraphLoader().load([{"type": "Customer", "properties": {"id": "C-1", "name": "Acme"}}])
+
+    assert result.loaded == 1
+    [(query, parameters)] = graph.node_writes()
+    assert parameters["rows"] == [{"source_id": "C-1", "name": "Acme"}]
+    assert is_valid_id(parameters["ids"][0])
+    assert "SET n.id = $ids[i]" in query
+    assert "row.id" not in query
+
+
+def test_merge_on_id_key_uses_source_id_and_sets_id_only_on_create(graph):
+    loader = GraphLoader(key_fields={"Customer": "id"})
+    loader.load([{"type": "Customer", "properties": {"id": "C-1", "name": "Acme"}}])
+
+    [(query, parameters)] = graph.node_writes()
+    assert "MERGE (n:`Customer` {`source_id`: row.`source_id`})" in query
+    assert "ON CREATE SET n:Entity, n.id = $ids[i]" in query
+    assert "id" not in parameters["rows"][0]
+    assert any("REQUIRE n.`source_id` IS UNIQUE" in query for query, _ in graph.writes)
+
+
+def test_columnar_source_id_is_stored_as_source_id(graph):
+    data = pa.RecordBatch.from_pylist([{"id": "C-1", "name": "Acme"}, {"id": "C-2", "name": "Beta"}])
+    result = GraphLoader().load(ColumnarBatch(entity_type="Customer", data=data))
+
+    assert result.loaded == 2
+    [(query, parameters)] = graph.node_writes()
+    assert "`source_id`: $columns[0][i]" in query
+    assert parameters["columns"][0] == ["C-1", "C-2"]
+    assert all(is_valid_id(value) for value in parameters["ids"])
+
+
+def test_records_with_id_and_source_id_are_rejected(graph):
+    result = GraphLoader().load([{"type": "Customer", "properties": {"id": "C-1", "source_id": "X"}}])
+
+    assert result.failed == 1
+    assert graph.node_writes() == []
+
+
+def test_import_files_keep_generated_ids(tmp_path):
+    writer = AdminImportWriter(str(tmp_path), key_fields={"Customer": "id"}, compress=False)
+    result = writer.load([{"type": "Customer", "properties": {"id": "C-1", "name": "Acme"}}])
+    manifest = writer.close()
+
+    assert result.loaded == 1
+    assert manifest.id_spaces == {"Customer": "source_id"}
+    [group] = manifest.nodes
+    header = (tmp_path / group.header).read_text().strip().split(",")
+    row = (tmp_path / group.files[0]).read_text().strip().split(",")
+    values = dict(zip(header, (value.strip('"') for value in row)))
+    assert values[":ID(Customer)"] == "C-1"
+    assert values["source_id"] == "C-1"
+    assert is_valid_id(values["id"])
+
+
+def customers(count: int):
+    return [{"type": "Customer", "properties": {"name": f"customer-{i}"}} for i in range(count)]
+
+
+def test_poison_record_is_isolated_by_bisection(graph):
+    graph.poison = {"customer-5"}
+
+    result = GraphLoader().load(customers(8), transaction_size=8)
+
+    assert result.loaded == 7
+    assert result.failed == 1
+    [error] = result.errors
+    assert error.index == 5
+    assert error.record["properties"]["name"] == "customer-5"
+    assert "Cannot store customer-5" in error.error
+    assert sorted(row["name"] for row in graph.stored) == [f"customer-{i}" for i in range(8) if i != 5]
+    # 8 -> 4 -> 2 -> 1: one failed write per level plus the good halves
+    assert len(graph.node_writes()) == 7
+
+
+def test_transient_errors_are_retried_without_bisecting(graph):
+    graph.transient_failures = 2
+    loader = GraphLoader()
+
+    result = loader.load(customers(4), transaction_size=4)
+
+    assert result.loaded == 4
+    assert loader.failed_transactions == 2
+    assert [len(parameters["rows"]) for _, parameters in graph.node_writes()] == [4, 4, 4]
+
+
+def test_persistent_transient_error_fails_the_chunk(graph):
+    graph.transient_failures = settings.GRAPH_LOAD_MAX_RETRIES + 1
+
+    result = GraphLoader().load(customers(4), transaction_size=4)
+
+    assert result.failed == 4
+    assert [error.index for error in result.errors] == [0, 1, 2, 3]
+    assert len(graph.node_writes()) == settings.GRAPH_LOAD_MAX_RETRIES + 1
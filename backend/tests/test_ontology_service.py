@@ -0,0 +1,66 @@
+"""
+Ontology Service Tests
+Entity lookups by id against a fake async Neo4j client
+"""
+from typing import Dict, Any, List
+
+import pytest
+from fastapi import HTTPException
+
+import app.services.ontology.ontology_service as ontology_module
+from app.services.ontology.ontology_service import OntologyService
+
+
+class FakeAsyncNeo4j:
+    """Answers every read with fixed rows"""
+
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self.rows = rows
+        self.reads: List[str] = []
+
+    async def execute_read(self, query: str, parameters: Dict[str, Any] = None):
+        self.reads.append(query)
+        return self.rows
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(ontology_module, "entity_label_ready", lambda: True)
+    return OntologyService(db=None)
+
+
+def use_rows(monkeypatch, rows: List[Dict[str, Any]]) -> FakeAsyncNeo4j:
+    client = FakeAsyncNeo4j(rows)
+    monkeypatch.setattr(ontology_module, "async_neo4j_client", client)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_get_entity(service, monkeypatch):
+    client = use_rows(monkeypatch, [{"n": {"id": "E1", "name": "Acme"}, "labels": ["Customer"]}])
+
+    entity = await service.get_entity("E1")
+
+    assert entity == {"id": "E1", "type": "Customer", "properties": {"id": "E1", "name": "Acme"}}
+    assert "LIMIT 2" in client.reads[0]
+
+
+@pytest.mark.asyncio
+async def test_get_missing_entity(service, monkeypatch):
+    use_rows(monkeypatch, [])
+
+    with pytest.raises(HTTPException) as error:
+        await service.get_entity("E1")
+    assert error.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_entity_with_ambiguous_id_conflicts(service, monkeypatch):
+    use_rows(monkeypatch, [
+        {"n": {"id": "E1", "name": "Acme"}, "labels": ["Customer"]},
+        {"n": {"id": "E1", "name": "Acme GmbH"}, "labels": ["Supplier"]},
+    ])
+
+    with pytest.raises(HTTPException) as error:
+        await service.get_entity("E1")
+    assert error.value.status_code == 409
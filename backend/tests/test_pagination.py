@@ -0,0 +1,121 @@
+"""
+Pagination Tests
+Continuation tokens and keyset pages of entity searches
+"""
+import base64
+import json
+from datetime import datetime, timezone
+from typing import Dict, Any, List
+
+import pytest
+from fastapi import HTTPException
+
+import app.services.ontology.ontology_service as ontology_module
+from app.services.ontology.ontology_service import OntologyService
+from app.services.query.pagination import PagePosition, encode_cursor, decode_cursor
+
+
+def tamper(token: str, **changes) -> str:
+    payload = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+    payload.update(changes)
+    return base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).rstrip(b"=").decode("ascii")
+
+
+@pytest.mark.parametrize("value", [None, "Acme", 42, datetime(2026, 1, 2, 3, 4, tzinfo=timezone.utc)])
+def test_cursor_round_trip(value):
+    position = PagePosition(entity_type="Customer", order_by="name", value=value, id="E1")
+
+    token = encode_cursor(position)
+
+    assert "=" not in token
+    assert decode_cursor(token, "Customer", "name") == position
+
+
+@pytest.mark.parametrize("entity_type, order_by", [("Supplier", "name"), ("Customer", None), ("Customer", "city")])
+def test_cursor_of_another_query_is_rejected(entity_type, order_by):
+    token = encode_cursor(PagePosition(entity_type="Customer", order_by="name", value="Acme", id="E1"))
+
+    with pytest.raises(ValueError, match="different entity type or sort order"):
+        decode_cursor(token, entity_type, order_by)
+
+
+@pytest.mark.parametrize("changes", [{"v": 2}, {"id": 7}, {"id": None}])
+def test_tampered_cursor_is_rejected(changes):
+    token = encode_cursor(PagePosition(entity_type="Customer", order_by=None, value=None, id="E1"))
+
+    with pytest.raises(ValueError, match="Malformed cursor"):
+        decode_cursor(tamper(token, **changes), "Customer", None)
+
+
+@pytest.mark.parametrize("token", ["not a cursor!", "bm90IGpzb24", base64.urlsafe_b64encode(b"[1, 2]").decode("ascii")])
+def test_garbage_cursor_is_rejected(token):
+    with pytest.raises(ValueError, match="Malformed cursor"):
+        decode_cursor(token, "Customer", None)
+
+
+class FakeAsyncNeo4j:
+    """Returns the given nodes and records every read"""
+
+    def __init__(self, nodes: List[Dict[str, Any]]):
+        self.nodes = nodes
+        self.reads: List[tuple] = []
+
+    async def execute_read(self, query: str, parameters: Dict[str, Any] = None):
+        self.reads.append((query, parameters))
+        return [{"n": node} for node in self.nodes[:parameters["limit"]]]
+
+
+@pytest.fixture
+def neo4j(monkeypatch):
+    client = FakeAsyncNeo4j([
+        {"id": "E1", "name": "Acme"},
+        {"id": "E2", "name": "Beta"},
+        {"id": "E3", "name": "Beta"},
+    ])
+    monkeypatch.setattr(ontology_module, "async_neo4j_client", client)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_page_continues_after_the_last_sort_key(neo4j):
+    service = OntologyService(db=None)
+
+    page = await service.page_entities("Customer", None, limit=2, order_by="name")
+
+    assert [item["id"] for item in page["items"]] == ["E1", "E2"]
+    assert page["has_more"]
+    assert decode_cursor(page["next_cursor"], "Customer", "name") == PagePosition("Customer", "name", "Beta", "E2")
+    query, parameters = neo4j.reads[0]
+    assert "n.`name` IS NOT NULL" in query
+    assert "ORDER BY n.`name`, n.id" in query
+    assert parameters == {"limit": 3}
+
+    await service.page_entities("Customer", None, limit=2, cursor=page["next_cursor"], order_by="name")
+
+    query, parameters = neo4j.reads[1]
+    assert "(n.`name` > $cursor_value OR (n.`name` = $cursor_value AND n.id > $cursor_id))" in query
+    assert parameters == {"limit": 3, "cursor_value": "Beta", "cursor_id": "E2"}
+
+
+@pytest.mark.asyncio
+async def test_page_by_id_continues_after_the_last_id(neo4j):
+    service = OntologyService(db=None)
+    cursor = encode_cursor(PagePosition(entity_type="Customer", order_by=None, value=None, id="E1"))
+
+    page = await service.page_entities("Customer", None, limit=5, cursor=cursor)
+
+    query, parameters = neo4j.reads[0]
+    assert "WHERE n.id > $cursor_id" in query
+    assert parameters["cursor_id"] == "E1"
+    assert not page["has_more"]
+    assert page["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_page_with_cursor_of_another_sort_order_is_rejected(neo4j):
+    cursor = encode_cursor(PagePosition(entity_type="Customer", order_by=None, value=None, id="E1"))
+
+    with pytest.raises(HTTPException) as error:
+        await OntologyService(db=None).page_entities("Customer", None, cursor=cursor, order_by="name")
+    assert error.value.status_code == 400
+    assert neo4j.reads == []
@@ -0,0 +1,156 @@
+"""
+Sync Pipeline Tests
+Committing watermarks and checkpoints of batches that finish out of order
+"""
+from types import SimpleNamespace
+from typing import Dict, Any, List, Optional
+
+import pytest
+
+import app.services.connectors.pipeline as pipeline_module
+from app.services.connectors.pipeline import _BatchItem, _CommitTracker
+
+
+class StubConnector:
+    """The connector hooks the commit tracker calls"""
+
+    def __init__(self, deferred: bool = False, checkpoints: bool = True, store_ok: bool = True, **config):
+        self.config = config
+        self.deferred = deferred
+        self.checkpoints = checkpoints
+        self.store_ok = store_ok
+        self.stored: List[Dict[str, Any]] = []
+        self.checkpoints_saved: List[Dict[str, Any]] = []
+
+    def _defer_watermark(self, full_sync: bool) -> bool:
+        return self.deferred
+
+    def _checkpoints_enabled(self) -> bool:
+        return self.checkpoints
+
+    def _merge_watermark(self, current: Optional[Dict[str, Any]], position: Dict[str, Any]) -> Dict[str, Any]:
+        return position
+
+    def _merge_checkpoint(self, current: Optional[Dict[str, Any]], position: Dict[str, Any]) -> Dict[str, Any]:
+        return position
+
+    def _store_watermark(self, watermark: Dict[str, Any]) -> bool:
+        self.stored.append(watermark)
+        return self.store_ok
+
+    def _save_checkpoint(self, checkpoint: Optional[Dict[str, Any]]) -> bool:
+        self.checkpoints_saved.append(checkpoint)
+        return True
+
+
+def batch(seq: int, loaded: int = 10) -> _BatchItem:
+    position = {"offset": (seq + 1) * loaded}
+    return _BatchItem(seq=seq, records=[], position=position, checkpoint=position, loaded=loaded)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(pipeline_module, "time", SimpleNamespace(monotonic=lambda: now.value))
+    return now
+
+
+@pytest.mark.asyncio
+async def test_commits_only_the_contiguous_prefix():
+    connector = StubConnector()
+    tracker = _CommitTracker(connector, full_sync=False)
+
+    await tracker.complete(batch(2), True)
+    await tracker.complete(batch(1), True)
+    assert tracker.watermark is None
+    assert connector.stored == []
+
+    await tracker.complete(batch(0), True)
+    assert tracker.watermark == {"offset": 30}
+    assert connector.stored == [{"offset": 10}, {"offset": 20}, {"offset": 30}]
+    assert tracker.batches_committed == 3
+    assert tracker.records_committed == 30
+    assert not tracker.blocked
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_blocks_later_commits():
+    connector = StubConnector()
+    tracker = _CommitTracker(connector, full_sync=False)
+
+    await tracker.complete(batch(2), True)
+    await tracker.complete(batch(0), True)
+    await tracker.complete(batch(1), False)
+    await tracker.complete(batch(3), True)
+
+    assert tracker.blocked
+    assert tracker.watermark == {"offset": 10}
+    assert connector.stored == [{"offset": 10}]
+    assert tracker.batches_committed == 1
+
+
+@pytest.mark.asyncio
+async def test_unsaved_watermark_blocks_later_commits():
+    connector = StubConnector(store_ok=False)
+    tracker = _CommitTracker(connector, full_sync=False)
+
+    await tracker.complete(batch(0), True)
+    await tracker.complete(batch(1), True)
+
+    assert tracker.blocked
+    assert connector.stored == [{"offset": 10}]
+
+
+@pytest.mark.asyncio
+async def test_deferred_watermark_is_not_stored_per_batch():
+    connector = StubConnector(deferred=True)
+    tracker = _CommitTracker(connector, full_sync=False)
+
+    await tracker.complete(batch(1), True)
+    await tracker.complete(batch(0), True)
+
+    assert tracker.watermark == {"offset": 20}
+    assert connector.stored == []
+
+
+@pytest.mark.asyncio
+async def test_checkpoints_are_saved_at_most_once_per_interval(clock):
+    connector = StubConnector(deferred=True, checkpoint_interval_seconds=60)
+    tracker = _CommitTracker(connector, full_sync=True)
+
+    await tracker.complete(batch(0), True)
+    clock.value += 10
+    await tracker.complete(batch(1), True)
+    clock.value += 10
+    await tracker.complete(batch(2), True)
+    assert [saved["position"] for saved in connector.checkpoints_saved] == [{"offset": 10}]
+
+    clock.value += 60
+    await tracker.complete(batch(3), True)
+    assert [saved["position"] for saved in connector.checkpoints_saved] == [{"offset": 10}, {"offset": 40}]
+    assert connector.checkpoints_saved[-1]["records_processed"] == 40
+    assert connector.checkpoints_saved[-1]["batches"] == 4
+
+
+@pytest.mark.asyncio
+async def test_checkpoints_are_not_saved_for_incremental_syncs(clock):
+    connector = StubConnector(checkpoint_interval_seconds=0)
+    tracker = _CommitTracker(connector, full_sync=False)
+
+    await tracker.complete(batch(0), True)
+
+    assert connector.checkpoints_saved == []
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_resumes_counters():
+    connector = StubConnector(deferred=True, checkpoint_interval_seconds=0)
+    resume = {"position": {"offset": 50}, "records_processed": 50, "batches": 5, "started_at": "2026-01-01T00:00:00+00:00"}
+    tracker = _CommitTracker(connector, full_sync=True, resume=resume)
+
+    await tracker.complete(batch(0), True)
+
+    saved = connector.checkpoints_saved[-1]
+    assert saved["records_processed"] == 60
+    assert saved["batches"] == 6
+    assert saved["started_at"] == "2026-01-01T00:00:00+00:00"
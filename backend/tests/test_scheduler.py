@@ -0,0 +1,52 @@
+"""
+Scheduler Tests
+Parsing connector schedules and queueing connectors whose schedule is due
+"""
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.connectors.scheduler import SyncScheduler
+from app.utils.cron import Schedule
+
+
+NOW = datetime(2026, 3, 2, 12, 0, tzinfo=timezone.utc)
+
+
+def test_cron_expression_next_run():
+    schedule = Schedule("30 2 * * 1")
+
+    assert schedule.next_after(NOW) == datetime(2026, 3, 9, 2, 30, tzinfo=timezone.utc)
+
+
+def test_leap_day_schedule_fires():
+    assert Schedule("0 0 29 2 *").next_after(NOW) == datetime(2028, 2, 29, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("expression", ["0 0 31 2 *", "0 0 30 2 *", "0 0 31 4,6 *"])
+def test_schedules_that_never_fire_are_rejected(expression):
+    with pytest.raises(ValueError, match="never fires"):
+        Schedule(expression)
+
+
+@pytest.mark.asyncio
+async def test_schedule_that_never_fires_does_not_block_other_connectors(monkeypatch):
+    scheduler = SyncScheduler()
+    queued = []
+
+    async def enqueue(connector, full_sync, priority):
+        queued.append(connector.id)
+
+    monkeypatch.setattr(scheduler, "_enqueue", enqueue)
+    connectors = [
+        SimpleNamespace(id=1, schedule="0 0 31 2 *", last_sync_at=None),
+        SimpleNamespace(id=2, schedule="@every 1m", last_sync_at=datetime(2026, 3, 2, 11, 0)),
+    ]
+
+    await scheduler._enqueue_due(connectors, NOW)
+    await scheduler._enqueue_due(connectors, NOW)
+
+    assert queued == [2]
+    assert 1 not in scheduler._schedules
+    assert scheduler._next_run[2] == datetime(2026, 3, 2, 12, 1, tzinfo=timezone.utc)